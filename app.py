@@ -1,56 +1,92 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
-import csv
+import json
 from datetime import datetime
-import os
+
+from config import file_name
+from modules.history import HistoryIndex, public_row
 
 app = Flask(__name__)
 CORS(app)
 
-PATH = 'all excels/'
+MAX_PAGE_SIZE = 1000
+history_index = HistoryIndex(file_name)
+
 ##> ------ Karthik Sarode : karthik.sarode23@gmail.com - UI for excel files ------
 @app.route('/')
 def home():
     """Displays the home page of the application."""
     return render_template('index.html')
 
+
+def get_query_filters() -> dict:
+    """Reads sort, order and filter query parameters shared by the applied jobs endpoints."""
+    return {
+        'sort': request.args.get('sort', 'row'),
+        'order': request.args.get('order', 'asc'),
+        'cursor': request.args.get('cursor') or None,
+        'company': request.args.get('company') or None,
+        'work_style': request.args.get('work_style') or None,
+        'date_from': request.args.get('date_from') or None,
+        'date_to': request.args.get('date_to') or None,
+    }
+
+
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Retrieves a page of applied jobs from the application store.
+
+    Query parameters:
+    - `limit`: Page size (default 100, max 1000).
+    - `cursor`: `next_cursor` from the previous page.
+    - `sort`: One of row, date_applied, date_posted, company, title, external_job_link. `order`: asc or desc.
+    - `company`, `work_style`, `date_from`, `date_to` (YYYY-MM-DD): Optional filters.
     
-    Returns a JSON response containing a list of jobs, each with details such as 
-    Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
+    Returns a JSON response `{"jobs": [...], "next_cursor": str | null, "total": int}`, `total` counting all jobs matching
+    the filters, each job with details such as Job ID, Title, Company, Work Style, HR Name, HR Link, Job Link,
+    External Job link, and Date Applied.
     
-    If the CSV file is not found, returns a 404 error with a relevant message.
+    If a query parameter is invalid, returns a 400 error.
     If any other exception occurs, returns a 500 error with the exception message.
     '''
 
     try:
-        jobs = []
-        with open(PATH + 'all_applied_applications_history.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
-        return jsonify(jobs)
-    except FileNotFoundError:
-        return jsonify({"error": "No applications history found"}), 404
+        limit = min(max(int(request.args.get('limit', 100)), 1), MAX_PAGE_SIZE)
+        jobs, next_cursor, total = history_index.query(limit, **get_query_filters())
+        return jsonify({"jobs": jobs, "next_cursor": next_cursor, "total": total})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+
+@app.route('/applied-jobs.ndjson', methods=['GET'])
+def stream_applied_jobs():
+    '''
+    Streams all matching applied jobs as newline delimited JSON, one job per line.
+    Accepts the same `sort`, `order`, `cursor` and filter parameters as `/applied-jobs`.
+    '''
+    try:
+        rows = history_index.iter_rows(**get_query_filters())
+        first = next(rows, None)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def generate():
+        if first is None: return
+        yield json.dumps(public_row(first)) + "\n"
+        for row in rows:
+            yield json.dumps(public_row(row)) + "\n"
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history.
+    The change is saved in the application store, and appended to the CSV export's edits
+    journal instead of rewriting the file, it's folded into the CSV periodically.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -62,31 +98,8 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csvPath = PATH + 'all_applied_applications_history.csv'
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-        
-        if not found:
+        if not history_index.update(job_id, 'Date Applied', datetime.now().strftime('%Y-%m-%d %H:%M:%S')):
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
-
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
-        
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
         print(f"Error updating applied date: {str(e)}")  # Debug log
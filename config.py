@@ -171,6 +171,8 @@ pause_after_filters = True
 about_company_bad_words = ["Crossover"]
 about_company_good_words = []
 bad_words = ["No C2C", "No Corp2Corp", ".NET", "Embedded Programming", "PHP", "Ruby", "CNC", "COBOL", "Mainframe"]
+title_bad_words = []          # Jobs whose title contains any of these are skipped without opening them
+match_whole_words = False     # True to match above words only as whole words ("PHP" won't match "PHPUnit")
 
 current_experience = int(os.getenv("CURRENT_EXPERIENCE", "8"))
 security_clearance = False
@@ -183,6 +185,8 @@ did_masters = False
 close_tabs = False
 follow_companies = False
 run_non_stop = False
+scheduler_min_wait = 60       # Seconds before re-searching a term that found no new jobs, doubles on each empty cycle
+scheduler_max_wait = 1800     # Max seconds between searches of a term
 alternate_sortby = True
 cycle_date_posted = True
 stop_date_cycle_at_24hr = True
@@ -192,9 +196,36 @@ generated_resume_path = "all resumes/"
 file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
 logs_folder_path = "logs/"
+log_max_size_mb = 10        # log.txt is rotated to log.1.txt, log.2.txt... past this size
+log_backup_count = 3
+chromedriver_cache_path = "~/.cache/auto_job_applier/chromedriver/"     # Patched drivers for stealth mode, one per Chrome version
+
+# Application store (SQLite). CSV files above are kept as an export format
+database_file = "all excels/applications.db"
+store_batch_size = 5                        # Failed jobs written per transaction, applied jobs are always written right away
+export_csv_history = True
+
+# AI response cache (SQLite), avoids asking the LLM the same thing twice
+ai_cache_file = "all excels/ai_cache.db"
+ai_answer_cache_size = 5000         # Max cached answers, least recently used ones are evicted
+ai_answer_cache_ttl_days = 30       # Cached answers older than this are asked again, 0 to keep forever
+ai_answer_cache_job_context = False # True to cache answers per job description instead of per question (textarea answers always are)
+ai_skills_cache_size = 20000       # Max cached skill extractions, one per distinct job description
+ai_skills_cache_only = False        # True to only use cached skills and never call the LLM for them (offline analysis)
+
+# AI requests
+ai_request_timeout = 60     # Seconds to wait for an AI response before retrying
+ai_max_retries = 3          # Retries on rate limits, server errors and timeouts, with exponential backoff
+ai_circuit_threshold = 5    # Stop calling AI after this many failed requests in a row, 0 to never stop
+ai_circuit_reset = 300      # Seconds to wait before calling AI again after it stopped
+ai_model_catalog_ttl_hours = 24  # Hours to trust the stored models list of your AI endpoint, 0 to fetch it on every start
+ai_batch_questions = True   # Answer all questions of an Easy Apply page in one AI call instead of one call per question
 
 # Behavior
 click_gap = 1
+adaptive_pacing = True         # Wait for the page to settle after clicks instead of fixed random sleeps
+pacing_jitter_floor_ms = 300   # Minimum random delay added after the page settles
+pacing_timeout = 5             # Max seconds to wait for the page to settle
 run_in_background = False
 disable_extensions = False
 safe_mode = False
@@ -207,4 +238,5 @@ showAiErrorAlerts = False
 pause_before_submit = True
 pause_at_failed_question = True
 overwrite_previous_answers = False
+use_answer_memory = True       # Answer questions like in previously submitted applications first, see `modules/answer_memory.py`
 
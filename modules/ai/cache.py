@@ -0,0 +1,193 @@
+'''
+Persistent AI Response Cache for LinkedIn Auto Job Applier
+
+SQLite backed key-value cache for AI responses, so the same question or job description isn't sent to the LLM twice.
+* Each cache is a table in `ai_cache_file`, values are stored as JSON
+* Entries expire after `ttl` seconds (0 = never) and the least recently used ones are evicted past `max_entries`
+* Hit and miss counts are kept per cache for the current run, see `report()`
+* `answer_cache` holds answers to form questions, `skills_cache` holds skills extracted from job descriptions
+'''
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+
+from time import time
+
+from config import (
+    ai_cache_file, ai_answer_cache_size, ai_answer_cache_ttl_days, ai_answer_cache_job_context,
+    ai_skills_cache_size, ai_skills_cache_only, ai_provider, llm_model, user_information_all
+)
+from modules.helpers import normalize_text
+from modules.ai.prompts import extract_skills_prompt
+
+
+_connection: sqlite3.Connection | None = None
+_lock = threading.RLock()
+
+
+def get_connection() -> sqlite3.Connection:
+    '''
+    Function to get the shared connection to `ai_cache_file`, opened on first use
+    '''
+    global _connection
+    with _lock:
+        if _connection is None:
+            folder = os.path.dirname(ai_cache_file)
+            if folder: os.makedirs(folder, exist_ok=True)
+            _connection = sqlite3.connect(ai_cache_file, check_same_thread=False)
+            _connection.execute("PRAGMA journal_mode=WAL")
+            _connection.execute("PRAGMA synchronous=NORMAL")
+        return _connection
+
+
+def close_cache() -> None:
+    '''
+    Function to close the cache database, call once at shutdown
+    '''
+    global _connection
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+def content_hash(*parts: str | None) -> str:
+    '''
+    Function to get a stable hash of `parts`, used to build cache keys from long texts
+    '''
+    sha = hashlib.sha256()
+    for part in parts:
+        sha.update((part or "").encode("utf-8"))
+        sha.update(b"\x00")
+    return sha.hexdigest()
+
+
+class PersistentCache:
+    '''
+    One named cache (table) in `ai_cache_file`
+    '''
+    def __init__(self, name: str, max_entries: int = 10000, ttl: float = 0) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._count: int | None = None
+
+
+    def _table(self) -> sqlite3.Connection:
+        connection = get_connection()
+        if self._count is None:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS cache_{self.name} (key TEXT PRIMARY KEY, value TEXT, created REAL, accessed REAL, hits INTEGER DEFAULT 0)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS cache_{self.name}_accessed ON cache_{self.name} (accessed)")
+            self._count = connection.execute(f"SELECT COUNT(*) FROM cache_{self.name}").fetchone()[0]
+        return connection
+
+
+    def get(self, key: str):
+        '''
+        Returns the cached value for `key`, or `None` if missing or expired
+        '''
+        now = time()
+        with _lock:
+            connection = self._table()
+            row = connection.execute(f"SELECT value, created FROM cache_{self.name} WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                connection.execute(f"DELETE FROM cache_{self.name} WHERE key = ?", (key,))
+                connection.commit()
+                self._count -= 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute(f"UPDATE cache_{self.name} SET accessed = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            connection.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+
+    def set(self, key: str, value) -> None:
+        '''
+        Stores `value` (JSON serializable) for `key`, evicting least recently used entries past `max_entries`
+        '''
+        now = time()
+        with _lock:
+            connection = self._table()
+            exists = connection.execute(f"SELECT 1 FROM cache_{self.name} WHERE key = ?", (key,)).fetchone()
+            connection.execute(f"INSERT OR REPLACE INTO cache_{self.name} (key, value, created, accessed) VALUES (?, ?, ?, ?)", (key, json.dumps(value), now, now))
+            if not exists: self._count += 1
+            if self.max_entries and self._count > self.max_entries:
+                overflow = self._count - self.max_entries
+                connection.execute(f"DELETE FROM cache_{self.name} WHERE key IN (SELECT key FROM cache_{self.name} ORDER BY accessed LIMIT ?)", (overflow,))
+                self._count -= overflow
+            connection.commit()
+
+
+    def __len__(self) -> int:
+        with _lock:
+            self._table()
+            return self._count
+
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+    def report(self) -> str:
+        return f'AI {self.name} cache: {self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), {len(self)} entries stored.'
+
+
+answer_cache = PersistentCache("answers", ai_answer_cache_size, ai_answer_cache_ttl_days * 24 * 60 * 60)
+'''
+Cache of AI answers to application form questions
+'''
+
+
+def answer_cache_key(question: str, question_type: str, job_description: str | None = None) -> str | None:
+    '''
+    Function to build the `answer_cache` key of a question.
+    * Same question with different punctuation or case gives the same key
+    * Changing AI provider, model or `user_information_all` invalidates cached answers
+    * Includes the job description if `ai_answer_cache_job_context = True`, and always for textarea questions
+      ("Why do you want to work here?" answers are specific to a job)
+    * Returns `None`, don't cache, for textarea questions of jobs without a description
+    '''
+    has_description = bool(job_description) and job_description != "Unknown"
+    if question_type == "textarea" and not has_description: return None
+    key = f"{question_type}:{normalize_text(question)}:{content_hash(ai_provider, llm_model, user_information_all)[:16]}"
+    if (ai_answer_cache_job_context or question_type == "textarea") and has_description:
+        key += ":" + content_hash(normalize_text(job_description))[:16]
+    return key
+
+
+skills_cache = PersistentCache("skills", ai_skills_cache_size)
+'''
+Cache of skills extracted from job descriptions, keyed by a hash of the normalized description
+'''
+
+
+def skills_cache_key(job_description: str) -> str:
+    '''
+    Function to build the `skills_cache` key of a job description.
+    * Reposts and the same job found under other search terms give the same key, whitespace and case don't matter
+    * Changing AI provider, model or `extract_skills_prompt` invalidates cached skills
+    '''
+    return content_hash(normalize_text(job_description), ai_provider, llm_model, extract_skills_prompt)
+
+
+def get_cached_skills(job_description: str, extract_skills) -> dict | list | None:
+    '''
+    Function to get skills of `job_description` from `skills_cache`, calling `extract_skills(job_description)` on a miss.
+    * Returns `None` on a miss if `ai_skills_cache_only = True` or `extract_skills` is `None`, nothing is called then
+    '''
+    key = skills_cache_key(job_description)
+    skills = skills_cache.get(key)
+    if skills is not None or ai_skills_cache_only or extract_skills is None: return skills
+    skills = extract_skills(job_description)
+    if skills: skills_cache.set(key, skills)
+    return skills
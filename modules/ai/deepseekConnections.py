@@ -1,13 +1,14 @@
 ##> ------ Yang Li : MARKYangL - Feature ------
-from config import llm_api_url, llm_api_key, llm_model, stream_output, showAiErrorAlerts
+from config import use_AI, llm_api_url, llm_api_key, llm_model, stream_output, showAiErrorAlerts, ai_request_timeout
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai.transport import get_http_client, call_with_retries
 from modules.ai.prompts import *
 
 from pyautogui import confirm
 from openai import OpenAI
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from typing import Iterator, Literal
+from typing import Iterator
 
 def deepseek_create_client() -> OpenAI | None:
     '''
@@ -27,7 +28,7 @@ def deepseek_create_client() -> OpenAI | None:
             base_url = base_url[:-1]
         
         # Create client with DeepSeek endpoint
-        client = OpenAI(base_url=base_url, api_key=llm_api_key)
+        client = OpenAI(base_url=base_url, api_key=llm_api_key, http_client=get_http_client(), max_retries=0, timeout=ai_request_timeout)
         
         print_lg("---- SUCCESSFULLY CREATED DEEPSEEK CLIENT! ----")
         print_lg(f"Using API URL: {base_url}")
@@ -73,8 +74,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
         "model": llm_model, 
    
         "messages": messages, 
-        "stream": stream,
-        "timeout": 30  
+        "stream": stream
     }
     
     # Add temperature if supported
@@ -90,7 +90,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
         print_lg(f"Calling DeepSeek API for completion...")
         print_lg(f"Using model: {llm_model}")
         print_lg(f"Message count: {len(messages)}")
-        completion = client.chat.completions.create(**params)
+        completion = call_with_retries("deepseek", llm_model, client.chat.completions.create, **params)
     ##<
         result = ""
         
@@ -139,97 +139,3 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
             print_lg("You've exceeded the rate limit. Please wait before making more requests.")
             
         raise ValueError(error_message)
-
-def deepseek_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output) -> dict | ValueError:
-    '''
-    Function to extract skills from job description using DeepSeek API.
-    * Takes in `client` of type `OpenAI` - The DeepSeek client
-    * Takes in `job_description` of type `str` - The job description text
-    * Takes in `stream` of type `bool` to indicate if it's a streaming call
-    * Returns a `dict` object representing JSON response
-    '''
-    try:
-        print_lg("Extracting skills from job description using DeepSeek...")
-        
-        # Using optimized DeepSeek prompt
-        prompt = deepseek_extract_skills_prompt.format(job_description)
-        messages = [{"role": "user", "content": prompt}]
-        
-        # DeepSeek API supports json_object response format
-        custom_response_format = {"type": "json_object"}
-        
-        # Call DeepSeek completion
-        result = deepseek_completion(
-            client=client,
-            messages=messages,
-            response_format=custom_response_format,
-            stream=stream
-        )
-        
-        # Ensure the result is a dictionary
-        if isinstance(result, str):
-            result = convert_to_json(result)
-            
-        return result
-    except Exception as e:
-        critical_error_log("Error occurred while extracting skills with DeepSeek!", e)
-        return {"error": str(e)}
-
-def deepseek_answer_question(
-    client: OpenAI, 
-    question: str, options: list[str] | None = None, 
-    question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text', 
-    job_description: str = None, about_company: str = None, user_information_all: str = None,
-    stream: bool = stream_output
-) -> dict | ValueError:
-    '''
-    Function to answer a question using DeepSeek AI.
-    * Takes in `client` of type `OpenAI` - The DeepSeek client
-    * Takes in `question` of type `str` - The question to answer
-    * Takes in `options` of type `list[str] | None` - Options for select questions
-    * Takes in `question_type` - Type of question (text, textarea, single_select, multiple_select)
-    * Takes in optional context parameters - job_description, about_company, user_information_all
-    * Takes in `stream` of type `bool` - Whether to stream the output
-    * Returns the AI's answer
-    '''
-    try:
-        print_lg(f"Answering question using DeepSeek AI: {question}")
-        
-        # Prepare user information
-        user_info = user_information_all or ""
-        
-        # Prepare prompt based on question type
-        prompt = ai_answer_prompt.format(user_info, question)
-        
-        # Add options to the prompt if available
-        if options and (question_type in ['single_select', 'multiple_select']):
-            options_str = "OPTIONS:\n" + "\n".join([f"- {option}" for option in options])
-            prompt += f"\n\n{options_str}"
-            
-            if question_type == 'single_select':
-                prompt += "\n\nPlease select exactly ONE option from the list above."
-            else:
-                prompt += "\n\nYou may select MULTIPLE options from the list above if appropriate."
-        
-        # Add job details for context if available
-        if job_description:
-            prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
-        
-        if about_company:
-            prompt += f"\n\nABOUT COMPANY:\n{about_company}"
-        
-        messages = [{"role": "user", "content": prompt}]
-        
-        # Call DeepSeek completion
-        result = deepseek_completion(
-            client=client,
-            messages=messages,
-            temperature=0.1,  # Slight randomness for more natural responses
-            stream=stream
-        )
-        
-        return result
-    except Exception as e:
-        critical_error_log("Error occurred while answering question with DeepSeek!", e)
-        return {"error": str(e)}
-##< 
\ No newline at end of file
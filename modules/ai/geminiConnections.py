@@ -1,9 +1,10 @@
 import google.generativeai as genai
-from config import llm_model, llm_api_key, showAiErrorAlerts
+from config import llm_model, llm_api_key, showAiErrorAlerts, ai_request_timeout
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai.transport import call_with_retries
+from modules.ai.model_catalog import is_model_available
 from modules.ai.prompts import *
 from pyautogui import confirm
-from typing import Literal
 
 def gemini_get_models_list():
     """
@@ -11,10 +12,7 @@ def gemini_get_models_list():
     """
     try:
         print_lg("Getting Gemini models list...")
-        models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
-        print_lg("Available models:")
-        for model in models:
-            print_lg(f"- {model}")
+        models = [m.name for m in call_with_retries("gemini", "models", lambda: list(genai.list_models())) if 'generateContent' in m.supported_generation_methods]
         return models
     except Exception as e:
         critical_error_log("Error occurred while getting Gemini models list!", e)
@@ -32,10 +30,13 @@ def gemini_create_client():
         
         genai.configure(api_key=llm_api_key)
         
-        models = gemini_get_models_list()
-        if "error" in models:
-            raise ValueError(models[1])
-        if not any(llm_model in m for m in models):
+        def fetch_models() -> list[str]:
+            models = gemini_get_models_list()
+            if "error" in models:
+                raise ValueError(models[1])
+            return models
+
+        if not is_model_available("gemini", llm_model, fetch_models, lambda model, models: any(model in m for m in models)):
              raise ValueError(f"Model `{llm_model}` is not found or not available for content generation!")
 
         model = genai.GenerativeModel(llm_model)
@@ -89,7 +90,7 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
         ]
 
         print_lg(f"Calling Gemini API for completion...")
-        response = model.generate_content(prompt, safety_settings=safety_settings)
+        response = call_with_retries("gemini", llm_model, model.generate_content, prompt, safety_settings=safety_settings, request_options={"timeout": ai_request_timeout})
         
         # The response might be blocked. Check for that.
         if not response.parts:
@@ -110,51 +111,3 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
     except Exception as e:
         critical_error_log(f"Error occurred while getting Gemini completion!", e)
         return {"error": str(e)}
-
-def gemini_extract_skills(model, job_description: str) -> list[str] | None:
-    """
-    Extracts skills from a job description using the Gemini model.
-    * Takes in `model` - The Gemini model object.
-    * Takes in `job_description` of type `str`.
-    * Returns a `dict` object representing JSON response.
-    """
-    try:
-        print_lg("Extracting skills from job description using Gemini...")
-        prompt = extract_skills_prompt.format(job_description) + "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
-        return gemini_completion(model, prompt, is_json=True)
-    except Exception as e:
-        critical_error_log("Error occurred while extracting skills with Gemini!", e)
-        return {"error": str(e)}
-
-def gemini_answer_question(
-    model,
-    question: str, options: list[str] | None = None, 
-    question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text', 
-    job_description: str = None, about_company: str = None, user_information_all: str = None
-) -> str:
-    """
-    Answers a question using the Gemini API.
-    """
-    try:
-        print_lg(f"Answering question using Gemini AI: {question}")
-        user_info = user_information_all or ""
-        prompt = ai_answer_prompt.format(user_info, question)
-
-        if options and (question_type in ['single_select', 'multiple_select']):
-            options_str = "OPTIONS:\n" + "\n".join([f"- {option}" for option in options])
-            prompt += f"\n\n{options_str}"
-            if question_type == 'single_select':
-                prompt += "\n\nPlease select exactly ONE option from the list above."
-            else:
-                prompt += "\n\nYou may select MULTIPLE options from the list above if appropriate."
-        
-        if job_description:
-            prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
-        
-        if about_company:
-            prompt += f"\n\nABOUT COMPANY:\n{about_company}"
-
-        return gemini_completion(model, prompt)
-    except Exception as e:
-        critical_error_log("Error occurred while answering question with Gemini!", e)
-        return {"error": str(e)}
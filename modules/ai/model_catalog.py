@@ -0,0 +1,91 @@
+'''
+AI Model Catalog for LinkedIn Auto Job Applier
+
+Remembers which models an AI endpoint offers, so clients aren't validated with a model-list request on every start.
+* Model lists are stored in `model_catalog` (a table of `ai_cache_file`) per provider, API URL and key, for `ai_model_catalog_ttl_hours`
+* If the configured model is in the stored list, the client starts without a request and the list is refreshed in background
+* Otherwise (first start, expired or model missing) the list is fetched right away and stored
+'''
+
+import threading
+
+from typing import Callable
+
+from config import llm_api_url, llm_api_key, ai_model_catalog_ttl_hours
+from modules.helpers import print_lg
+from modules.ai.cache import PersistentCache, content_hash
+
+
+model_catalog = PersistentCache("models", 100, ai_model_catalog_ttl_hours * 60 * 60)
+'''
+Cache of model names offered by each AI endpoint
+'''
+
+_refreshing: set[str] = set()
+_refresh_threads: list[threading.Thread] = []
+_refresh_lock = threading.Lock()
+
+
+def catalog_key(provider: str) -> str:
+    '''
+    Function to build the `model_catalog` key of `provider` at the configured API URL and key
+    '''
+    return f"{provider}:{content_hash(llm_api_url, llm_api_key)[:16]}"
+
+
+def exact_match(model: str, models: list[str]) -> bool:
+    return model in models
+
+
+def fetch_models(key: str, fetch: Callable[[], list[str]]) -> list[str]:
+    '''
+    Function to fetch model names with `fetch()` and store them under `key`
+    '''
+    models = fetch()
+    if ai_model_catalog_ttl_hours: model_catalog.set(key, models)
+    return models
+
+
+def refresh_in_background(key: str, fetch: Callable[[], list[str]]) -> None:
+    '''
+    Function to re-fetch the model list of `key` in a daemon thread, at most once per run
+    '''
+    with _refresh_lock:
+        if key in _refreshing: return
+        _refreshing.add(key)
+
+    def refresh() -> None:
+        try:
+            fetch_models(key, fetch)
+        except Exception as e:
+            print_lg("Couldn't refresh AI models list, will retry next run.", e)
+
+    thread = threading.Thread(target=refresh, name="ModelCatalogRefresh", daemon=True)
+    with _refresh_lock: _refresh_threads.append(thread)
+    thread.start()
+
+
+def wait_for_refresh(timeout: float | None = None) -> None:
+    '''
+    Function to wait for background model list refreshes to finish, call it before closing the client they use
+    '''
+    with _refresh_lock: threads = list(_refresh_threads)
+    for thread in threads: thread.join(timeout)
+
+
+def is_model_available(provider: str, model: str, fetch: Callable[[], list[str]], match: Callable[[str, list[str]], bool] = exact_match) -> bool:
+    '''
+    Function to check if `model` is offered by `provider`.
+    * Takes in `fetch`, a function returning model names offered by the endpoint, only called if the catalog can't answer
+    * Takes in `match(model, models)` to compare names, exact by default
+    * Raises whatever `fetch()` raises
+    '''
+    key = catalog_key(provider)
+    models = model_catalog.get(key) if ai_model_catalog_ttl_hours else None
+    if models is not None and match(model, models):
+        print_lg(f"Model `{model}` was validated recently, skipping models list request.")
+        refresh_in_background(key, fetch)
+        return True
+    models = fetch_models(key, fetch)
+    print_lg(f"Found {len(models)} available models.")
+    return match(model, models)
@@ -14,14 +14,16 @@ version:    24.12.29.12.30
 
 
 from config import (
-    llm_api_url, llm_api_key, llm_model, llm_spec, stream_output,
+    use_AI, llm_api_url, llm_api_key, llm_model, llm_spec, stream_output,
     showAiErrorAlerts, ethnicity, gender, disability_status, veteran_status,
     years_of_experience, require_visa, us_citizenship, confidence_level,
     linkedin_headline, linkedin_summary, cover_letter, user_information_all,
-    security_clearance, did_masters
+    security_clearance, did_masters, ai_request_timeout
 )
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json
+from modules.ai.transport import get_http_client, call_with_retries
+from modules.ai.model_catalog import is_model_available
 from modules.ai.prompts import *
 
 from pyautogui import confirm
@@ -79,14 +81,18 @@ def ai_create_openai_client() -> OpenAI:
         if not use_AI:
             raise ValueError("AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder.")
         
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
-
-        models = ai_get_models_list(client)
-        if "error" in models:
-            raise ValueError(models[1])
-        if len(models) == 0:
-            raise ValueError("No models are available!")
-        if llm_model not in [model.id for model in models]:
+        # Retries are done by `call_with_retries()`, so the SDK's own are disabled
+        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key, http_client=get_http_client(), max_retries=0, timeout=ai_request_timeout)
+
+        def fetch_models() -> list[str]:
+            models = ai_get_models_list(client)
+            if "error" in models:
+                raise ValueError(models[1])
+            if len(models) == 0:
+                raise ValueError("No models are available!")
+            return [model.id for model in models]
+
+        if not is_model_available("openai", llm_model, fetch_models):
             raise ValueError(f"Model `{llm_model}` is not found!")
         
         print_lg("---- SUCCESSFULLY CREATED OPENAI CLIENT! ----")
@@ -106,11 +112,12 @@ def ai_close_openai_client(client: OpenAI) -> None:
     Function to close an OpenAI client.
     * Takes in `client` of type `OpenAI`
     * Returns no value
+    * The shared pooled HTTP client other providers use isn't closed, `transport.close_http_client()` does that
     """
     try:
         if client:
             print_lg("Closing OpenAI client...")
-            client.close()
+            if getattr(client, "_client", None) is not get_http_client(create=False): client.close()
     except Exception as e:
         ai_error_alert("Error occurred while closing OpenAI client.", e)
 
@@ -126,10 +133,8 @@ def ai_get_models_list(client: OpenAI) -> list[ Model | str]:
     try:
         print_lg("Getting AI models list...")
         if not client: raise ValueError("Client is not available!")
-        models = client.models.list()
+        models = call_with_retries("openai", "models", client.models.list)
         ai_check_error(models)
-        print_lg("Available models:")
-        print_lg(models.data, pretty=True)
         return models.data
     except Exception as e:
         critical_error_log("Error occurred while getting models list!", e)
@@ -167,7 +172,7 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     if response_format and llm_spec in ["openai", "openai-like"]:
         params["response_format"] = response_format
 
-    completion = client.chat.completions.create(**params)
+    completion = call_with_retries("openai", llm_model, client.chat.completions.create, **params)
 
     result = ""
     
@@ -193,69 +198,6 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     return result
 
 
-def ai_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output) -> dict | ValueError:
-    """
-    Function to extract skills from job description using OpenAI API.
-    * Takes in `client` of type `OpenAI`
-    * Takes in `job_description` of type `str`
-    * Takes in `stream` of type `bool` to indicate if it's a streaming call
-    * Returns a `dict` object representing JSON response
-    """
-    print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
-    try:        
-        prompt = extract_skills_prompt.format(job_description)
-
-        messages = [{"role": "user", "content": prompt}]
-        ##> ------ Dheeraj Deshwal : dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Bug fix ------
-        return ai_completion(client, messages, response_format=extract_skills_response_format, stream=stream)
-    ##<
-    except Exception as e:
-        ai_error_alert(f"Error occurred while extracting skills from job description. {apiCheckInstructions}", e)
-
-
-##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
-def ai_answer_question(
-    client: OpenAI, 
-    question: str, options: list[str] | None = None, question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text', 
-    job_description: str = None, about_company: str = None, user_information_all: str = None,
-    stream: bool = stream_output
-) -> dict | ValueError:
-    """
-    Function to generate AI-based answers for questions in a form.
-    
-    Parameters:
-    - `client`: OpenAI client instance.
-    - `question`: The question being answered.
-    - `options`: List of options (for `single_select` or `multiple_select` questions).
-    - `question_type`: Type of question (text, textarea, single_select, multiple_select) It is restricted to one of four possible values.
-    - `job_description`: Optional job description for context.
-    - `about_company`: Optional company details for context.
-    - `user_information_all`: information about you, AI cna use to answer question eg: Resume-like user information.
-    - `stream`: Whether to use streaming AI completion.
-    
-    Returns:
-    - `str`: The AI-generated answer.
-    """
-
-    print_lg("-- ANSWERING QUESTION using AI")
-    try:
-        prompt = ai_answer_prompt.format(user_information_all or "N/A", question)
-         # Append optional details if provided
-        if job_description and job_description != "Unknown":
-            prompt += f"\nJob Description:\n{job_description}"
-        if about_company and about_company != "Unknown":
-            prompt += f"\nAbout the Company:\n{about_company}"
-
-        messages = [{"role": "user", "content": prompt}]
-        print_lg("Prompt we are passing to AI: ", prompt)
-        response =  ai_completion(client, messages, stream=stream)
-        # print_lg("Response from AI: ", response)
-        return response
-    except Exception as e:
-        ai_error_alert(f"Error occurred while answering question. {apiCheckInstructions}", e)
-##<
-
-
 def ai_gen_experience(
     client: OpenAI, 
     job_description: str, about_company: str, 
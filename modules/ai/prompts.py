@@ -126,4 +126,61 @@ Respond concisely based on the type of question:
 **QUESTION Strat from here:**  
 {}
 """
-#<
\ No newline at end of file
+#<
+
+##> Answer Questions in Batch
+# Structure of messages = `[{"role": "user", "content": ai_answer_batch_prompt}]`
+
+ai_answer_batch_prompt = """
+You are an intelligent AI assistant filling out a form and answer like human.
+Answer EVERY question below, each one concisely based on its type:
+
+1. If the question asks for **years of experience, duration, or numeric value**, answer **only a number** (e.g., "2", "5", "10").
+2. If the question is **a Yes/No question**, answer **only "Yes" or "No"**.
+3. If the question is of type "text" and requires a description, give a **single-sentence answer**.
+4. If the question is of type "textarea", give a **well-structured and human-like answer with less than 350 characters**.
+5. Do **not** repeat the question in your answer.
+6. here is user information to answer the questions if needed:
+**User Information:** 
+{}
+
+**QUESTIONS** (as JSON, each with an "id", the "question" and its "type"):
+{}
+
+Respond with only a JSON object of the form {{"answers": [{{"id": "<id of the question>", "answer": "<your answer>"}}, ...]}} with one answer per question.
+"""
+"""
+Use `ai_answer_batch_prompt.format(user_information_all, questions_json)` to answer many form questions in one call.
+"""
+
+
+ai_answer_batch_response_format = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Form_Answers_Response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "answer": {"type": "string"},
+                        },
+                        "required": ["id", "answer"],
+                        "additionalProperties": False
+                    },
+                },
+            },
+            "required": ["answers"],
+            "additionalProperties": False
+        },
+    },
+}
+"""
+Response schema for answering questions in batch, one answer per question ID
+"""
+#<
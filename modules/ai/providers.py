@@ -0,0 +1,280 @@
+'''
+AI Providers for LinkedIn Auto Job Applier
+
+One interface for every AI provider, so the bot never branches on `ai_provider`.
+* `create_provider()` is called once in `main()` and returns a `Provider` for the configured `ai_provider`
+* Prompts for skills and answers are built here once, providers only implement how a prompt is completed
+* Every provider keeps `telemetry` of calls, errors, latency and tokens, see `ProviderTelemetry.report()`
+* To add a provider, subclass `BaseProvider`, implement `connect()` and `_complete()` and decorate it with `@register_provider("name")`
+'''
+
+import json
+import threading
+
+from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Literal, Protocol
+
+from config import ai_provider, stream_output, user_information_all
+from modules.helpers import print_lg, critical_error_log
+from modules.ai.prompts import (
+    extract_skills_prompt, extract_skills_response_format, deepseek_extract_skills_prompt, ai_answer_prompt,
+    ai_answer_batch_prompt, ai_answer_batch_response_format
+)
+from modules.ai.transport import usage_totals
+
+
+QuestionType = Literal['text', 'textarea', 'single_select', 'multiple_select']
+
+
+class ProviderTelemetry:
+    '''
+    Calls, errors and latency of one provider's operations, tokens and retries come from `modules.ai.transport`
+    '''
+    def __init__(self, provider: str) -> None:
+        self.provider = provider
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()   # Skills are extracted from a background thread
+
+    def record(self, seconds: float, failed: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+            if failed: self.errors += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            own = {"provider": self.provider, "calls": self.calls, "errors": self.errors, "seconds": self.seconds}
+        return {**usage_totals(self.provider), **own}
+
+    def report(self) -> str:
+        stats = self.snapshot()
+        average = stats["seconds"] / stats["calls"] if stats["calls"] else 0
+        return (f'{self.provider} AI: {stats["calls"]} calls, {stats["errors"]} failed, avg {average:.2f}s, '
+                f'{stats["requests"]} requests, {stats["retries"]} retries, {stats["prompt_tokens"]} prompt + {stats["completion_tokens"]} completion tokens')
+
+
+class Provider(Protocol):
+    '''
+    What the bot needs from an AI provider
+    '''
+    name: str
+    telemetry: ProviderTelemetry
+
+    def complete(self, prompt: str, response_format: dict | None = None, temperature: float = 0, stream: bool = False) -> str | dict | None: ...
+
+    def extract_skills(self, job_description: str) -> dict | None: ...
+
+    def answer_question(self, question: str, question_type: QuestionType = 'text', options: list[str] | None = None,
+                        job_description: str | None = None, about_company: str | None = None) -> str | None: ...
+
+    def answer_questions(self, questions: dict[str, tuple[str, QuestionType]],
+                         job_description: str | None = None, about_company: str | None = None) -> dict[str, str]: ...
+
+    def close(self) -> None: ...
+
+
+PROVIDERS: dict[str, type] = {}
+'''
+Provider classes by `ai_provider` name
+'''
+
+
+def register_provider(name: str):
+    '''
+    Decorator to register a provider class under `name`
+    '''
+    def register(cls: type) -> type:
+        cls.name = name
+        PROVIDERS[name] = cls
+        return cls
+    return register
+
+
+def create_provider(name: str = ai_provider) -> Provider | None:
+    '''
+    Function to connect to the AI provider called `name`, returns `None` if it's unknown or couldn't connect
+    '''
+    cls = PROVIDERS.get(name.strip().lower())
+    if cls is None:
+        print_lg(f'Unknown AI provider "{name}"! Available providers: {", ".join(PROVIDERS)}')
+        return None
+    return cls.connect()
+
+
+def build_batch_prompt(questions: dict[str, tuple[str, QuestionType]], job_description: str | None = None,
+                       about_company: str | None = None, user_information: str | None = user_information_all) -> str:
+    '''
+    Function to build the prompt to answer all `questions` ({id: (question, type)}) of a form page in one call
+    '''
+    listed = [{"id": id, "question": question, "type": question_type} for id, (question, question_type) in questions.items()]
+    prompt = ai_answer_batch_prompt.format(user_information or "N/A", json.dumps(listed, ensure_ascii=False))
+    if job_description and job_description != "Unknown":
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+    if about_company and about_company != "Unknown":
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+    return prompt
+
+
+def build_answer_prompt(question: str, question_type: QuestionType = 'text', options: list[str] | None = None,
+                        job_description: str | None = None, about_company: str | None = None, user_information: str | None = user_information_all) -> str:
+    '''
+    Function to build the prompt to answer a form question, same for every provider
+    '''
+    prompt = ai_answer_prompt.format(user_information or "N/A", question)
+    if options and question_type in ['single_select', 'multiple_select']:
+        prompt += "\n\nOPTIONS:\n" + "\n".join(f"- {option}" for option in options)
+        if question_type == 'single_select':
+            prompt += "\n\nPlease select exactly ONE option from the list above."
+        else:
+            prompt += "\n\nYou may select MULTIPLE options from the list above if appropriate."
+    if job_description and job_description != "Unknown":
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+    if about_company and about_company != "Unknown":
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+    return prompt
+
+
+class BaseProvider(ABC):
+    '''
+    Shared prompt building, error handling and telemetry of providers
+    '''
+    name = ""
+    skills_prompt = extract_skills_prompt
+    skills_response_format = extract_skills_response_format
+    batch_response_format = ai_answer_batch_response_format
+    answer_temperature = 0
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.telemetry = ProviderTelemetry(self.name)
+
+
+    @classmethod
+    @abstractmethod
+    def connect(cls) -> "BaseProvider | None":
+        '''
+        Creates the provider's client, returns `None` if it failed (the error is already logged)
+        '''
+
+
+    @abstractmethod
+    def _complete(self, prompt: str, response_format: dict | None, temperature: float, stream: bool) -> str | dict:
+        '''
+        Sends `prompt` to the provider, returns text, or parsed JSON if `response_format` is given
+        '''
+
+
+    def complete(self, prompt: str, response_format: dict | None = None, temperature: float = 0, stream: bool = False) -> str | dict | None:
+        '''
+        Function to complete `prompt`, returns `None` if the provider failed
+        '''
+        started = perf_counter()
+        result = None
+        try:
+            result = self._complete(prompt, response_format, temperature, stream)
+            if isinstance(result, dict) and "error" in result:
+                raise ValueError(result["error"])
+        except Exception as e:
+            critical_error_log(f"Error occurred while getting {self.name} AI completion!", e)
+            result = None
+        finally:
+            self.telemetry.record(perf_counter() - started, result is None)
+        return result
+
+
+    def extract_skills(self, job_description: str) -> dict | None:
+        '''
+        Function to extract skills from `job_description`, never streams as it runs in a background thread
+        '''
+        print_lg(f"-- EXTRACTING SKILLS FROM JOB DESCRIPTION using {self.name}")
+        skills = self.complete(self.skills_prompt.format(job_description), self.skills_response_format)
+        return skills if isinstance(skills, (dict, list)) else None
+
+
+    def answer_question(self, question: str, question_type: QuestionType = 'text', options: list[str] | None = None,
+                        job_description: str | None = None, about_company: str | None = None) -> str | None:
+        '''
+        Function to answer a form question, returns `None` if AI couldn't answer
+        '''
+        print_lg(f'-- ANSWERING QUESTION using {self.name}: "{question}"')
+        prompt = build_answer_prompt(question, question_type, options, job_description, about_company)
+        answer = self.complete(prompt, temperature=self.answer_temperature, stream=stream_output)
+        return answer.strip() if isinstance(answer, str) else None
+
+
+    def answer_questions(self, questions: dict[str, tuple[str, QuestionType]],
+                         job_description: str | None = None, about_company: str | None = None) -> dict[str, str]:
+        '''
+        Function to answer many form questions ({id: (question, type)}) in a single call.
+        * Returns {id: answer} of questions AI answered, missing or empty answers are left out
+        '''
+        print_lg(f"-- ANSWERING {len(questions)} QUESTIONS in one call using {self.name}")
+        result = self.complete(build_batch_prompt(questions, job_description, about_company), self.batch_response_format, self.answer_temperature)
+        answers = {}
+        if isinstance(result, dict) and isinstance(result.get("answers"), list):
+            for item in result["answers"]:
+                if not isinstance(item, dict): continue
+                id, answer = str(item.get("id", "")), item.get("answer")
+                if id in questions and isinstance(answer, (str, int, float)) and str(answer).strip():
+                    answers[id] = str(answer).strip()
+        return answers
+
+
+    def close(self) -> None:
+        pass
+
+
+@register_provider("openai")
+class OpenAIProvider(BaseProvider):
+    '''
+    OpenAI and OpenAI compatible APIs (local LLM servers...)
+    '''
+    @classmethod
+    def connect(cls) -> "OpenAIProvider | None":
+        from modules.ai.openaiConnections import ai_create_openai_client
+        client = ai_create_openai_client()
+        return cls(client) if client else None
+
+    def _complete(self, prompt: str, response_format: dict | None, temperature: float, stream: bool) -> str | dict:
+        from modules.ai.openaiConnections import ai_completion
+        return ai_completion(self.client, [{"role": "user", "content": prompt}], response_format, temperature, stream)
+
+    def close(self) -> None:
+        from modules.ai.openaiConnections import ai_close_openai_client
+        ai_close_openai_client(self.client)
+
+
+@register_provider("deepseek")
+class DeepSeekProvider(OpenAIProvider):
+    skills_prompt = deepseek_extract_skills_prompt
+    skills_response_format = {"type": "json_object"}
+    batch_response_format = {"type": "json_object"}
+    answer_temperature = 0.1    # Slight randomness for more natural answers
+
+    @classmethod
+    def connect(cls) -> "DeepSeekProvider | None":
+        from modules.ai.deepseekConnections import deepseek_create_client
+        client = deepseek_create_client()
+        return cls(client) if client else None
+
+    def _complete(self, prompt: str, response_format: dict | None, temperature: float, stream: bool) -> str | dict:
+        from modules.ai.deepseekConnections import deepseek_completion
+        return deepseek_completion(self.client, [{"role": "user", "content": prompt}], response_format, temperature, stream)
+
+
+@register_provider("gemini")
+class GeminiProvider(BaseProvider):
+    skills_prompt = extract_skills_prompt + "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
+
+    @classmethod
+    def connect(cls) -> "GeminiProvider | None":
+        from modules.ai.geminiConnections import gemini_create_client
+        model = gemini_create_client()
+        return cls(model) if model else None
+
+    def _complete(self, prompt: str, response_format: dict | None, temperature: float, stream: bool) -> str | dict:
+        from modules.ai.geminiConnections import gemini_completion
+        return gemini_completion(self.client, prompt, is_json=response_format is not None)
@@ -0,0 +1,311 @@
+'''
+Shared LLM Transport for LinkedIn Auto Job Applier
+
+Every request to an AI provider (OpenAI, DeepSeek, Gemini) goes through `call_with_retries()`.
+* OpenAI compatible clients share one pooled keep-alive HTTP client (`get_http_client()`)
+* Each call has a timeout of `ai_request_timeout` seconds
+* Rate limits (429), server errors (5xx), timeouts and connection errors are retried up to `ai_max_retries` times
+  with exponential backoff and jitter, honouring `Retry-After`
+* A circuit breaker per provider fails fast for `ai_circuit_reset` seconds after `ai_circuit_threshold` consecutive failures
+* Latency histograms and token usage are kept per provider and model, see `latency_report()` and `usage_totals()`
+
+Usage:
+    python -m modules.ai.transport check   # Send a chat completion through `call_with_retries()` to a local OpenAI compatible stub
+'''
+
+import threading
+
+from time import sleep, monotonic, perf_counter
+from random import uniform
+
+from config import ai_request_timeout, ai_max_retries, ai_circuit_threshold, ai_circuit_reset
+from modules.helpers import print_lg
+
+
+RETRY_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+'''
+HTTP status codes worth retrying, anything else (bad request, auth...) fails immediately
+'''
+
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64)
+'''
+Upper bounds (seconds) of latency histogram buckets, slower calls go in a last overflow bucket
+'''
+
+
+class CircuitOpenError(RuntimeError):
+    '''
+    Raised instead of calling a provider whose circuit breaker is open
+    '''
+
+
+#< HTTP client
+_http_client = None
+_http_lock = threading.Lock()
+
+
+def get_http_client(create: bool = True):
+    '''
+    Function to get the shared pooled `httpx.Client` for OpenAI compatible providers, created on first use.
+    * Returns `None` if it doesn't exist yet and `create = False`
+    * Only `close_http_client()` should close it, it's shared by every provider client
+    '''
+    global _http_client
+    with _http_lock:
+        if not create: return _http_client
+        if _http_client is None or _http_client.is_closed:
+            import httpx
+            _http_client = httpx.Client(
+                timeout=httpx.Timeout(ai_request_timeout, connect=10.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _http_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+#>
+
+
+#< Circuit breaker
+class CircuitBreaker:
+    '''
+    Opens after `threshold` consecutive failures, lets one trial call through after `reset_after` seconds
+    '''
+    def __init__(self, threshold: int = ai_circuit_threshold, reset_after: float = ai_circuit_reset) -> None:
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None: return True
+            if monotonic() - self.opened_at >= self.reset_after:
+                self.opened_at = monotonic()    # Half-open, one trial call until it succeeds or fails
+                return True
+            return False
+
+    def success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.threshold and self.failures >= self.threshold:
+                self.opened_at = monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+#>
+
+
+#< Latency histograms
+class LatencyHistogram:
+    '''
+    Latency of every attempt, failed ones included (`count` - `errors` succeeded)
+    '''
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        '''
+        Returns the upper bound of the bucket holding the `fraction` percentile, `inf` if it's in the overflow bucket
+        '''
+        target, seen = fraction * self.count, 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else float("inf")
+        return 0.0
+
+
+_histograms: dict[tuple[str, str], LatencyHistogram] = {}
+_stats_lock = threading.Lock()
+
+
+def get_histogram(provider: str, model: str) -> LatencyHistogram:
+    with _stats_lock:
+        return _histograms.setdefault((provider, model), LatencyHistogram())
+
+
+def record_usage(histogram: LatencyHistogram, response) -> None:
+    '''
+    Function to add token usage of an OpenAI (`usage`) or Gemini (`usage_metadata`) response to `histogram`.
+    * Streamed responses carry no usage and are skipped
+    '''
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        histogram.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        histogram.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        return
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        histogram.prompt_tokens += getattr(usage, "prompt_token_count", 0) or 0
+        histogram.completion_tokens += getattr(usage, "candidates_token_count", 0) or 0
+
+
+def usage_totals(provider: str) -> dict:
+    '''
+    Function to get total requests, errors, retries and tokens of all models of `provider`
+    '''
+    totals = {"requests": 0, "errors": 0, "retries": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    with _stats_lock:
+        for (name, model), histogram in _histograms.items():
+            if name != provider: continue
+            totals["requests"] += histogram.count
+            totals["errors"] += histogram.errors
+            totals["retries"] += histogram.retries
+            totals["prompt_tokens"] += histogram.prompt_tokens
+            totals["completion_tokens"] += histogram.completion_tokens
+    return totals
+
+
+def latency_report() -> str:
+    '''
+    Function to summarize latency of AI calls per provider and model
+    '''
+    lines = []
+    with _stats_lock:
+        for (provider, model), histogram in _histograms.items():
+            average = histogram.total / histogram.count if histogram.count else 0
+            lines.append(f"AI calls to {provider}/{model}: {histogram.count - histogram.errors} ok, {histogram.errors} errors, {histogram.retries} retries, "
+                         f"avg {average:.2f}s, p50 <= {histogram.percentile(0.5)}s, p95 <= {histogram.percentile(0.95)}s, "
+                         f"{histogram.prompt_tokens} prompt + {histogram.completion_tokens} completion tokens")
+    return "\n".join(lines) or "No AI calls were made."
+#>
+
+
+def get_status_code(error: Exception) -> int | None:
+    '''
+    Function to find the HTTP status code of an error raised by `openai`, `httpx` or `google` clients
+    '''
+    for source in (error, getattr(error, "response", None)):
+        for attribute in ("status_code", "code"):
+            code = getattr(source, attribute, None)
+            if isinstance(code, int): return code
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    status = get_status_code(error)
+    if status is not None: return status in RETRY_STATUS_CODES
+    name = type(error).__name__
+    return "Timeout" in name or "Connection" in name or "DeadlineExceeded" in name or "Unavailable" in name
+
+
+def get_retry_after(error: Exception) -> float | None:
+    try:
+        value = error.response.headers.get("retry-after")
+        return min(BACKOFF_MAX, float(value)) if value else None
+    except Exception:
+        return None
+
+
+def call_with_retries(provider: str, model: str, function, /, *args, **kwargs):
+    '''
+    Function to call `function(*args, **kwargs)`, a request to `provider`, with retries and circuit breaking.
+    * `provider`, `model` and `function` are positional only, so `kwargs` can hold a `model=` for the request itself
+    * Records latency of every attempt in the histogram of `provider` and `model`
+    * Raises `CircuitOpenError` without calling if the provider has been failing, else the last error
+    '''
+    breaker = _breakers.setdefault(provider, CircuitBreaker())
+    histogram = get_histogram(provider, model)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{provider} failed {breaker.failures} times in a row, not calling it for {breaker.reset_after:.0f}s!")
+    for attempt in range(ai_max_retries + 1):
+        started = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            with _stats_lock:
+                histogram.observe(perf_counter() - started)
+                histogram.errors += 1
+            if not is_retryable(e):
+                raise
+            if attempt >= ai_max_retries:
+                breaker.failure()
+                raise
+            wait = get_retry_after(e) or min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * uniform(0.5, 1.5)
+            with _stats_lock: histogram.retries += 1
+            print_lg(f"{provider} request failed ({type(e).__name__}: {get_status_code(e) or 'no status'}), retrying in {wait:.1f}s...")
+            sleep(wait)
+            continue
+        with _stats_lock:
+            histogram.observe(perf_counter() - started)
+            record_usage(histogram, result)
+        breaker.success()
+        return result
+
+
+#< Check
+def check() -> bool:
+    '''
+    Function to send a real `OpenAI().chat.completions.create()` call through `call_with_retries()` and the shared HTTP client,
+    to a stub server on localhost. Returns `True` if the stub's answer came back
+    '''
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from openai import OpenAI
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps({"id": "check", "object": "chat.completion", "created": 0, "model": request["model"],
+                               "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": f"pong from {request['model']}"}}],
+                               "usage": {"prompt_tokens": 3, "completion_tokens": 3, "total_tokens": 6}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None: pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = OpenAI(base_url=f"http://127.0.0.1:{server.server_port}/v1", api_key="check", http_client=get_http_client(), max_retries=0)
+        completion = call_with_retries("check", "stub-model", client.chat.completions.create, model="stub-model", messages=[{"role": "user", "content": "ping"}])
+        answer = completion.choices[0].message.content
+        print(f'Stub answered "{answer}"')
+        print(latency_report())
+        return answer == "pong from stub-model" and usage_totals("check")["completion_tokens"] == 3
+    finally:
+        server.shutdown()
+        close_http_client()
+
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:2] == ["check"]:
+        passed = check()
+        print(f"Transport check {'passed' if passed else 'FAILED'}")
+        sys.exit(0 if passed else 1)
+    print(__doc__)
+#>
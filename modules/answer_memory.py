@@ -0,0 +1,326 @@
+'''
+Answer Memory for LinkedIn Auto Job Applier
+
+Remembers answers of submitted applications, so a question answered before is answered again without AI or guessing.
+* Rules in `modules/question_rules.py` answer first, so changes to config take effect, memory answers what they don't match
+* Answers are kept in the `question_answers` table of `database_file`, indexed by question kind and normalized label
+* `Questions Found` of applied jobs is saved as JSON (see `serialize_questions()`), older rows (stringified Python sets)
+  are read with `ast.literal_eval`
+* History of applied jobs is imported once, then `remember()` adds the questions of each submitted application
+* Only fields the bot filled are remembered, not those left as prefilled by LinkedIn (email, phone country code...)
+* Questions answered randomly are never remembered, those in this run and any still in `unresolved_questions`
+* Textarea answers (cover letters, AI answers written for one job) aren't remembered
+* All answers are loaded in memory on first use, `recall()` is a dict lookup
+* If an answer changed (new salary, notice period...), run `clear` and let it learn again
+* Questions answered randomly are recorded right away in `unresolved_questions`, with counts, first and last seen
+  times and Job IDs, so the most frequent ones can get a rule in `modules/question_rules.py`
+* A question is counted once per job, however many times the bot retries a form page, once it has a rule run `resolve`
+
+Usage:
+    python -m modules.answer_memory import   # Rebuild answers from applied jobs history (done automatically once)
+    python -m modules.answer_memory show     # List remembered answers, most used first
+    python -m modules.answer_memory clear    # Forget all remembered answers
+    python -m modules.answer_memory unresolved [N]           # Top N questions answered randomly, across runs
+    python -m modules.answer_memory export-unresolved [path] # Export all of them to CSV
+    python -m modules.answer_memory resolve "<question>"     # Remove a question from unresolved ones, it's remembered again
+    python -m modules.answer_memory clear-unresolved         # Remove all unresolved questions
+'''
+
+import os
+import re
+import csv
+import ast
+import json
+
+from collections import Counter
+from datetime import datetime
+
+from config import use_answer_memory, file_name
+from modules.helpers import print_lg, normalize_text
+from modules.storage import get_connection, get_meta, flush_store
+
+
+RADIO_ANSWER = re.compile(r'^(?:Decline \()?"(.*)"<.*>\)?$', re.DOTALL)
+'''
+Radio answers are saved as `"label"<value>` or `Decline ("label"<value>)`
+'''
+
+KINDS = {"select", "radio", "text"}
+'''
+Question kinds remembered, checkboxes are always checked and textareas are written for each job
+'''
+
+IMPORTED_META = "answers_imported_v2"
+'''
+Meta key set once history is imported, renamed when import rules change so history is imported again
+'''
+
+UNRESOLVED_JOB_IDS = 20
+'''
+Job IDs kept per unresolved question, the most recent ones
+'''
+
+UNRESOLVED_FILE = os.path.join(os.path.dirname(file_name), "unresolved_questions.csv")
+
+_memory: dict[tuple[str, str], Counter] | None = None
+_unresolved_seen: set[tuple[str, str, str | None]] = set()
+hits = 0
+misses = 0
+
+
+#< Serialization
+def serialize_questions(questions_list: set | None) -> str:
+    '''
+    Function to serialize `questions_list` of an application as JSON, for `Questions Found` of applied jobs
+    '''
+    if not questions_list: return ""
+    return json.dumps(sorted((list(question) for question in questions_list), key=str), ensure_ascii=False, default=str)
+
+
+def parse_questions(text: str) -> list[tuple]:
+    '''
+    Function to parse `Questions Found` of an applied job, JSON or a stringified Python set of older rows.
+    * Returns a list of (label, answer, kind, previous answer), empty if `text` is empty or truncated
+    '''
+    if not text: return []
+    try:
+        questions = json.loads(text)
+    except ValueError:
+        try:
+            questions = ast.literal_eval(text)
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            return []
+    if not isinstance(questions, (list, set, tuple)): return []
+    return [tuple(question) for question in questions if isinstance(question, (list, tuple)) and len(question) >= 3]
+
+
+def question_key(kind: str, label: str) -> str:
+    '''
+    Function to get the index key of a question, its normalized label without the listed options of select and radio questions
+    '''
+    if kind in ("select", "radio"): label = label.split(" [ ")[0]
+    return normalize_text(label)
+
+
+def answer_value(kind: str, answer) -> str | None:
+    '''
+    Function to get the answer to remember from a saved answer, option label of radio answers
+    '''
+    if not isinstance(answer, str) or not answer.strip(): return None
+    if kind == "radio":
+        found = RADIO_ANSWER.match(answer)
+        return found.group(1) if found else answer
+    return answer
+
+
+def bot_answered(kind: str, answer, previous) -> bool:
+    '''
+    Function to tell if the bot filled a field, from its saved answer and `previous` answer (what the field held before)
+    * Older history saved the default "Yes" for prefilled selects the bot didn't touch, those are left out too
+    '''
+    if not previous or previous == "Select an option": return True   # Field was empty
+    if answer == previous: return False
+    return not (kind == "select" and answer == "Yes")
+#>
+
+
+#< Memory
+def _upsert(rows: list[tuple[str, str, str, str, str]]) -> None:
+    connection = get_connection()
+    with connection:
+        connection.executemany("""
+            INSERT INTO question_answers (kind, label_key, label, answer, count, last_used) VALUES (?, ?, ?, ?, 1, ?)
+            ON CONFLICT (kind, label_key, answer) DO UPDATE SET count = count + 1, label = excluded.label, last_used = excluded.last_used
+        """, rows)
+
+
+def _rows(questions: list[tuple], used: str, skip: set[tuple[str, str]] = set()) -> list[tuple[str, str, str, str, str]]:
+    rows = []
+    for label, answer, kind, *rest in questions:
+        if kind not in KINDS or not isinstance(label, str): continue
+        if not bot_answered(kind, answer, rest[0] if rest else None): continue
+        key, value = question_key(kind, label), answer_value(kind, answer)
+        if key and value is not None and (kind, key) not in skip:
+            rows.append((kind, key, label, value, used))
+    return rows
+
+
+def unresolved_keys() -> set[tuple[str, str]]:
+    '''
+    Function to get (kind, label key) of questions answered randomly in any run and not resolved yet
+    '''
+    return set(get_connection().execute("SELECT kind, label_key FROM unresolved_questions"))
+
+
+def import_history() -> int:
+    '''
+    Function to rebuild the memory from answers of all applied jobs in the database.
+    * Runs automatically once, on first use
+    * Returns number of answers imported
+    '''
+    global _memory
+    flush_store()
+    connection = get_connection()
+    rows, skip = [], unresolved_keys()
+    for questions_found, date_applied in connection.execute("SELECT questions_found, date_applied FROM applied_jobs WHERE questions_found != ''"):
+        rows += _rows(parse_questions(questions_found), date_applied or "", skip)
+    with connection:
+        connection.execute("DELETE FROM question_answers")
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (IMPORTED_META, str(datetime.now())))
+    _upsert(rows)
+    _memory = None
+    return len(rows)
+
+
+def load_answers() -> dict[tuple[str, str], Counter]:
+    '''
+    Function to load remembered answers, {(kind, label key): Counter of answers}, importing history on first use
+    '''
+    global _memory
+    if _memory is None:
+        if get_meta(IMPORTED_META) is None:
+            print_lg(f"Learned {import_history()} answers from applied jobs history.")
+        memory = {}
+        for kind, key, answer, count in get_connection().execute(
+                "SELECT kind, label_key, answer, count FROM question_answers ORDER BY last_used DESC"):
+            memory.setdefault((kind, key), Counter())[answer] = count
+        _memory = memory
+    return _memory
+
+
+def recall(kind: str, label: str) -> str | None:
+    '''
+    Function to get the answer given most often to a question of `kind` labelled `label`, `None` if never answered
+    '''
+    global hits, misses
+    if not use_answer_memory or kind not in KINDS: return None
+    answers = load_answers().get((kind, question_key(kind, label)))
+    if not answers:
+        misses += 1
+        return None
+    hits += 1
+    return answers.most_common(1)[0][0]
+
+
+def remember(questions_list: set | None, randomly_answered: set[tuple[str, str]] = set()) -> None:
+    '''
+    Function to remember answers of a submitted application.
+    * Takes in `randomly_answered`, (label, kind) of questions answered randomly, which are left out with unresolved ones
+    '''
+    if not use_answer_memory or not questions_list: return
+    memory = load_answers()
+    skip = unresolved_keys() | {(kind, question_key(kind, label)) for label, kind in randomly_answered}
+    rows = _rows(list(questions_list), str(datetime.now()), skip)
+    _upsert(rows)
+    for kind, key, _, value, _ in rows:
+        memory.setdefault((kind, key), Counter())[value] += 1
+
+
+def clear_answers() -> int:
+    '''
+    Function to forget all remembered answers, history isn't imported again. Returns number of answers forgotten
+    '''
+    global _memory
+    connection = get_connection()
+    with connection:
+        count = connection.execute("DELETE FROM question_answers").rowcount
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (IMPORTED_META, str(datetime.now())))
+    _memory = None
+    return count
+
+
+def report() -> str:
+    return f"Answer memory: {hits} questions answered from {len(_memory or {})} remembered, {misses} not found"
+#>
+
+
+#< Unresolved questions
+def add_unresolved_question(label: str, kind: str, job_id: str | None = None) -> None:
+    '''
+    Function to record a question that was answered randomly, committed right away so it survives a killed run.
+    * Questions are deduplicated by kind and normalized label, counting how often and for which jobs they came up
+    * Counted once per job, repeated passes over a form page (stuck retries) are ignored
+    '''
+    key, now = question_key(kind, label), str(datetime.now())
+    if (kind, key, job_id) in _unresolved_seen: return
+    _unresolved_seen.add((kind, key, job_id))
+    connection = get_connection()
+    with connection:
+        row = connection.execute("SELECT job_ids FROM unresolved_questions WHERE kind = ? AND label_key = ?", (kind, key)).fetchone()
+        job_ids = json.loads(row[0]) if row and row[0] else []
+        if job_id and job_id not in job_ids: job_ids = (job_ids + [job_id])[-UNRESOLVED_JOB_IDS:]
+        connection.execute("""
+            INSERT INTO unresolved_questions (kind, label_key, label, count, first_seen, last_seen, job_ids) VALUES (?, ?, ?, 1, ?, ?, ?)
+            ON CONFLICT (kind, label_key) DO UPDATE SET count = count + 1, label = excluded.label, last_seen = excluded.last_seen, job_ids = excluded.job_ids
+        """, (kind, key, label, now, now, json.dumps(job_ids)))
+
+
+def get_unresolved_questions(limit: int | None = None) -> list[dict]:
+    '''
+    Function to get unresolved questions, most frequent first, as dicts of `kind`, `label`, `count`, `first_seen`, `last_seen` and `job_ids`
+    '''
+    query = "SELECT kind, label, count, first_seen, last_seen, job_ids FROM unresolved_questions ORDER BY count DESC, last_seen DESC"
+    rows = get_connection().execute(query + (" LIMIT ?" if limit else ""), (limit,) if limit else ())
+    return [{"kind": kind, "label": label, "count": count, "first_seen": first_seen, "last_seen": last_seen, "job_ids": json.loads(job_ids or "[]")}
+            for kind, label, count, first_seen, last_seen, job_ids in rows]
+
+
+def resolve_unresolved(label: str | None = None) -> int:
+    '''
+    Function to remove the unresolved question labelled `label` (of any kind), or all of them if `label` is `None`.
+    * Returns number of questions removed
+    '''
+    connection = get_connection()
+    with connection:
+        if label is None: return connection.execute("DELETE FROM unresolved_questions").rowcount
+        keys = {question_key(kind, label) for kind in KINDS | {"textarea", "checkbox"}}
+        return connection.execute(f"DELETE FROM unresolved_questions WHERE label_key IN ({', '.join('?' * len(keys))})", tuple(keys)).rowcount
+
+
+def export_unresolved(path: str = UNRESOLVED_FILE) -> int:
+    '''
+    Function to export all unresolved questions to a CSV file at `path`, returns number of questions exported
+    '''
+    questions = get_unresolved_questions()
+    folder = os.path.dirname(path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Kind", "Question", "Times Answered Randomly", "First Seen", "Last Seen", "Job IDs"])
+        writer.writerows([question["kind"], question["label"], question["count"], question["first_seen"], question["last_seen"],
+                          " ".join(question["job_ids"])] for question in questions)
+    return len(questions)
+
+
+def unresolved_report(limit: int = 20) -> str:
+    questions = get_unresolved_questions(limit)
+    lines = [f"Top {len(questions)} questions answered randomly, add rules for them in modules/question_rules.py:"]
+    lines += [f'{question["count"]:5}  {question["kind"]:8}  {question["last_seen"][:10]}  {question["label"][:100]}' for question in questions]
+    return "\n".join(lines)
+#>
+
+
+if __name__ == "__main__":
+    import sys
+    from modules.storage import close_store
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "import":
+        print(f"Imported {import_history()} answers from applied jobs history")
+    elif command == "show":
+        for kind, label, answer, count in get_connection().execute(
+                "SELECT kind, label, answer, count FROM question_answers ORDER BY count DESC, last_used DESC"):
+            print(f"{count:5}  {kind:8}  {label[:80]}  ->  {answer[:60]}")
+    elif command == "clear":
+        print(f"Forgot {clear_answers()} answers")
+    elif command == "unresolved":
+        print(unresolved_report(int(sys.argv[2]) if len(sys.argv) > 2 else 20))
+    elif command == "export-unresolved":
+        path = sys.argv[2] if len(sys.argv) > 2 else UNRESOLVED_FILE
+        print(f"Exported {export_unresolved(path)} unresolved questions to {path}")
+    elif command == "resolve" and len(sys.argv) > 2:
+        print(f"Resolved {resolve_unresolved(sys.argv[2])} unresolved questions")
+    elif command == "clear-unresolved":
+        print(f"Removed {resolve_unresolved()} unresolved questions")
+    else:
+        print(__doc__)
+    close_store()
@@ -13,7 +13,8 @@ version:    24.12.29.12.30
 '''
 
 from config import click_gap, smooth_scroll
-from modules.helpers import buffer, print_lg, sleep
+from modules.helpers import print_lg
+from modules.pacing import settle
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -38,7 +39,7 @@ def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=T
             if scroll:  scroll_to_view(driver, button, scrollTop)
             if click:
                 button.click()
-                buffer(click_gap)
+                settle(driver, click_gap)
             return button
         except Exception as e:
             print_lg("Click Failed! Didn't find '"+text+"'")
@@ -58,7 +59,7 @@ def multi_sel(driver: WebDriver, texts: list, time: float=5.0) -> None:
             button = WebDriverWait(driver,time).until(EC.presence_of_element_located((By.XPATH, './/span[normalize-space(.)="'+text+'"]')))
             scroll_to_view(driver, button)
             button.click()
-            buffer(click_gap)
+            settle(driver, click_gap)
         except Exception as e:
             print_lg("Click Failed! Didn't find '"+text+"'")
             # print_lg(e)
@@ -74,7 +75,7 @@ def multi_sel_noWait(driver: WebDriver, texts: list, actions: ActionChains = Non
             button = driver.find_element(By.XPATH, './/span[normalize-space(.)="'+text+'"]')
             scroll_to_view(driver, button)
             button.click()
-            buffer(click_gap)
+            settle(driver, click_gap)
         except Exception as e:
             if actions: company_search_click(driver,actions,text)
             else:   print_lg("Click Failed! Didn't find '"+text+"'")
@@ -89,7 +90,7 @@ def boolean_button_click(driver: WebDriver, actions: ActionChains, text: str) ->
         button = list_container.find_element(By.XPATH, './/input[@role="switch"]')
         scroll_to_view(driver, button)
         actions.move_to_element(button).click().perform()
-        buffer(click_gap)
+        settle(driver, click_gap)
     except Exception as e:
         print_lg("Click Failed! Didn't find '"+text+"'")
         # print_lg(e)
@@ -123,6 +124,19 @@ def text_input_by_ID(driver: WebDriver, id: str, value: str, time: float=5.0) ->
     username_field.send_keys(Keys.CONTROL + "a")
     username_field.send_keys(value)
 
+# Select option functions
+def select_by_index(driver: WebDriver, select: WebElement, index: int) -> None:
+    '''
+    Selects option at `index` of the `select` element in a single script call, firing `input` and `change` like a user would.
+    - Unlike `Select.select_by_visible_text()`, doesn't search options in the browser.
+    '''
+    driver.execute_script("""
+        const select = arguments[0];
+        Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, "selectedIndex").set.call(select, arguments[1]);
+        select.dispatchEvent(new Event("input", {bubbles: true}));
+        select.dispatchEvent(new Event("change", {bubbles: true}));
+    """, select, index)
+
 def try_xp(driver: WebDriver, xpath: str, click: bool=True) -> WebElement | bool:
     try:
         if click:
@@ -150,18 +164,19 @@ def company_search_click(driver: WebDriver, actions: ActionChains, companyName:
     search = driver.find_element(By.XPATH,"(.//input[@placeholder='Add a company'])[1]")
     search.send_keys(Keys.CONTROL + "a")
     search.send_keys(companyName)
-    buffer(3)
+    settle(driver, 3)
     actions.send_keys(Keys.DOWN).perform()
     actions.send_keys(Keys.ENTER).perform()
     print_lg(f'Tried searching and adding "{companyName}"')
 
 def text_input(actions: ActionChains, textInputEle: WebElement | bool, value: str, textFieldName: str = "Text") -> None | Exception:
     if textInputEle:
-        sleep(1)
+        driver = textInputEle.parent
+        settle(driver, 1)
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        settle(driver, 2)   # Let the suggestions dropdown render before selecting
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
\ No newline at end of file
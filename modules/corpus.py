@@ -0,0 +1,235 @@
+"""
+Job Description Corpus for LinkedIn Auto Job Applier
+
+Builds an offline corpus of job descriptions from applied and failed jobs in the application store (`modules/storage.py`)
+and replays it through the job filters, so rules can be tuned and regressions measured without a browser.
+* The corpus is gzipped JSON lines, one job per line, only the columns the filters need are kept
+* Replay reports jobs/sec and how often each rule (and each bad word) hit, peak memory is measured in a separate untimed pass
+
+Usage:
+    python -m modules.corpus build [corpus_file]                        # Build corpus from the application store
+    python -m modules.corpus bench [corpus_file] [--limit N] [--skills] # Replay corpus through the filters
+    python -m modules.corpus experience [corpus_file] [--limit N]       # Compare experience parser with the old regex
+"""
+
+import os
+import re
+import gzip
+import json
+import tracemalloc
+
+from time import perf_counter
+from typing import Iterator
+
+from config import database_file
+
+
+CORPUS_FILE = os.path.join(os.path.dirname(database_file), "corpus.jsonl.gz")
+'''
+Default location of the corpus, next to the application database
+'''
+
+CORPUS_FIELDS = {
+    'Job ID': 'job_id',
+    'Title': 'title',
+    'Company': 'company',
+    'Work Location': 'work_location',
+    'Work Style': 'work_style',
+    'About Job': 'about_job',
+    'Experience required': 'experience_required',
+    'Skills required': 'skills_required',
+    'Assumed Reason': 'reason',
+}
+'''
+Maps history header names (see `storage.APPLIED_FIELDS` and `storage.FAILED_FIELDS`) to corpus keys,
+columns a table doesn't have are stored as empty strings
+'''
+
+
+def read_history(outcome: str) -> Iterator[dict]:
+    '''
+    Function to read corpus records from the application store, `outcome` is "applied" or "failed"
+    '''
+    from modules.storage import get_connection, flush_store, APPLIED_FIELDS, FAILED_FIELDS
+    flush_store()
+    table, fields = ("applied_jobs", APPLIED_FIELDS) if outcome == "applied" else ("failed_jobs", FAILED_FIELDS)
+    headers = [header for header in CORPUS_FIELDS if header in fields]
+    query = f"SELECT {', '.join(fields[header] for header in headers)} FROM {table} WHERE job_id != ''"
+    for row in get_connection().execute(query):
+        record = dict.fromkeys(CORPUS_FIELDS.values(), "")
+        record.update((CORPUS_FIELDS[header], (value or "").strip()) for header, value in zip(headers, row))
+        record['outcome'] = outcome
+        yield record
+
+
+def build_corpus(path: str = CORPUS_FILE) -> int:
+    '''
+    Function to write the corpus from applied and failed jobs in the application store, one record per Job ID and outcome.
+    * Returns the number of records written
+    '''
+    seen = set()
+    count = 0
+    folder = os.path.dirname(path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    with gzip.open(path + ".tmp", 'wt', encoding='utf-8') as corpus:
+        for outcome in ("applied", "failed"):
+            for record in read_history(outcome):
+                key = (record['job_id'], outcome)
+                if key in seen: continue
+                seen.add(key)
+                corpus.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    os.replace(path + ".tmp", path)
+    return count
+
+
+def load_corpus(path: str = CORPUS_FILE, limit: int | None = None) -> Iterator[dict]:
+    '''
+    Function to stream records of the corpus at `path`, at most `limit` of them
+    '''
+    with gzip.open(path, 'rt', encoding='utf-8') as corpus:
+        for index, line in enumerate(corpus):
+            if limit is not None and index >= limit: return
+            yield json.loads(line)
+
+
+def get_skills_extractor():
+    '''
+    Function to create a `description -> skills` function using the configured AI provider, going through `skills_cache`.
+    * With `ai_skills_cache_only = True` only cached skills are used, no AI client is created
+    * Returns `None` if AI is disabled or the client couldn't be created
+    '''
+    from config import use_AI, ai_skills_cache_only
+    from modules.ai.cache import get_cached_skills
+    if ai_skills_cache_only: return lambda text: get_cached_skills(text, None)
+    if not use_AI: return None
+    from modules.ai.providers import create_provider
+    provider = create_provider()
+    return (lambda text: get_cached_skills(text, provider.extract_skills)) if provider else None
+
+
+def replay(records: Iterator[dict], extract_skills=None) -> dict:
+    '''
+    Function to run every record with a description through `evaluate_description()` (and `extract_skills` if given).
+    * Returns stats of the replay: counts, timings and hits per rule and per bad word, see `peak_memory()` for memory
+    '''
+    from modules.filters import evaluate_description
+    stats = {"records": 0, "jobs": 0, "seconds": 0.0, "skills_seconds": 0.0, "skills_errors": 0, "skills_missing": 0,
+             "rules": {}, "bad_words": {}, "no_experience": 0, "experience_changed": 0}
+    for record in records:
+        stats["records"] += 1
+        description = record.get("about_job")
+        if not description or description == "Unknown": continue
+        stats["jobs"] += 1
+        started = perf_counter()
+        result = evaluate_description(description)
+        stats["seconds"] += perf_counter() - started
+        if result["rule"]: stats["rules"][result["rule"]] = stats["rules"].get(result["rule"], 0) + 1
+        for word in result["bad_words"]: stats["bad_words"][word] = stats["bad_words"].get(word, 0) + 1
+        if not result["skip"] and not result["experience_found"]: stats["no_experience"] += 1
+        recorded = record.get("experience_required", "")
+        if recorded.isdigit() and isinstance(result["experience_required"], int) and result["experience_required"] != int(recorded):
+            stats["experience_changed"] += 1
+        if extract_skills:
+            started = perf_counter()
+            try:
+                if extract_skills(description) is None: stats["skills_missing"] += 1
+            except Exception: stats["skills_errors"] += 1
+            stats["skills_seconds"] += perf_counter() - started
+    return stats
+
+
+def peak_memory(records: Iterator[dict]) -> int:
+    '''
+    Function to get peak memory (bytes) allocated while running every record with a description through `evaluate_description()`.
+    * Separate from `replay()`, tracing allocations slows down the code it traces
+    '''
+    from modules.filters import evaluate_description
+    tracemalloc.start()
+    try:
+        for record in records:
+            description = record.get("about_job")
+            if description and description != "Unknown": evaluate_description(description)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+LEGACY_EXPERIENCE_PATTERN = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
+'''
+Experience regex used before `filters.parse_experience()`, kept only to benchmark against
+'''
+
+
+def legacy_years_of_experience(text: str) -> int:
+    matches = re.findall(LEGACY_EXPERIENCE_PATTERN, text)
+    if len(matches) == 0: return 0
+    return max([int(match) for match in matches if int(match) <= 12])
+
+
+def compare_experience(records: Iterator[dict]) -> None:
+    '''
+    Function to score all descriptions with `parse_experience_batch()` and the old regex, printing timings and disagreements
+    '''
+    from modules.filters import parse_experience_batch
+    texts = [record["about_job"] for record in records if record.get("about_job") and record["about_job"] != "Unknown"]
+    if not texts: return print("No descriptions in corpus!")
+
+    started = perf_counter()
+    legacy, legacy_errors = [], 0
+    for text in texts:
+        try: legacy.append(legacy_years_of_experience(text))
+        except ValueError:
+            legacy.append(None)
+            legacy_errors += 1
+    legacy_time = perf_counter() - started
+
+    started = perf_counter()
+    parsed = parse_experience_batch(texts)
+    parsed_time = perf_counter() - started
+
+    differ = [(text, old, new) for text, old, new in zip(texts, legacy, parsed) if old != (new["min"] or 0)]
+    print(f"Scored {len(texts)} descriptions")
+    print(f"  Old regex:          {legacy_time * 1000:9.1f} ms, {legacy_errors} crashed (every match above 12 years)")
+    print(f"  parse_experience(): {parsed_time * 1000:9.1f} ms, {sum(1 for result in parsed if result['min'] is not None)} with a requirement, "
+          f"{sum(1 for result in parsed if any(mention['skill'] for mention in result['mentions']))} with per-skill experience")
+    print(f"  Disagreements:      {len(differ)}")
+    for text, old, new in differ[:10]:
+        print(f'    old {old} -> new {new["min"]} from "{new["source"]["text"] if new["source"] else ""}"')
+
+
+def print_replay(stats: dict) -> None:
+    jobs = stats["jobs"] or 1
+    print(f'Replayed {stats["jobs"]} descriptions ({stats["records"]} records) in {stats["seconds"] * 1000:.1f} ms, {stats["jobs"] / stats["seconds"] if stats["seconds"] else 0:.0f} jobs/sec')
+    if "peak_memory" in stats: print(f'Peak memory: {stats["peak_memory"] / 1024 / 1024:.1f} MB')
+    if stats["skills_seconds"]:
+        print(f'Skill extraction: {stats["skills_seconds"]:.1f} s, {stats["jobs"] / stats["skills_seconds"]:.2f} jobs/sec, {stats["skills_errors"]} errors, {stats["skills_missing"]} without skills')
+    print("Rule hit rates:")
+    for rule, count in sorted(stats["rules"].items(), key=lambda item: -item[1]):
+        print(f"  {rule:<12} {count:6}  {count / jobs:6.1%}")
+    print(f'  {"(passed)":<12} {stats["jobs"] - sum(stats["rules"].values()):6}  {(stats["jobs"] - sum(stats["rules"].values())) / jobs:6.1%}')
+    print(f'No experience requirement found: {stats["no_experience"]}, experience differs from history: {stats["experience_changed"]}')
+    if stats["bad_words"]:
+        print("Bad word hits:")
+        for word, count in sorted(stats["bad_words"].items(), key=lambda item: -item[1]):
+            print(f"  {count:6}  {word}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Build and replay the offline job description corpus")
+    parser.add_argument("command", choices=["build", "bench", "experience"])
+    parser.add_argument("corpus_file", nargs="?", default=CORPUS_FILE)
+    parser.add_argument("--limit", type=int, default=None, help="Replay at most this many records")
+    parser.add_argument("--skills", action="store_true", help="Also run AI skill extraction (makes real API calls for uncached descriptions unless ai_skills_cache_only = True)")
+    args = parser.parse_args()
+    if args.command == "build":
+        print(f'Wrote {build_corpus(args.corpus_file)} records to "{args.corpus_file}"')
+    elif not os.path.exists(args.corpus_file):
+        print(f'Corpus "{args.corpus_file}" not found, run `python -m modules.corpus build` first.')
+    elif args.command == "experience":
+        compare_experience(load_corpus(args.corpus_file, args.limit))
+    else:
+        stats = replay(load_corpus(args.corpus_file, args.limit), get_skills_extractor() if args.skills else None)
+        stats["peak_memory"] = peak_memory(load_corpus(args.corpus_file, args.limit))
+        print_replay(stats)
@@ -0,0 +1,363 @@
+"""
+Job Filters for LinkedIn Auto Job Applier
+
+Pure Python checks run on job data before spending any browser round-trips on it.
+* `filter_job_cards()` screens every card of a results page against history, rejected jobs, blacklisted companies and title rules
+* `KeywordMatcher` finds all words of a list (`bad_words`, `about_company_bad_words`...) in a text, words are lowercased once
+* `evaluate_description()` applies all "About Job" rules to a description, it needs no browser and is used by `modules/corpus.py`
+
+Usage:
+    python -m modules.filters benchmark     # Time matchers against the naive loop over stored (or generated) job descriptions
+    python -m modules.filters check         # Check the experience parser against `EXPERIENCE_EXAMPLES`
+"""
+
+import re
+
+from time import perf_counter
+
+from config import (
+    title_bad_words, bad_words, about_company_bad_words, about_company_good_words, match_whole_words,
+    security_clearance, did_masters, current_experience
+)
+
+
+#< Keyword matching
+TRIE_MIN_WORDS = 40
+'''
+Whole word lists with at least this many words are matched with a single trie regex, anything else word by word with `in`.
+Python's `in` is a fast C search, a regex only beats it when it can skip positions inside words (see `benchmark`)
+'''
+
+
+def trie_pattern(words: list[str]) -> str:
+    '''
+    Function to build a regex matching any of `words`, with common prefixes factored out ("php|phpunit" -> "php(?:unit)?").
+    * Prefers the longest word at a position, backtracks to shorter ones
+    '''
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word: node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches: return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    '''
+    Case-insensitive matcher for a list of words, lowercased once.
+    * Words are checked one by one with `in`, long whole word lists (`TRIE_MIN_WORDS`) with a single trie regex
+    * `whole_words = True` only matches words that aren't part of a bigger word ("PHP" won't match "PHPUnit")
+    '''
+    def __init__(self, words: list[str], whole_words: bool = False) -> None:
+        self.whole_words = whole_words
+        self.words: dict[str, str] = {}
+        for word in words:
+            if word.strip(): self.words.setdefault(word.strip().lower(), word.strip())
+        self._lowered = list(self.words)
+        self._pattern = None
+        if whole_words and len(self._lowered) >= TRIE_MIN_WORDS:
+            alternation = rf"(?<!\w){trie_pattern(self._lowered)}(?!\w)"
+            # Lookahead matches at every position, so words inside a longer match are found too
+            self._pattern = re.compile(f"(?=({alternation}))")
+            # Words that are a prefix of a longer word can be hidden by it at the same position
+            self._prefixes = {word: [other for other in self._lowered if other != word and word.startswith(other)] for word in self._lowered}
+
+
+    def __bool__(self) -> bool:
+        return bool(self.words)
+
+
+    def _contains(self, word: str, lowered: str) -> bool:
+        start = lowered.find(word)
+        if start < 0 or not self.whole_words: return start >= 0
+        while start >= 0:
+            end = start + len(word)
+            if (start == 0 or not is_word_char(lowered[start - 1])) and (end == len(lowered) or not is_word_char(lowered[end])):
+                return True
+            start = lowered.find(word, start + 1)
+        return False
+
+
+    def search(self, text: str) -> str | None:
+        '''
+        Returns the first word (as written in config) found in `text`, or `None`
+        '''
+        if not self.words or not text: return None
+        lowered = text.lower()
+        if self._pattern is not None:
+            match = self._pattern.search(lowered)
+            return self.words[match.group(1)] if match else None
+        return next((self.words[word] for word in self._lowered if self._contains(word, lowered)), None)
+
+
+    def find_all(self, text: str) -> list[str]:
+        '''
+        Returns every word (as written in config) found in `text`, in order of the list
+        '''
+        if not self.words or not text: return []
+        lowered = text.lower()
+        if self._pattern is None:
+            return [self.words[word] for word in self._lowered if self._contains(word, lowered)]
+        found = set()
+        for match in self._pattern.finditer(lowered):
+            word = match.group(1)
+            found.add(word)
+            for prefix in self._prefixes[word]:
+                end = match.start() + len(prefix)
+                if end >= len(lowered) or not is_word_char(lowered[end]):
+                    found.add(prefix)
+        return [self.words[word] for word in self._lowered if word in found]
+
+
+bad_words_matcher = KeywordMatcher(bad_words, match_whole_words)
+about_company_bad_words_matcher = KeywordMatcher(about_company_bad_words, match_whole_words)
+about_company_good_words_matcher = KeywordMatcher(about_company_good_words, match_whole_words)
+title_bad_words_matcher = KeywordMatcher(title_bad_words, match_whole_words)
+#>
+
+
+SKIP_REASONS = {
+    'applied': 'Already applied',
+    'rejected': 'Previously rejected',
+    'blacklisted': 'Blacklisted Company',
+    'title': 'Bad word in title',
+}
+'''
+Reasons returned by `job_card_skip_reason()` and their log messages
+'''
+
+
+def job_card_skip_reason(card: dict, applied_jobs: set, rejected_jobs: set, blacklisted_companies: set) -> str | None:
+    '''
+    Function to check if a job card read by `extract_job_cards()` should be skipped without opening it.
+    * Returns one of `SKIP_REASONS` keys, or `None` if the job should be opened
+    '''
+    if card["applied"] or card["id"] in applied_jobs:   return 'applied'
+    if card["id"] in rejected_jobs:                     return 'rejected'
+    if card["company"] in blacklisted_companies:        return 'blacklisted'
+    if title_bad_words_matcher.search(card["title"]):   return 'title'
+    return None
+
+
+def filter_job_cards(cards: list[dict], applied_jobs: set, rejected_jobs: set, blacklisted_companies: set) -> tuple[list[dict], list[tuple[dict, str]]]:
+    '''
+    Function to split job cards of a page into the ones worth opening and the ones to skip.
+    * Returns a tuple of (cards to open, [(skipped card, reason), ...])
+    * Cards LinkedIn hasn't rendered yet are only checked by Job ID, `job_card_skip_reason()` should be called again once they're read
+    '''
+    survivors, skipped = [], []
+    for card in cards:
+        reason = job_card_skip_reason(card, applied_jobs, rejected_jobs, blacklisted_companies)
+        if reason:  skipped.append((card, reason))
+        else:       survivors.append(card)
+    return survivors, skipped
+
+
+#< Job description rules
+MAX_EXPERIENCE_YEARS = 15
+'''
+Mentions above this many years ("over 50 years in business") are kept in the result but not used as a requirement
+'''
+
+EXPERIENCE_PATTERN = re.compile(r"""
+    (?:(?P<qualifier>minimum\s+of|minimum|min\.?|at\s+least|over|more\s+than|no\s+less\s+than)\s+)?
+    (?<![\d.])\(?\s*(?P<min>\d{1,2}(?:\.\d{1,2})?)              # 5, 1.5, (5
+    (?:\s*(?:-|\u2013|\u2014|to)\s*(?P<max>\d{1,2}(?:\.\d{1,2})?))? # 3-5, 3 to 5
+    \s*(?P<plus>\+)?\s*\)?                                     # 5+, (7+), (5)
+    \s*(?:years?|yrs?)\b
+    (?P<context>(?:\s+of)?(?:\s+(?:professional|relevant|hands[-\s]on|industry|work|working|related|progressive|proven))*
+        (?:\s+(?P<lead_skill>(?!experience\b)[\w+#./-]+(?:\s+(?!experience\b)[\w+#./-]+)?))??\s+experience)?   # of Python experience
+    (?:\s+(?:in|with|using|of)\s+(?P<skill>[^.,;:\n()]{1,40}?)(?=\s*(?:[.,;:\n()]|$|\band\b|\bor\b)))?
+""", re.IGNORECASE | re.VERBOSE)
+'''
+Matches experience mentions like "5 years", "3-5 yrs", "(7+) years of relevant experience in Python", "at least 2 years"
+'''
+
+EXPERIENCE_EXAMPLES = [
+    ("5 years", 5, 5),
+    ("5+ years of experience", 5, 5),
+    ("3-5 yrs of Java experience", 3, 5),
+    ("3 to 5 years", 3, 5),
+    ("(5) years of experience", 5, 5),
+    ("(7+) years of relevant experience in Python", 7, 7),
+    ("(3-5) years of experience", 3, 5),
+    ("1.5 years of experience", 1.5, 1.5),
+    ("at least 2.5 yrs", 2.5, 2.5),
+    ("at least 2 years", 2, 2),
+    ("In business for 50 years. 3+ years of experience required", 3, 3),
+    ("Version 2.5 of our product", None, None),
+]
+'''
+Descriptions and the (min, max) years `parse_experience()` must find in them, see `python -m modules.filters check`
+'''
+
+
+def parse_years(text: str) -> int | float:
+    years = float(text)
+    return int(years) if years.is_integer() else years
+
+
+def parse_experience(text: str) -> dict:
+    '''
+    Function to parse experience requirements from a job description in a single pass.
+    * Returns a dict of
+      - `min: int | float | None`, years required ("1.5 years" gives 1.5), `None` if not mentioned
+      - `max: int | float | None`, upper bound of the requirement ("3-5 years" gives 5)
+      - `source: dict | None`, the mention `min` came from
+      - `mentions: list[dict]` of every mention found, each having `min`, `max`, `plus`, `qualifier`, `skill`,
+        `span` (start, end in `text`), `text`, `explicit` (says "experience", has a qualifier or skill) and `plausible`
+    * If some mentions are explicit, only those are used, so "in business for 10 years" doesn't count next to "3+ years of experience"
+    '''
+    mentions = []
+    for match in EXPERIENCE_PATTERN.finditer(text):
+        low, high = parse_years(match["min"]), parse_years(match["max"]) if match["max"] else None
+        if high is not None and high < low: high = None
+        qualifier = " ".join(match["qualifier"].lower().split()) if match["qualifier"] else None
+        skill = (match["lead_skill"] or match["skill"] or "").strip() or None
+        mentions.append({
+            "min": low, "max": high, "plus": bool(match["plus"]), "qualifier": qualifier, "skill": skill,
+            "span": match.span(), "text": match.group(0).strip(),
+            "explicit": bool(match["context"] or qualifier or skill),
+            "plausible": low <= MAX_EXPERIENCE_YEARS,
+        })
+    candidates = [mention for mention in mentions if mention["plausible"]]
+    if any(mention["explicit"] for mention in candidates):
+        candidates = [mention for mention in candidates if mention["explicit"]]
+    if not candidates:
+        return {"min": None, "max": None, "source": None, "mentions": mentions}
+    source = max(candidates, key=lambda mention: mention["min"])
+    upper = max((mention["max"] or mention["min"]) for mention in candidates)
+    return {"min": source["min"], "max": upper, "source": source, "mentions": mentions}
+
+
+def parse_experience_batch(texts: list[str]) -> list[dict]:
+    '''
+    Function to run `parse_experience()` over many descriptions, e.g. the whole offline corpus
+    '''
+    parse = parse_experience
+    return [parse(text or "") for text in texts]
+
+
+def extract_years_of_experience(text: str) -> int | float | None:
+    '''
+    Function to extract years of experience required from About Job, returns `None` if not mentioned
+    '''
+    return parse_experience(text)["min"]
+
+
+def evaluate_description(description: str) -> dict:
+    '''
+    Function to apply bad words, security clearance and experience rules to a job description.
+    * Returns a dict of
+      - `skip: bool`, `reason: str | None` and `message: str | None` if the job should be skipped
+      - `rule: str | None`, short name of the rule that skipped it (`bad_words`, `clearance` or `experience`)
+      - `experience_required: int | 'Unknown'`
+      - `experience_found: bool`, `False` if description doesn't mention years of experience
+      - `experience: dict | None`, result of `parse_experience()` if it was run
+      - `bad_words: list[str]` found in description
+      - `found_masters: bool`, if "master" was found and `did_masters = True`
+    '''
+    result = {"skip": False, "reason": None, "message": None, "rule": None, "experience_required": "Unknown",
+              "experience_found": False, "experience": None, "bad_words": bad_words_matcher.find_all(description), "found_masters": False}
+    description_low = description.lower()
+    if result["bad_words"]:
+        result.update(skip=True, rule="bad_words", reason="Found a Bad Word in About Job",
+                      message=f'\n{description}\n\nContains bad words {result["bad_words"]}. Skipping this job!\n')
+    elif security_clearance == False and ('polygraph' in description_low or 'clearance' in description_low or 'secret' in description_low):
+        result.update(skip=True, rule="clearance", reason="Asking for Security clearance",
+                      message=f'\n{description}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n')
+    else:
+        result["found_masters"] = did_masters and 'master' in description_low
+        allowed_experience = current_experience + (2 if result["found_masters"] else 0)
+        experience = result["experience"] = parse_experience(description)
+        result["experience_found"] = experience["min"] is not None
+        result["experience_required"] = experience["min"] or 0
+        if current_experience > -1 and result["experience_required"] > allowed_experience:
+            result.update(skip=True, rule="experience", reason="Required experience is high",
+                          message=f'\n{description}\n\nExperience required {result["experience_required"]} ("{experience["source"]["text"]}") > Current Experience {allowed_experience}. Skipping this job!\n')
+    return result
+#>
+
+
+#< Benchmark
+def load_descriptions() -> list[str]:
+    '''
+    Function to load "About Job" texts of applied jobs from the application store
+    '''
+    from modules.storage import get_connection
+    return [row[0] for row in get_connection().execute("SELECT about_job FROM applied_jobs WHERE about_job != ''")]
+
+
+def sample_texts(count: int = 2000, seed: int = 1) -> tuple[list[str], list[str]]:
+    '''
+    Function to generate `count` job description like texts and 300 made up words, when no descriptions are stored
+    '''
+    from random import Random
+    from string import ascii_lowercase
+    rng = Random(seed)
+    vocabulary = ["".join(rng.choice(ascii_lowercase) for _ in range(rng.randint(4, 12))) for _ in range(3000)]
+    texts = [" ".join(rng.choice(vocabulary) for _ in range(400)) + " Looking for PHP and .NET developers." for _ in range(count)]
+    return texts, rng.sample(vocabulary, 300)
+
+
+def benchmark_matcher(name: str, words: list[str], matcher: KeywordMatcher, texts: list[str]) -> None:
+    '''
+    Function to print time taken by `matcher` versus checking each word with `in`, and how often each word matched
+    '''
+    started = perf_counter()
+    naive_hits = 0
+    for text in texts:
+        lowered = text.lower()
+        naive_hits += sum(1 for word in words if word.lower() in lowered)
+    naive_time = perf_counter() - started
+
+    started = perf_counter()
+    hits = {}
+    for text in texts:
+        for word in matcher.find_all(text): hits[word] = hits.get(word, 0) + 1
+    matcher_time = perf_counter() - started
+
+    print(f"{name}: {len(words)} words, {len(texts)} texts")
+    print(f"  Naive loop:  {naive_time * 1000:9.1f} ms ({naive_hits} hits)")
+    print(f"  Matcher:     {matcher_time * 1000:9.1f} ms ({sum(hits.values())} hits, {naive_time / matcher_time if matcher_time else 0:.1f}x)")
+    for word, count in sorted(hits.items(), key=lambda item: -item[1])[:10]:
+        print(f"    {count:6} {word}")
+
+
+if __name__ == "__main__":
+    import sys
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "check":
+        failed = 0
+        for text, low, high in EXPERIENCE_EXAMPLES:
+            result = parse_experience(text)
+            if (result["min"], result["max"]) != (low, high):
+                failed += 1
+                print(f'FAILED "{text}": expected {low}-{high}, got {result["min"]}-{result["max"]}')
+        print(f"{len(EXPERIENCE_EXAMPLES) - failed}/{len(EXPERIENCE_EXAMPLES)} experience examples passed")
+        sys.exit(1 if failed else 0)
+    elif command == "benchmark":
+        texts = load_descriptions()
+        generated, many_words = sample_texts()
+        if not texts:
+            print("No stored job descriptions found, using generated ones.")
+            texts = generated
+        benchmark_matcher("bad_words", bad_words, bad_words_matcher, texts)
+        benchmark_matcher("about_company_bad_words", about_company_bad_words, about_company_bad_words_matcher, texts)
+        many_words = bad_words + many_words
+        benchmark_matcher(f"{len(many_words)} words", many_words, KeywordMatcher(many_words), texts)
+        benchmark_matcher(f"{len(many_words)} whole words", many_words, KeywordMatcher(many_words, True), texts)
+    else:
+        print(__doc__)
+#>
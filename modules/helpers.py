@@ -16,8 +16,10 @@ version:    24.12.29.12.30
 # Imports
 
 import os
+import re
 import sys
 import json
+import atexit
 import pathlib
 
 from time import sleep
@@ -26,7 +28,9 @@ from datetime import datetime, timedelta
 from pyautogui import alert
 from pprint import pprint
 
-from config import logs_folder_path
+from config import logs_folder_path, log_max_size_mb, log_backup_count
+from modules.log_writer import LogWriter
+from modules.pacing import stats as pacing_stats, random_delay
 
 
 
@@ -99,8 +103,10 @@ def find_default_profile_directory() -> str | None:
 def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
     '''
     Function to log and print critical errors along with datetime stamp
+    * Flushes the log file, so nothing is lost if the browser or bot crashes next
     '''
     print_lg(possible_reason, stack_trace, datetime.now(), from_critical=True)
+    flush_logs()
 
 
 def get_log_path():
@@ -116,22 +122,40 @@ def get_log_path():
 
 
 __logs_file_path = get_log_path()
+__log_writer = LogWriter(__logs_file_path, max_bytes=int(log_max_size_mb * 1024 * 1024), backup_count=log_backup_count)
 
 
 def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages are written to log.txt by a background writer, use `flush_logs()` to force them to disk
     '''
     try:
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            __log_writer.write(str(message) + end)
     except Exception as e:
         trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
         alert(f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}", "Failed Logging")
         if not from_critical:
             critical_error_log("Log.txt is open or is occupied by another program!", e)
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    '''
+    Function to block until all logged messages are written to log.txt
+    '''
+    return __log_writer.flush(timeout)
+
+
+def close_logs() -> None:
+    '''
+    Function to flush all logged messages and stop the log writer, call once at shutdown
+    '''
+    __log_writer.close()
+
+
+atexit.register(close_logs)
 #>
 
 
@@ -143,15 +167,20 @@ def buffer(speed: int=0) -> None:
       - `0.6 to 1.0 secs` if `1 <= speed < 2`
       - `1.0 to 1.8 secs` if `2 <= speed < 3`
       - `1.8 to speed secs` if `3 <= speed`
+    * Time slept is recorded in `modules.pacing.stats`, prefer `modules.pacing.settle()` when a driver is at hand
     '''
-    if speed<=0:
-        return
-    elif speed <= 1 and speed < 2:
-        return sleep(randint(6,10)*0.1)
-    elif speed <= 2 and speed < 3:
-        return sleep(randint(10,18)*0.1)
-    else:
-        return sleep(randint(18,round(speed)*10)*0.1)
+    seconds = random_delay(speed)
+    if seconds <= 0: return
+    sleep(seconds)
+    pacing_stats.record_sleep(seconds)
+    
+
+def normalize_text(text: str) -> str:
+    '''
+    Function to normalize text for comparisons and cache keys.
+    * Lower cases, replaces punctuation with spaces and collapses whitespace, "Years of Python?*" -> "years of python"
+    '''
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
     
 
 def manual_login_retry(is_logged_in: callable, limit: int = 2) -> None:
@@ -0,0 +1,333 @@
+"""
+Applications History Index for LinkedIn Auto Job Applier
+
+In-process index over the applied jobs in the application store (`modules/storage.py`), used by the job history web UI (`app.py`).
+* Rows are read again only when another process (the bot) committed to the database
+* Only the columns the UI needs are kept in memory, "About Job" blobs are never loaded
+* Supports sorting, filtering and keyset (cursor) pagination
+* Edits from the UI are saved in the database, and in a sidecar journal (`<csv>.edits.jsonl`) of the CSV export
+  that is compacted into it periodically
+* `file_lock()` guards every write to the CSV and journal, it's shared with the bot process
+"""
+
+import os
+import sys
+import csv
+import json
+import base64
+import tempfile
+import threading
+
+from time import sleep, monotonic
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from contextlib import contextmanager
+from typing import Iterator
+
+
+csv.field_size_limit(1000000)  # History rows can carry "About Job" blobs larger than default 131KB
+
+
+INDEXED_FIELDS = {
+    'Job ID': 'Job_ID',
+    'Title': 'Title',
+    'Company': 'Company',
+    'Work Style': 'Work_Style',
+    'HR Name': 'HR_Name',
+    'HR Link': 'HR_Link',
+    'Job Link': 'Job_Link',
+    'External Job link': 'External_Job_link',
+    'Date Posted': 'Date_Posted',
+    'Date Applied': 'Date_Applied',
+}
+'''
+Maps CSV header names (see `storage.APPLIED_FIELDS` for database columns) to the keys returned by the API
+'''
+
+SORT_FIELDS = {
+    'row': None,
+    'date_applied': 'Date_Applied',
+    'date_posted': 'Date_Posted',
+    'company': 'Company',
+    'title': 'Title',
+    'external_job_link': 'External_Job_link',
+}
+'''
+Sort keys accepted by `HistoryIndex.query()`, `row` keeps the order jobs were applied in
+'''
+
+
+COMPACT_AFTER_BYTES = 64 * 1024
+'''
+Size of the edits journal after which `append_edit()` folds it back into the CSV (roughly 500 edits)
+'''
+
+
+#< File locking and edits journal
+@contextmanager
+def file_lock(path: str, timeout: float = 30.0):
+    '''
+    Context manager holding an exclusive inter-process lock for `path` (via `<path>.lock`).
+    * Raises `TimeoutError` if the lock isn't acquired within `timeout` seconds
+    '''
+    lock_path = path + ".lock"
+    folder = os.path.dirname(lock_path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    handle = open(lock_path, 'a+')
+    deadline = monotonic() + timeout
+    try:
+        while True:
+            try:
+                if sys.platform.startswith('win'):
+                    import msvcrt
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if monotonic() > deadline: raise TimeoutError(f'Timed out waiting for lock on "{path}"')
+                sleep(0.05)
+        yield
+    finally:
+        try:
+            if sys.platform.startswith('win'):
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        except OSError: pass
+        handle.close()
+
+
+def journal_path(path: str) -> str:
+    return path + ".edits.jsonl"
+
+
+def read_edits(path: str, offset: int = 0) -> tuple[list[dict], int]:
+    '''
+    Reads edits journal of CSV `path` starting at byte `offset`.
+    * Returns a tuple of (edits, offset after the last complete line)
+    '''
+    edits = []
+    try:
+        with open(journal_path(path), 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"): break  # Partially written line, read it next time
+                offset += len(line)
+                try: edits.append(json.loads(line))
+                except json.JSONDecodeError: pass
+    except FileNotFoundError:
+        pass
+    return edits, offset
+
+
+def append_edit(path: str, job_id: str, field: str, value: str) -> None:
+    '''
+    Records that `field` of job `job_id` in CSV `path` changed to `value`, without rewriting the CSV.
+    * Compacts the journal into the CSV once it grows past `COMPACT_AFTER_BYTES`
+    '''
+    line = json.dumps({"job_id": job_id, "field": field, "value": value, "at": str(datetime.now())}) + "\n"
+    with file_lock(path):
+        with open(journal_path(path), 'a', encoding='utf-8') as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+            journal_size = file.tell()
+    if journal_size >= COMPACT_AFTER_BYTES:
+        compact_edits(path)
+
+
+def compact_edits(path: str) -> int:
+    '''
+    Folds the edits journal into the CSV `path` with one atomic rewrite and removes the journal.
+    * Returns the number of edits applied
+    '''
+    with file_lock(path):
+        edits, _ = read_edits(path)
+        if not edits: return 0
+        latest = {}
+        for edit in edits: latest[(edit["job_id"], edit["field"])] = edit["value"]
+        folder = os.path.dirname(path) or "."
+        with open(path, 'r', encoding='utf-8', newline='') as source, tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', dir=folder, delete=False) as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+            header = next(reader, [])
+            writer.writerow(header)
+            id_column = header.index('Job ID') if 'Job ID' in header else 0
+            for row in reader:
+                for column, field in enumerate(header):
+                    key = (row[id_column] if id_column < len(row) else None, field)
+                    if key in latest and column < len(row): row[column] = latest[key]
+                writer.writerow(row)
+        os.replace(target.name, path)
+        os.remove(journal_path(path))
+    return len(edits)
+#>
+
+
+def encode_cursor(sort_value: str | int, job_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, job_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str | int, str]:
+    '''
+    Decodes a cursor returned by `HistoryIndex.query()`, raises `ValueError` if it's invalid
+    '''
+    try:
+        sort_value, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, str(job_id)
+    except Exception as e:
+        raise ValueError(f'Invalid cursor "{cursor}"') from e
+
+
+class HistoryIndex:
+    '''
+    Lazily (re)loaded index of applied jobs in the application store
+    * Takes in `csv_path`, the CSV export edits are also journaled to, if it exists
+    '''
+    def __init__(self, csv_path: str | None = None) -> None:
+        self.path = csv_path
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._rows: list[dict] = []
+        self._by_id: dict[str, dict] = {}
+        self._sorted: dict[str, tuple[list[tuple], list[dict]]] = {}
+
+
+    def _ensure_loaded(self) -> None:
+        '''
+        Reloads applied jobs if the database changed since the last load (`PRAGMA data_version`)
+        '''
+        from modules.storage import get_connection, APPLIED_FIELDS
+        with self._lock:
+            connection = get_connection()
+            version = connection.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._version: return
+            columns = [APPLIED_FIELDS[header] for header in INDEXED_FIELDS]
+            rows = []
+            for position, *values in connection.execute(f"SELECT rowid, {', '.join(columns)} FROM applied_jobs ORDER BY rowid"):
+                record = {key: value or "" for key, value in zip(INDEXED_FIELDS.values(), values)}
+                record['_row'] = position
+                rows.append(record)
+            self._rows = rows
+            self._by_id = {row['Job_ID']: row for row in rows}
+            self._sorted = {}
+            self._version = version
+
+
+    def update(self, job_id: str, field: str, value: str) -> bool:
+        '''
+        Updates `field` (CSV header name) of job `job_id` in the database, and in the CSV export's edits journal.
+        * Returns `False` if the Job ID is not in the history
+        '''
+        from modules.storage import get_connection, APPLIED_FIELDS
+        if self.get(job_id) is None: return False
+        with self._lock:
+            connection = get_connection()
+            with connection:
+                connection.execute(f"UPDATE applied_jobs SET {APPLIED_FIELDS[field]} = ? WHERE job_id = ?", (value, job_id))
+            row = self._by_id.get(job_id)
+            if row is not None and field in INDEXED_FIELDS:
+                row[INDEXED_FIELDS[field]] = value
+                if INDEXED_FIELDS[field] in SORT_FIELDS.values(): self._sorted = {}
+        if self.path and os.path.exists(self.path):
+            append_edit(self.path, job_id, field, value)
+        return True
+
+
+    def _sorted_view(self, sort: str) -> tuple[list[tuple], list[dict]]:
+        '''
+        Returns `(keys, rows)` sorted by `sort`, built once per reload, call with `_lock` held
+        '''
+        view = self._sorted.get(sort)
+        if view is None:
+            field = SORT_FIELDS[sort]
+            key = (lambda row: (row['_row'], row['Job_ID'])) if field is None else (lambda row: (row[field].lower(), row['Job_ID']))
+            rows = sorted(self._rows, key=key)
+            view = ([key(row) for row in rows], rows)
+            self._sorted[sort] = view
+        return view
+
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        with self._lock: return len(self._rows)
+
+
+    def get(self, job_id: str) -> dict | None:
+        self._ensure_loaded()
+        return self._by_id.get(job_id)
+
+
+    def iter_rows(self, sort: str = 'row', order: str = 'asc', cursor: str | None = None,
+                  company: str | None = None, work_style: str | None = None,
+                  date_from: str | None = None, date_to: str | None = None) -> Iterator[dict]:
+        '''
+        Yields matching rows in the requested order, starting after `cursor` if given.
+        * `company` is a case-insensitive substring match
+        * `work_style` is a case-insensitive exact match (Remote, On-site, Hybrid)
+        * `date_from` and `date_to` are inclusive `YYYY-MM-DD` bounds on "Date Applied", pending rows are excluded
+        '''
+        if sort not in SORT_FIELDS:
+            raise ValueError(f'Invalid sort "{sort}", must be one of {list(SORT_FIELDS)}')
+        if order not in ('asc', 'desc'):
+            raise ValueError(f'Invalid order "{order}", must be "asc" or "desc"')
+        self._ensure_loaded()
+        with self._lock:
+            keys, rows = self._sorted_view(sort)
+
+        if cursor:
+            position = tuple(decode_cursor(cursor))
+            indexes = range(bisect_right(keys, position), len(rows)) if order == 'asc' else range(bisect_left(keys, position) - 1, -1, -1)
+        else:
+            indexes = range(len(rows)) if order == 'asc' else range(len(rows) - 1, -1, -1)
+
+        company = company.lower() if company else None
+        work_style = work_style.lower() if work_style else None
+        for index in indexes:
+            row = rows[index]
+            if company and company not in row['Company'].lower(): continue
+            if work_style and work_style != row['Work_Style'].lower(): continue
+            if date_from or date_to:
+                applied = row['Date_Applied'][:10]
+                if not applied[:1].isdigit(): continue
+                if date_from and applied < date_from: continue
+                if date_to and applied > date_to: continue
+            yield row
+
+
+    def count(self, **filters) -> int:
+        '''
+        Returns the number of rows matching `filters` (same as `iter_rows()`), regardless of pagination
+        '''
+        if not any(filters.values()): return len(self)
+        return sum(1 for _ in self.iter_rows(**filters))
+
+
+    def query(self, limit: int = 100, sort: str = 'row', order: str = 'asc', cursor: str | None = None, **filters) -> tuple[list[dict], str | None, int]:
+        '''
+        Returns a page of `(jobs, next_cursor, total)`, `next_cursor` is `None` on the last page.
+        * Takes the same filters as `iter_rows()`, `total` is the number of jobs matching them
+        '''
+        page = []
+        next_cursor = None
+        for row in self.iter_rows(sort, order, cursor, **filters):
+            if len(page) == limit:
+                last = page[-1]
+                key = last['_row'] if SORT_FIELDS[sort] is None else last[SORT_FIELDS[sort]].lower()
+                next_cursor = encode_cursor(key, last['Job_ID'])
+                break
+            page.append(row)
+        return [public_row(row) for row in page], next_cursor, self.count(**filters)
+
+
+def public_row(row: dict) -> dict:
+    '''
+    Strips index-only keys from a row before it is returned by the API
+    '''
+    return {key: value for key, value in row.items() if not key.startswith('_')}
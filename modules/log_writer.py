@@ -0,0 +1,154 @@
+"""
+Buffered Log Writer for LinkedIn Auto Job Applier
+
+Writes log messages from a background thread, so `print_lg()` never opens the log file on the hot path.
+* Messages go through a bounded queue (callers block briefly when it is full, nothing is dropped)
+* The file is flushed when the buffer grows past `flush_bytes` or every `flush_interval` seconds
+* The file is rotated to `log.1.txt`, `log.2.txt`... once it grows past `max_bytes` (UTF-8 bytes, not characters)
+* While the file can't be written (locked by another program), at most `max_bytes` are kept buffered, oldest messages are dropped
+"""
+
+import os
+import sys
+import queue
+import threading
+
+from time import monotonic
+from collections import deque
+
+
+class LogWriter:
+    '''
+    Background writer thread owning a single open handle to the log file
+    '''
+    def __init__(self, path: str, max_bytes: int = 10_000_000, backup_count: int = 3,
+                 flush_interval: float = 1.0, flush_bytes: int = 64 * 1024, queue_size: int = 10_000) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._size = 0
+        self._buffer: deque[bytes] = deque()
+        self._buffered = 0
+        self._dropped = 0
+        self._last_flush = monotonic()
+        self._failed = False
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+
+    def write(self, text: str) -> None:
+        '''
+        Queues `text` to be written, blocks only if the queue is full
+        '''
+        if self._thread.is_alive(): self._queue.put(text)
+        else: self._write_now(text)
+
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        '''
+        Blocks until every message queued so far is written to disk.
+        * Returns `False` if the writer didn't finish within `timeout` seconds
+        '''
+        if not self._thread.is_alive(): return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+
+    def close(self, timeout: float = 5.0) -> None:
+        '''
+        Flushes all pending messages and stops the writer thread
+        '''
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = ""
+            if item is None:
+                self._flush_buffer()
+                self._close_file()
+                return
+            if isinstance(item, threading.Event):
+                self._flush_buffer()
+                item.set()
+                continue
+            if item:
+                data = item.encode("utf-8", "replace")
+                self._buffer.append(data)
+                self._buffered += len(data)
+                if self._failed: self._cap_buffer()
+            if self._buffered >= self.flush_bytes or monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_buffer()
+
+
+    def _cap_buffer(self) -> None:
+        '''
+        Drops oldest buffered messages past `max_bytes`, only happens while the log file can't be written
+        '''
+        limit = self.max_bytes if self.max_bytes > 0 else 10_000_000
+        while self._buffered > limit and len(self._buffer) > 1:
+            self._buffered -= len(self._buffer.popleft())
+            self._dropped += 1
+
+
+    def _flush_buffer(self) -> None:
+        self._last_flush = monotonic()
+        if not self._buffer: return
+        if self._dropped:
+            self._buffer.appendleft(f"[Log writer dropped {self._dropped} messages while the log file couldn't be written]\n".encode())
+        try:
+            self._write_now(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+            self._dropped = 0
+            self._failed = False
+        except Exception as e:
+            # Keep messages buffered and retry on next flush, log file might be locked by another program
+            if self._dropped: self._buffer.popleft()
+            if not self._failed:
+                print(f'Failed writing to "{self.path}", will keep retrying! {e}', file=sys.stderr)
+            self._failed = True
+
+
+    def _write_now(self, data: bytes | str) -> None:
+        if isinstance(data, str): data = data.encode("utf-8", "replace")
+        if self._file is None: self._open_file()
+        if self.max_bytes > 0 and self._size + len(data) > self.max_bytes and self._size > 0:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+
+    def _open_file(self) -> None:
+        folder = os.path.dirname(self.path)
+        if folder: os.makedirs(folder, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._size = self._file.seek(0, os.SEEK_END)
+
+
+    def _rotate(self) -> None:
+        self._close_file()
+        root, ext = os.path.splitext(self.path)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{root}.{index}{ext}"
+            if os.path.exists(source): os.replace(source, f"{root}.{index + 1}{ext}")
+        if self.backup_count > 0: os.replace(self.path, f"{root}.1{ext}")
+        else: os.remove(self.path)
+        self._open_file()
+
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try: self._file.close()
+            finally: self._file = None
@@ -12,55 +12,225 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 '''
 
+import os
+import re
+import sys
+import shutil
+import hashlib
+import subprocess
+
+from time import perf_counter
 from modules.helpers import make_directories
 from config import (
     run_in_background, stealth_mode, disable_extensions, safe_mode,
     file_name, failed_file_name, logs_folder_path, generated_resume_path,
-    default_resume_path
+    default_resume_path, chromedriver_cache_path
 )
-if stealth_mode:
-    import undetected_chromedriver as uc
-else: 
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    # from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
 
-try:
-    make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
-
-    # Set up WebDriver with Chrome Profile
-    options = uc.ChromeOptions() if stealth_mode else Options()
-    if run_in_background:   options.add_argument("--headless")
-    if disable_extensions:  options.add_argument("--disable-extensions")
-
-    print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
-    if safe_mode: 
-        print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
-    else:
-        profile_dir = find_default_profile_directory()
-        if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
-        else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
-    if stealth_mode:
-        # try: 
-        #     driver = uc.Chrome(driver_executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe", options=options)
-        # except (FileNotFoundError, PermissionError) as e: 
-        #     print_lg("(Undetected Mode) Got '{}' when using pre-installed ChromeDriver.".format(type(e).__name__)) 
-            print_lg("Downloading Chrome Driver... This may take some time. Undetected mode requires download every run!")
-            driver = uc.Chrome(options=options)
-    else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
-    driver.maximize_window()
-    wait = WebDriverWait(driver, 5)
-    actions = ActionChains(driver)
-except Exception as e:
-    msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
-    if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
-    print_lg(msg)
-    critical_error_log("In Opening Chrome", e)
-    from pyautogui import alert
-    alert(msg, "Error in opening chrome")
-    try: driver.quit()
-    except NameError: exit()
-    
+
+
+#< Chrome driver cache
+def get_chrome_major_version() -> int | None:
+    '''
+    Function to find the major version of installed Google Chrome, returns `None` if not found
+    '''
+    try:
+        if sys.platform.startswith('win'):
+            import winreg
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                        return int(winreg.QueryValueEx(key, "version")[0].split(".")[0])
+                except OSError: pass
+            return None
+        commands = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"] if sys.platform == 'darwin' else ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+        for command in commands:
+            try:
+                output = subprocess.run([command, "--version"], capture_output=True, text=True, timeout=10).stdout
+            except (OSError, subprocess.SubprocessError): continue
+            match = re.search(r"(\d+)\.\d+\.\d+", output)
+            if match: return int(match.group(1))
+    except Exception as e:
+        print_lg("Failed to detect Google Chrome version!", e)
+    return None
+
+
+def file_sha256(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def get_cached_driver_path(chrome_version: int) -> str:
+    cache_dir = os.path.join(os.path.expanduser(chromedriver_cache_path), str(chrome_version))
+    return os.path.join(cache_dir, "chromedriver.exe" if sys.platform.startswith('win') else "chromedriver")
+
+
+def get_cached_driver(chrome_version: int | None) -> str | None:
+    '''
+    Function to get the cached (already patched) Chrome driver for `chrome_version`.
+    * Returns `None` if not cached or if its checksum doesn't match, so it will be downloaded again
+    '''
+    if not chrome_version: return None
+    path = get_cached_driver_path(chrome_version)
+    try:
+        with open(path + ".sha256", 'r') as file:
+            if file.read().strip() == file_sha256(path): return path
+        print_lg(f'Cached Chrome driver "{path}" failed checksum validation, downloading again!')
+    except FileNotFoundError: pass
+    except Exception as e:
+        print_lg("Failed to validate cached Chrome driver!", e)
+    return None
+
+
+def cache_driver(chrome_version: int | None, executable_path: str | None) -> None:
+    '''
+    Function to copy a downloaded Chrome driver into the cache, along with its checksum
+    '''
+    if not chrome_version or not executable_path or not os.path.exists(executable_path): return
+    try:
+        path = get_cached_driver_path(chrome_version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copy2(executable_path, path + ".tmp")
+        os.chmod(path + ".tmp", 0o755)
+        os.replace(path + ".tmp", path)
+        with open(path + ".sha256", 'w') as file:
+            file.write(file_sha256(path))
+        print_lg(f'Cached Chrome driver for Chrome {chrome_version} at "{path}"')
+    except Exception as e:
+        print_lg("Failed to cache Chrome driver, it will be downloaded again next run!", e)
+#>
+
+
+def print_startup_timings(timings: dict[str, float]) -> None:
+    '''
+    Function to print a breakdown of where browser startup time went
+    '''
+    print_lg("Browser startup timings:")
+    for stage, seconds in timings.items():
+        print_lg(f"  {stage:<20} {seconds:6.2f} s")
+    print_lg(f"  {'Total':<20} {sum(timings.values()):6.2f} s")
+
+
+def open_browser() -> tuple[WebDriver, WebDriverWait, ActionChains]:
+    '''
+    Function to launch Chrome with the user's profile.
+    * Returns a tuple of (driver, wait, actions)
+    * Shows an alert and raises `SystemExit` if Chrome couldn't be opened
+    '''
+    driver = None
+    try:
+        make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
+        startup_timings = {}
+
+        # Set up WebDriver with Chrome Profile
+        started = perf_counter()
+        if stealth_mode:
+            import undetected_chromedriver as uc
+            options = uc.ChromeOptions()
+        else:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            # from selenium.webdriver.chrome.service import Service
+            options = Options()
+        if run_in_background:   options.add_argument("--headless")
+        if disable_extensions:  options.add_argument("--disable-extensions")
+
+        print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
+        if safe_mode: 
+            print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
+        else:
+            profile_dir = find_default_profile_directory()
+            if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
+            else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
+        startup_timings["Chrome options"] = perf_counter() - started
+        if stealth_mode:
+            started = perf_counter()
+            chrome_version = get_chrome_major_version()
+            cached_driver = get_cached_driver(chrome_version)
+            startup_timings["Driver resolution"] = perf_counter() - started
+            started = perf_counter()
+            if cached_driver:
+                print_lg(f'Using cached Chrome driver for Chrome {chrome_version}: "{cached_driver}"')
+                driver = uc.Chrome(options=options, driver_executable_path=cached_driver, version_main=chrome_version)
+            else:
+                print_lg("Downloading Chrome Driver... This may take some time. It will be cached for next runs!")
+                driver = uc.Chrome(options=options, version_main=chrome_version)
+                cache_driver(chrome_version, getattr(getattr(driver, "patcher", None), "executable_path", None))
+        else: 
+            started = perf_counter()
+            driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
+        startup_timings["Browser launch"] = perf_counter() - started
+        started = perf_counter()
+        driver.maximize_window()
+        wait = WebDriverWait(driver, 5)
+        actions = ActionChains(driver)
+        startup_timings["Window setup"] = perf_counter() - started
+        print_startup_timings(startup_timings)
+        return driver, wait, actions
+    except Exception as e:
+        msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
+        if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+        print_lg(msg)
+        critical_error_log("In Opening Chrome", e)
+        from pyautogui import alert
+        alert(msg, "Error in opening chrome")
+        try: 
+            if driver: driver.quit()
+        except Exception: pass
+        raise SystemExit(1)
+
+
+class BrowserSession:
+    '''
+    Lazily opened browser session, Chrome is launched on first access of `driver`, `wait` or `actions`.
+    * Use `with BrowserSession() as session:` or call `close()` to quit the browser
+    '''
+    def __init__(self) -> None:
+        self._driver: WebDriver | None = None
+        self._wait: WebDriverWait | None = None
+        self._actions: ActionChains | None = None
+
+    def open(self) -> "BrowserSession":
+        if self._driver is None:
+            self._driver, self._wait, self._actions = open_browser()
+        return self
+
+    @property
+    def is_open(self) -> bool:
+        return self._driver is not None
+
+    @property
+    def driver(self) -> WebDriver:
+        return self.open()._driver
+
+    @property
+    def wait(self) -> WebDriverWait:
+        return self.open()._wait
+
+    @property
+    def actions(self) -> ActionChains:
+        return self.open()._actions
+
+    def close(self) -> None:
+        if self._driver is not None:
+            try: self._driver.quit()
+            finally: self._driver = self._wait = self._actions = None
+
+    def __enter__(self) -> "BrowserSession":
+        return self.open()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+session = BrowserSession()
+'''
+Shared browser session of the bot, nothing is launched until it's first used
+'''
@@ -0,0 +1,340 @@
+'''
+Option Matcher for LinkedIn Auto Job Applier
+
+Finds which option of a select or radio question best fits an answer, without a browser round-trip per comparison.
+* Options are normalized once and indexed by exact text, prefix (sorted list) and tokens, matchers are reused for the same options
+* `match()` tries the answer itself first: exact text, normalized text, prefix, all answer tokens in the option and containment
+  (as whole words, then at the start of a word like "No" in "I am not a protected veteran"), then its answer phrases
+  ("Decline" -> "Prefer not"...) and finally a fuzzy score for answers of `FUZZY_MIN_LENGTH` or more characters
+* A matched select option is selected with a single script call, see `clickers_and_finders.select_by_index()`
+
+Usage:
+    python -m modules.option_matcher benchmark [--options N] [--lookups N]   # Time matcher against the old nested loop
+    python -m modules.option_matcher check                                   # Check matching against `EEO_EXAMPLES`
+'''
+
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from string import punctuation
+from functools import cached_property
+
+from modules.helpers import normalize_text
+from modules.filters import is_word_char
+
+
+PUNCTUATION = str.maketrans(punctuation, " " * len(punctuation))
+
+PLACEHOLDERS = {"select an option", "select", ""}
+'''
+Normalized texts of options that aren't answers, never matched
+'''
+
+FUZZY_CUTOFF = 0.8
+
+FUZZY_MIN_LENGTH = 4
+'''
+Shorter answers ("Yes", "No") are never fuzzy matched, a typo can't be told from a different word and scoring costs the most
+'''
+
+
+def answer_phrases(answer: str) -> list[str]:
+    '''
+    Function to get phrases an option answering `answer` may contain, "Decline" -> "Prefer not", "Yes" -> "I do"...
+    '''
+    if answer == 'Decline':
+        return ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
+    elif 'yes' in answer.lower():
+        return ["Yes", "Agree", "I do", "I have", "I identify"]
+    elif 'no' in answer.lower():
+        return ["No", "Disagree", "I don't", "I do not"]
+    return [answer, ''.join(c for c in answer if c.isalnum())]
+
+
+class OptionMatcher:
+    '''
+    Lookup of options of one question, build once per options list and `match()` answers against it.
+    * Indexes are built on first use, so an answer found by exact text costs no more than a list scan
+    '''
+    def __init__(self, options: list[str]) -> None:
+        self.options = options
+
+
+    @cached_property
+    def by_option(self) -> dict[str, int]:
+        by_option = {}
+        for index, option in enumerate(self.options): by_option.setdefault(option, index)
+        return by_option
+
+
+    @cached_property
+    def normalized(self) -> list[str]:
+        return [" ".join(option.lower().translate(PUNCTUATION).split()) for option in self.options]
+
+
+    @cached_property
+    def candidates(self) -> list[int]:
+        return [index for index, text in enumerate(self.normalized) if text not in PLACEHOLDERS]
+
+
+    @cached_property
+    def by_text(self) -> dict[str, int]:
+        by_text = {}
+        for index in self.candidates: by_text.setdefault(self.normalized[index], index)
+        return by_text
+
+
+    @cached_property
+    def sorted(self) -> list[tuple[str, int]]:
+        return sorted((self.normalized[index], index) for index in self.candidates)
+
+
+    @cached_property
+    def by_token(self) -> dict[str, set[int]]:
+        by_token = {}
+        for index in self.candidates:
+            for token in self.normalized[index].split():
+                by_token.setdefault(token, set()).add(index)
+        return by_token
+
+
+    @cached_property
+    def joined(self) -> tuple[str, list[int]]:
+        '''
+        All options in one string with the offset of each, so a phrase is searched in all of them by a single regex
+        '''
+        offsets, offset = [], 0
+        for index in self.candidates:
+            offsets.append(offset)
+            offset += len(self.normalized[index]) + 1
+        return "\n".join(self.normalized[index] for index in self.candidates), offsets
+
+
+    def _prefix(self, key: str) -> int | None:
+        position = bisect_left(self.sorted, (key, -1))
+        found = None
+        while position < len(self.sorted) and self.sorted[position][0].startswith(key):
+            index = self.sorted[position][1]
+            if found is None or index < found: found = index
+            position += 1
+        return found
+
+
+    def _tokens(self, key: str) -> int | None:
+        matches = None
+        for token in key.split():
+            indexes = self.by_token.get(token)
+            if not indexes: return None
+            matches = indexes if matches is None else matches & indexes
+            if not matches: return None
+        return min(matches) if matches else None
+
+
+    def _containing(self, phrase: str, whole_words: bool = True) -> int | None:
+        '''
+        Returns the first option containing `phrase`, or contained in it, as whole words.
+        * With `whole_words = False` the option only needs a word starting with `phrase`
+        '''
+        joined, offsets = self.joined
+        start = joined.find(phrase)
+        while start >= 0:
+            end = start + len(phrase)
+            if (start == 0 or not is_word_char(joined[start - 1])) and (not whole_words or end == len(joined) or not is_word_char(joined[end])):
+                return self.candidates[bisect_right(offsets, start) - 1]
+            start = joined.find(phrase, start + 1)
+        if not whole_words: return None
+        words = phrase.split()
+        inside = [self.by_text[" ".join(words[start:end])] for start in range(len(words)) for end in range(start + 1, len(words) + 1)
+                  if " ".join(words[start:end]) in self.by_text]
+        return min(inside) if inside else None
+
+
+    def _fuzzy(self, key: str) -> int | None:
+        '''
+        Returns the option most similar to `key` scoring at least `FUZZY_CUTOFF`.
+        * Only options having a word starting like a word of `key` are scored, typos rarely hit the first 2 letters
+        '''
+        starts = {token[:2] for token in key.split()}
+        shortlist = set()
+        for token, indexes in self.by_token.items():
+            if token[:2] in starts: shortlist |= indexes
+        scorer = SequenceMatcher()
+        scorer.set_seq2(key)
+        best, best_score = None, FUZZY_CUTOFF
+        for index in sorted(shortlist):
+            scorer.set_seq1(self.normalized[index])
+            if scorer.real_quick_ratio() < best_score or scorer.quick_ratio() < best_score: continue
+            score = scorer.ratio()
+            if score > best_score or (best is None and score == best_score):
+                best, best_score = index, score
+        return best
+
+
+    def match(self, answer: str) -> int | None:
+        '''
+        Returns index (in `options`) of the option best answering `answer`, or `None` if nothing fits
+        '''
+        if answer is None: return None
+        if answer in self.by_option: return self.by_option[answer]
+        key = normalize_text(answer)
+        if not key: return None
+        if key in self.by_text: return self.by_text[key]
+        for lookup in (self._prefix, self._tokens, self._containing):
+            index = lookup(key)
+            if index is not None: return index
+        index = self._containing(key, whole_words=False)
+        if index is not None: return index
+        phrases = [phrase for phrase in (normalize_text(phrase) for phrase in answer_phrases(answer)) if phrase and phrase != key]
+        for phrase in phrases:
+            if phrase in self.by_text: return self.by_text[phrase]
+        for phrase in phrases:
+            index = self._containing(phrase)
+            if index is not None: return index
+        return self._fuzzy(key) if len(key) >= FUZZY_MIN_LENGTH else None
+
+
+MATCHERS_CACHED = 64
+
+_matchers: dict[tuple, OptionMatcher] = {}
+
+
+def get_option_matcher(options: list[str]) -> OptionMatcher:
+    '''
+    Function to get the `OptionMatcher` of `options`, the same dropdowns (countries, phone codes...) come back in every application.
+    * Matchers are looked up by the count, first, middle and last option instead of hashing every option, then compared in full
+    '''
+    key = (len(options), options[0], options[len(options) // 2], options[-1]) if options else ()
+    matcher = _matchers.get(key)
+    if matcher is None or matcher.options != options:
+        if len(_matchers) >= MATCHERS_CACHED: del _matchers[next(iter(_matchers))]
+        matcher = _matchers[key] = OptionMatcher(list(options))
+    return matcher
+
+
+#< Examples
+VETERAN_OPTIONS = ["Select an option", "I am not a protected veteran", "I identify as one or more of the classifications of protected veteran", "I don't wish to answer"]
+DISABILITY_OPTIONS = ["Select an option", "Yes, I have a disability, or have had one in the past", "No, I don't have a disability and have not had one in the past", "I don't wish to answer"]
+GENDER_OPTIONS = ["Select an option", "Male", "Female", "Decline to self-identify"]
+RACE_OPTIONS = ["Select an option", "Asian", "Black or African American", "Hispanic or Latino", "White", "Two or More Races", "I prefer not to specify"]
+YES_NO_OPTIONS = ["Select an option", "Yes", "No"]
+
+EEO_EXAMPLES = [
+    ("No", VETERAN_OPTIONS, "I am not a protected veteran"),
+    ("Yes", VETERAN_OPTIONS, "I identify as one or more of the classifications of protected veteran"),
+    ("Decline", VETERAN_OPTIONS, "I don't wish to answer"),
+    ("No", DISABILITY_OPTIONS, "No, I don't have a disability and have not had one in the past"),
+    ("Yes", DISABILITY_OPTIONS, "Yes, I have a disability, or have had one in the past"),
+    ("Decline", DISABILITY_OPTIONS, "I don't wish to answer"),
+    ("Male", GENDER_OPTIONS, "Male"),
+    ("female", GENDER_OPTIONS, "Female"),
+    ("Decline", GENDER_OPTIONS, "Decline to self-identify"),
+    ("Decline", RACE_OPTIONS, "I prefer not to specify"),
+    ("Hispanic", RACE_OPTIONS, "Hispanic or Latino"),
+    ("Yes", YES_NO_OPTIONS, "Yes"),
+    ("No", YES_NO_OPTIONS, "No"),
+    ("Nope", YES_NO_OPTIONS, "No"),
+    ("Yes", ["Select an option", "Agree", "Disagree"], "Agree"),
+    ("No", ["Select an option", "Agree", "Disagree"], "Disagree"),
+    ("No", ["Select an option", "I do", "I do not"], "I do not"),
+    ("United States", ["Select an option", "United Kingdom (+44)", "United States (+1)"], "United States (+1)"),
+    ("Atlantis", ["Select an option", "United Kingdom (+44)", "United States (+1)"], None),
+]
+'''
+Answers `answer_questions()` gives to EEO and Yes/No dropdowns, with the option each should pick (`None` if none fits)
+'''
+
+
+def check() -> int:
+    '''
+    Function to match every answer in `EEO_EXAMPLES`, prints failures and returns how many failed
+    '''
+    failed = 0
+    for answer, options, expected in EEO_EXAMPLES:
+        index = OptionMatcher(options).match(answer)
+        found = options[index] if index is not None else None
+        if found != expected:
+            failed += 1
+            print(f'FAILED "{answer}" in {options[1:]}: expected {expected}, got {found}')
+    print(f"{len(EEO_EXAMPLES) - failed}/{len(EEO_EXAMPLES)} option examples passed")
+    return failed
+#>
+
+
+#< Benchmark
+def legacy_match(answer: str, optionsText: list[str]) -> int | None:
+    '''
+    Matching done by `answer_questions()` before `OptionMatcher`, kept only to benchmark against
+    '''
+    for index, option in enumerate(optionsText):   # select_by_visible_text(answer)
+        if option == answer: return index
+    if answer == 'Decline':
+        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
+    elif 'yes' in answer.lower():
+        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
+    elif 'no' in answer.lower():
+        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
+    else:
+        possible_answer_phrases = [answer, answer.lower(), answer.upper(), ''.join(c for c in answer if c.isalnum())]
+    for phrase in possible_answer_phrases:
+        for index, option in enumerate(optionsText):
+            if phrase.lower() in option.lower() or option.lower() in phrase.lower():
+                return index
+    return None
+
+
+def sample_dropdown(size: int) -> list[str]:
+    '''
+    Function to build a phone country code like dropdown of `size` options
+    '''
+    names = ["Afghanistan", "Argentina", "Australia", "Austria", "Bangladesh", "Belgium", "Brazil", "Canada", "Chile", "China",
+             "Colombia", "Denmark", "Egypt", "Finland", "France", "Germany", "Greece", "India", "Indonesia", "Ireland", "Israel",
+             "Italy", "Japan", "Kenya", "Mexico", "Netherlands", "New Zealand", "Nigeria", "Norway", "Pakistan", "Poland",
+             "Portugal", "Singapore", "South Africa", "Spain", "Sweden", "Switzerland", "United Kingdom", "United States", "Vietnam"]
+    options = ["Select an option"]
+    for index in range(size):
+        name = names[index % len(names)] + ("" if index < len(names) else f" Region {index // len(names)}")
+        options.append(f"{name} (+{index + 1})")
+    return options
+
+
+def benchmark(size: int = 250, lookups: int = 2000) -> None:
+    '''
+    Function to time matching answers against a `size` option dropdown, first with a new `OptionMatcher` per answer, then through `get_option_matcher()`
+    '''
+    from time import perf_counter
+    options = sample_dropdown(size)
+    answers = ["United States", "india", "United Kingdom (+38)", "Decline", "Yes", "Vietnam Region 5", "Untied States", "Atlantis"]
+    queries = [answers[index % len(answers)] for index in range(lookups)]
+
+    started = perf_counter()
+    legacy = [legacy_match(answer, options) for answer in queries]
+    legacy_time = perf_counter() - started
+
+    started = perf_counter()
+    matched = [OptionMatcher(options).match(answer) for answer in queries]
+    cold_time = perf_counter() - started
+
+    pages = [[option.encode().decode() for option in options] for _ in queries]   # Every question reads its options from the page again
+    started = perf_counter()
+    matched = [get_option_matcher(page).match(answer) for page, answer in zip(pages, queries)]
+    warm_time = perf_counter() - started
+
+    print(f"{len(options)} options, {lookups} questions")
+    print(f"  Old nested loop:       {legacy_time * 1000:9.1f} ms, {legacy_time / lookups * 1e6:7.1f} us/question, {sum(index is not None for index in legacy)} matched")
+    print(f"  New OptionMatcher:     {cold_time * 1000:9.1f} ms, {cold_time / lookups * 1e6:7.1f} us/question")
+    print(f"  Reused OptionMatcher:  {warm_time * 1000:9.1f} ms, {warm_time / lookups * 1e6:7.1f} us/question, {sum(index is not None for index in matched)} matched")
+    print("  WebDriver calls are not timed here, old matching made up to 2 per select question, OptionMatcher makes 1.")
+    for answer in answers:
+        old, new = legacy_match(answer, options), OptionMatcher(options).match(answer)
+        print(f'    "{answer}": old -> {options[old] if old is not None else None}, new -> {options[new] if new is not None else None}')
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Check or benchmark option matching of select questions")
+    parser.add_argument("command", choices=["benchmark", "check"])
+    parser.add_argument("--options", type=int, default=250, help="Options in the sample dropdown")
+    parser.add_argument("--lookups", type=int, default=2000, help="Answers to match")
+    args = parser.parse_args()
+    if args.command == "check": raise SystemExit(1 if check() else 0)
+    benchmark(args.options, args.lookups)
+#>
@@ -0,0 +1,152 @@
+"""
+Adaptive Pacing for LinkedIn Auto Job Applier
+
+Replaces fixed random sleeps after clicks and page loads with waits on the page itself.
+* `settle()` waits until `document.readyState` is "complete" and the DOM tree and network have been quiet for a moment,
+  for at most the longest `buffer(speed)` delay (and `pacing_timeout`), so it's never slower than the old sleeps
+* A short random jitter (at least `pacing_jitter_floor_ms`) is still added after every settle, so actions don't look scripted
+* Falls back to the old random `buffer()` ranges if `adaptive_pacing = False`, or for what's left of it if the page
+  can't be observed or doesn't settle in time
+* `stats` counts seconds spent sleeping versus waiting on the page, reported per application
+"""
+
+from time import sleep, perf_counter
+from random import uniform, randint
+
+from config import adaptive_pacing, pacing_jitter_floor_ms, pacing_timeout
+
+
+QUIET_MS = 250
+'''
+Milliseconds without added or removed DOM nodes or finished network requests after which a page is considered settled.
+Attribute and text changes (animations, timers, typing indicators) are ignored, LinkedIn pages never stop making those
+'''
+
+SETTLE_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const quietMs = arguments[0], timeoutMs = arguments[1];
+const started = performance.now();
+let last = started;
+const touch = () => { last = performance.now(); };
+const mutations = new MutationObserver(touch);
+mutations.observe(document, {subtree: true, childList: true});
+let network = null;
+try { network = new PerformanceObserver(touch); network.observe({type: "resource"}); } catch (e) {}
+(function check() {
+    const now = performance.now();
+    const settled = document.readyState === "complete" && now - last >= quietMs;
+    if (settled || now - started >= timeoutMs) {
+        mutations.disconnect();
+        if (network) network.disconnect();
+        done(settled);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+'''
+
+
+class PacingStats:
+    '''
+    Seconds spent sleeping (fixed or jitter delays) versus waiting for the page to settle
+    '''
+    def __init__(self) -> None:
+        self.slept = 0.0
+        self.waited = 0.0
+        self.timeouts = 0
+        self.total_slept = 0.0
+        self.total_waited = 0.0
+
+    def record_sleep(self, seconds: float) -> None:
+        self.slept += seconds
+        self.total_slept += seconds
+
+    def record_wait(self, seconds: float) -> None:
+        self.waited += seconds
+        self.total_waited += seconds
+
+    def reset(self) -> None:
+        '''
+        Starts counting for a new application, run totals are kept
+        '''
+        self.slept = 0.0
+        self.waited = 0.0
+        self.timeouts = 0
+
+    def report(self, label: str = "This application") -> str:
+        return f"{label} spent {self.slept:.1f}s sleeping and {self.waited:.1f}s waiting on the page ({self.timeouts} settle timeouts)."
+
+    def total_report(self) -> str:
+        return f"Pacing in total: {self.total_slept:.1f}s sleeping and {self.total_waited:.1f}s waiting on the page."
+
+
+stats = PacingStats()
+'''
+Pacing stats of the running bot, `helpers.buffer()` also records its sleeps here
+'''
+
+
+def random_delay(speed: float) -> float:
+    '''
+    Function to pick a random delay in the same ranges as `helpers.buffer()`
+    '''
+    if speed <= 0:  return 0.0
+    if speed < 2:   return randint(6, 10) * 0.1
+    if speed < 3:   return randint(10, 18) * 0.1
+    return randint(18, round(speed) * 10) * 0.1
+
+
+def max_delay(speed: float) -> float:
+    '''
+    Function to get the longest delay `random_delay(speed)` can pick
+    '''
+    if speed <= 0:  return 0.0
+    if speed < 2:   return 1.0
+    if speed < 3:   return 1.8
+    return max(1.8, round(speed))
+
+
+def jitter_sleep() -> None:
+    '''
+    Function to sleep a short random time between `pacing_jitter_floor_ms` and twice that
+    '''
+    floor = pacing_jitter_floor_ms / 1000
+    seconds = uniform(floor, floor * 2)
+    if seconds <= 0: return
+    sleep(seconds)
+    stats.record_sleep(seconds)
+
+
+def wait_until_settled(driver, timeout: float = pacing_timeout) -> bool:
+    '''
+    Function to wait until the page is loaded and its DOM and network are quiet.
+    * Returns `False` if the page didn't settle within `timeout` seconds or couldn't be observed
+    '''
+    started = perf_counter()
+    try:
+        settled = bool(driver.execute_async_script(SETTLE_SCRIPT, QUIET_MS, int(timeout * 1000)))
+    except Exception:
+        settled = False
+    stats.record_wait(perf_counter() - started)
+    if not settled: stats.timeouts += 1
+    return settled
+
+
+def settle(driver, speed: float = 1) -> None:
+    '''
+    Function to pause after an action until the page is ready for the next one.
+    * Waits up to `max_delay(speed)` seconds for the page to settle and adds a short jitter if `adaptive_pacing = True`
+    * Else, or if the page didn't settle, sleeps (what's left of) a random time within `helpers.buffer(speed)` ranges
+    * Won't wait at all if `speed <= 0`
+    '''
+    if speed <= 0: return
+    seconds = random_delay(speed)
+    if adaptive_pacing and driver is not None:
+        started = perf_counter()
+        if wait_until_settled(driver, min(pacing_timeout, max_delay(speed))):
+            jitter_sleep()
+            return
+        seconds -= perf_counter() - started
+    if seconds <= 0: return
+    sleep(seconds)
+    stats.record_sleep(seconds)
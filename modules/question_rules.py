@@ -0,0 +1,169 @@
+'''
+Question Rules for LinkedIn Auto Job Applier
+
+Declarative rules answering Easy Apply questions from your config, by keywords in the question label.
+* Rules of each question kind ("select", "radio", "text", "textarea") are tried in order, the first one matching answers
+* A rule matches if every group of `when` has a keyword in the label and no keyword of `unless` is in it
+* Keywords of all rules are deduplicated into one `KeywordMatcher`, each is searched in the label once (a substring find),
+  then the rules of the question's kind are checked in order against the set of keywords found
+* Hits per rule are counted for the current run, see `report()`
+'''
+
+from typing import Callable
+
+from config import (
+    first_name, middle_name, last_name, phone_number, current_city, street, state, zipcode, country,
+    gender, disability_status, veteran_status, years_of_experience, require_visa, website, linkedIn,
+    us_citizenship, desired_salary, current_ctc, notice_period, recent_employer, confidence_level,
+    linkedin_headline, linkedin_summary, cover_letter
+)
+from modules.filters import KeywordMatcher
+
+
+#< Answers derived from config
+first_name = first_name.strip()
+middle_name = middle_name.strip()
+last_name = last_name.strip()
+full_name = first_name + " " + middle_name + " " + last_name if middle_name else first_name + " " + last_name
+
+desired_salary_lakhs = str(round(desired_salary / 100000, 2))
+desired_salary_monthly = str(round(desired_salary/12, 2))
+desired_salary = str(desired_salary)
+
+current_ctc_lakhs = str(round(current_ctc / 100000, 2))
+current_ctc_monthly = str(round(current_ctc/12, 2))
+current_ctc = str(current_ctc)
+
+notice_period_months = str(notice_period//30)
+notice_period_weeks = str(notice_period//7)
+notice_period = str(notice_period)
+#>
+
+
+class Rule:
+    '''
+    One rule, `answer` is a value or a function of the question context (`work_location`, `prev_answer`)
+    '''
+    def __init__(self, name: str, kinds: tuple[str, ...], when: list[tuple[str, ...]], answer: str | Callable[[dict], str],
+                 unless: tuple[str, ...] = (), do_actions: bool = False) -> None:
+        self.name = name
+        self.kinds = kinds
+        self.when = when
+        self.unless = unless
+        self.answer = answer
+        self.do_actions = do_actions    # Pick the first typeahead suggestion after typing the answer
+
+    def matches(self, found: set[str]) -> bool:
+        return all(not found.isdisjoint(group) for group in self.when) and found.isdisjoint(self.unless)
+
+    def resolve(self, context: dict) -> str:
+        return self.answer(context) if callable(self.answer) else self.answer
+
+
+SELECT, RADIO, TEXT, TEXTAREA = ("select",), ("radio",), ("text",), ("textarea",)
+
+def city_or_work_location(context: dict) -> str:
+    return current_city if current_city else context.get("work_location", "")
+
+RULES = [
+    # Select questions
+    Rule("select_contact",      SELECT, [("email", "phone")], lambda context: context.get("prev_answer")),
+    Rule("select_gender",       SELECT, [("gender", "sex")], gender),
+    Rule("select_disability",   SELECT, [("disability",)], disability_status),
+    Rule("select_proficiency",  SELECT, [("proficiency",)], 'Professional'),
+    Rule("select_country",      SELECT, [("country",)], country),
+    Rule("select_state",        SELECT, [("state",)], state),
+    Rule("select_city",         SELECT, [("city",)], city_or_work_location),
+    Rule("select_location",     SELECT, [("location",)], lambda context: context.get("work_location", "")),
+    # Radio questions
+    Rule("radio_citizenship",   RADIO, [("citizenship", "employment eligibility")], us_citizenship),
+    Rule("radio_veteran",       RADIO, [("veteran", "protected")], veteran_status),
+    Rule("radio_disability",    RADIO, [("disability", "handicapped")], disability_status),
+    # Text questions
+    Rule("experience",          TEXT, [("experience", "years")], years_of_experience),
+    Rule("phone",               TEXT, [("phone", "mobile")], phone_number),
+    Rule("street",              TEXT, [("street",)], street),
+    Rule("city",                TEXT, [("city", "location", "address")], city_or_work_location, do_actions=True),
+    Rule("signature",           TEXT, [("signature",)], full_name),
+    Rule("full_name",           TEXT, [("name",), ("full",)], full_name),
+    Rule("first_name",          TEXT, [("name",), ("first",)], first_name, unless=("last",)),
+    Rule("middle_name",         TEXT, [("name",), ("middle",)], middle_name, unless=("last",)),
+    Rule("last_name",           TEXT, [("name",), ("last",)], last_name, unless=("first",)),
+    Rule("recent_employer",     TEXT, [("name",), ("employer",)], recent_employer),
+    Rule("name",                TEXT, [("name",)], full_name),
+    Rule("notice_months",       TEXT, [("notice",), ("month",)], notice_period_months),
+    Rule("notice_weeks",        TEXT, [("notice",), ("week",)], notice_period_weeks),
+    Rule("notice",              TEXT, [("notice",)], notice_period),
+    Rule("current_ctc_monthly", TEXT, [("salary", "compensation", "ctc", "pay"), ("current", "present"), ("month",)], current_ctc_monthly),
+    Rule("current_ctc_lakhs",   TEXT, [("salary", "compensation", "ctc", "pay"), ("current", "present"), ("lakh",)], current_ctc_lakhs),
+    Rule("current_ctc",         TEXT, [("salary", "compensation", "ctc", "pay"), ("current", "present")], current_ctc),
+    Rule("salary_monthly",      TEXT, [("salary", "compensation", "ctc", "pay"), ("month",)], desired_salary_monthly),
+    Rule("salary_lakhs",        TEXT, [("salary", "compensation", "ctc", "pay"), ("lakh",)], desired_salary_lakhs),
+    Rule("salary",              TEXT, [("salary", "compensation", "ctc", "pay")], desired_salary),
+    Rule("linkedin",            TEXT, [("linkedin",)], linkedIn),
+    Rule("website",             TEXT, [("website", "blog", "portfolio", "link")], website),
+    Rule("confidence",          TEXT, [("scale of 1-10",)], confidence_level),
+    Rule("headline",            TEXT, [("headline",)], linkedin_headline),
+    Rule("heard_from",          TEXT, [("hear", "come across"), ("this",), ("job", "position")], "https://github.com/GodsScion/Auto_job_applier_linkedIn"),
+    Rule("state",               TEXT, [("state", "province")], state),
+    Rule("zipcode",             TEXT, [("zip", "postal", "code")], zipcode, unless=("country",)),   # "Country code" isn't a zip code
+    Rule("country",             TEXT, [("country",)], country),
+    # Textarea questions
+    Rule("summary",             TEXTAREA, [("summary",)], linkedin_summary),
+    Rule("cover_letter",        TEXTAREA, [("cover",)], cover_letter),
+    # Common questions
+    Rule("visa",                ("select", "radio", "text"), [("sponsorship", "visa")], require_visa),
+]
+'''
+Rules in order of priority, see `Rule`
+'''
+
+
+class RuleTable:
+    '''
+    `rules` indexed by question kind, with their keywords searched by one shared `KeywordMatcher`
+    '''
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = rules
+        self.by_kind: dict[str, list[Rule]] = {}
+        keywords = set()
+        for rule in rules:
+            for kind in rule.kinds: self.by_kind.setdefault(kind, []).append(rule)
+            for group in rule.when: keywords.update(group)
+            keywords.update(rule.unless)
+        self.matcher = KeywordMatcher(sorted(keywords))
+        self.hits = {rule.name: 0 for rule in rules}
+        self.misses: dict[str, int] = {}
+
+
+    def match(self, kind: str, label: str, count: bool = True) -> Rule | None:
+        '''
+        Returns the first rule of `kind` matching `label` (lower case), counting the hit unless `count` is False
+        '''
+        found = set(self.matcher.find_all(label)) if label else set()
+        for rule in self.by_kind.get(kind, []):
+            if rule.matches(found):
+                if count: self.hits[rule.name] += 1
+                return rule
+        if count: self.misses[kind] = self.misses.get(kind, 0) + 1
+        return None
+
+
+    def answer(self, kind: str, label: str, default: str = "", **context) -> tuple[str, Rule | None]:
+        '''
+        Function to answer a question of `kind` labelled `label` (lower case).
+        * Takes in `context` used by some rules, `work_location` and `prev_answer`
+        * Returns a tuple of (answer, matched rule), answer is `default` if no rule matched
+        '''
+        rule = self.match(kind, label)
+        return (rule.resolve(context), rule) if rule else (default, None)
+
+
+    def report(self) -> str:
+        hit = sorted(((count, name) for name, count in self.hits.items() if count), reverse=True)
+        lines = [f"Question rules: {sum(count for count, _ in hit)} answered, {sum(self.misses.values())} unmatched {self.misses}"]
+        lines += [f"  {count:5}  {name}" for count, name in hit]
+        return "\n".join(lines)
+
+
+question_rules = RuleTable(RULES)
@@ -0,0 +1,86 @@
+"""
+Search Term Scheduler for LinkedIn Auto Job Applier
+
+Decides when each search term is searched again when `run_non_stop = True`.
+* Yield of a term is the number of new job IDs (not applied to and not seen in earlier cycles) its search listed
+* A term that yielded new jobs is due again immediately
+* A term that yielded nothing backs off exponentially, from `scheduler_min_wait` up to `scheduler_max_wait` seconds
+"""
+
+from time import monotonic
+
+from config import scheduler_min_wait, scheduler_max_wait
+
+
+class TermState:
+    '''
+    Scheduling state of one search term
+    '''
+    def __init__(self) -> None:
+        self.due_at = 0.0
+        self.empty_cycles = 0
+        self.last_yield = 0
+        self.total_yield = 0
+
+
+class TermScheduler:
+    '''
+    Schedules each search term independently based on how many new jobs it yielded last time
+    '''
+    def __init__(self, terms: list[str], min_wait: int = scheduler_min_wait, max_wait: int = scheduler_max_wait) -> None:
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.states = {term: TermState() for term in terms}
+        self.seen_job_ids: set[str] = set()
+
+
+    def observe(self, job_id: str, applied_jobs: set | None = None) -> bool:
+        '''
+        Marks `job_id` as seen, returns `True` if it's new (not seen before and not in `applied_jobs`)
+        '''
+        if job_id in self.seen_job_ids: return False
+        self.seen_job_ids.add(job_id)
+        return not applied_jobs or job_id not in applied_jobs
+
+
+    def record(self, term: str, new_jobs: int) -> float:
+        '''
+        Records the yield of a finished search for `term` and schedules its next search.
+        * Returns seconds until `term` is due again
+        '''
+        state = self.states.setdefault(term, TermState())
+        state.last_yield = new_jobs
+        state.total_yield += new_jobs
+        if new_jobs > 0:
+            state.empty_cycles = 0
+            wait = 0.0
+        else:
+            state.empty_cycles += 1
+            wait = min(self.max_wait, self.min_wait * 2 ** (state.empty_cycles - 1))
+        state.due_at = monotonic() + wait
+        return wait
+
+
+    def due_terms(self) -> list[str]:
+        '''
+        Returns search terms that are due now, most productive ones first
+        '''
+        now = monotonic()
+        due = [term for term, state in self.states.items() if state.due_at <= now]
+        return sorted(due, key=lambda term: self.states[term].last_yield, reverse=True)
+
+
+    def seconds_until_due(self) -> float:
+        '''
+        Returns seconds until the next search term is due, `0` if one is due now
+        '''
+        if not self.states: return 0.0
+        return max(0.0, min(state.due_at for state in self.states.values()) - monotonic())
+
+
+    def summary(self) -> str:
+        now = monotonic()
+        return "\n".join(
+            f'  "{term}": {state.last_yield} new last cycle, {state.total_yield} in total, next search in {max(0, state.due_at - now):.0f}s'
+            for term, state in self.states.items()
+        )
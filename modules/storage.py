@@ -0,0 +1,319 @@
+"""
+Application Store for LinkedIn Auto Job Applier
+
+SQLite (WAL mode) backed history of applied and failed jobs.
+The CSV files in `config.py` are kept as an export format.
+
+Usage:
+    python -m modules.storage import     # One-shot import of existing CSV history
+    python -m modules.storage export     # Rewrite CSV files from the database
+"""
+
+import os
+import csv
+import sqlite3
+import threading
+
+from datetime import datetime
+
+from modules.history import file_lock, compact_edits
+from config import database_file, file_name, failed_file_name, store_batch_size, export_csv_history
+
+
+csv.field_size_limit(1000000)  # Legacy history rows can carry "About Job" blobs larger than default 131KB
+
+
+#< Schema
+APPLIED_FIELDS = {
+    'Job ID': 'job_id',
+    'Title': 'title',
+    'Company': 'company',
+    'Work Location': 'work_location',
+    'Work Style': 'work_style',
+    'About Job': 'about_job',
+    'Experience required': 'experience_required',
+    'Skills required': 'skills_required',
+    'HR Name': 'hr_name',
+    'HR Link': 'hr_link',
+    'Resume': 'resume',
+    'Re-posted': 'reposted',
+    'Date Posted': 'date_posted',
+    'Date Applied': 'date_applied',
+    'Job Link': 'job_link',
+    'External Job link': 'external_job_link',
+    'Questions Found': 'questions_found',
+    'Connect Request': 'connect_request',
+}
+'''
+Maps CSV header names of applied jobs history to database column names
+'''
+
+FAILED_FIELDS = {
+    'Job ID': 'job_id',
+    'Job Link': 'job_link',
+    'Resume Tried': 'resume_tried',
+    'Date listed': 'date_listed',
+    'Date Tried': 'date_tried',
+    'Assumed Reason': 'assumed_reason',
+    'Stack Trace': 'stack_trace',
+    'External Job link': 'external_job_link',
+    'Screenshot Name': 'screenshot_name',
+}
+'''
+Maps CSV header names of failed jobs history to database column names
+'''
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    {", ".join(column + (" TEXT PRIMARY KEY" if column == "job_id" else " TEXT") for column in APPLIED_FIELDS.values())}
+);
+CREATE TABLE IF NOT EXISTS failed_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    {", ".join(column + " TEXT" for column in FAILED_FIELDS.values())}
+);
+CREATE UNIQUE INDEX IF NOT EXISTS failed_jobs_job_id ON failed_jobs (job_id, date_tried);
+CREATE TABLE IF NOT EXISTS question_answers (
+    kind TEXT,
+    label_key TEXT,
+    label TEXT,
+    answer TEXT,
+    count INTEGER,
+    last_used TEXT,
+    PRIMARY KEY (kind, label_key, answer)
+);
+CREATE TABLE IF NOT EXISTS unresolved_questions (
+    kind TEXT,
+    label_key TEXT,
+    label TEXT,
+    count INTEGER,
+    first_seen TEXT,
+    last_seen TEXT,
+    job_ids TEXT,
+    PRIMARY KEY (kind, label_key)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+#>
+
+
+#< Connection
+_connection: sqlite3.Connection | None = None
+_lock = threading.RLock()
+_pending: dict[str, list[dict]] = {"applied_jobs": [], "failed_jobs": []}
+
+
+def get_connection() -> sqlite3.Connection:
+    '''
+    Function to get the shared database connection, opens and migrates the database on first use.
+    * Imports existing CSV history once, when the database is new
+    '''
+    global _connection
+    with _lock:
+        if _connection is None:
+            folder = os.path.dirname(database_file)
+            if folder: os.makedirs(folder, exist_ok=True)
+            connection = sqlite3.connect(database_file, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            _connection = connection
+            if get_meta("csv_imported") is None:
+                import_csv_history()
+        return _connection
+
+
+def get_meta(key: str) -> str | None:
+    row = get_connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def close_store() -> None:
+    '''
+    Function to flush pending rows and close the database connection
+    '''
+    global _connection
+    with _lock:
+        if _connection is None: return
+        flush_store()
+        _connection.close()
+        _connection = None
+#>
+
+
+#< Reads
+def get_applied_job_ids() -> set[str]:
+    '''
+    Function to get a `set` of applied job's Job IDs
+    * Reads only the primary key index, About Job blobs are never loaded
+    '''
+    with _lock:
+        ids = {row[0] for row in get_connection().execute("SELECT job_id FROM applied_jobs")}
+        ids.update(row["job_id"] for row in _pending["applied_jobs"])
+    return ids
+
+
+def is_applied(job_id: str) -> bool:
+    '''
+    Function to check if a Job ID is already in applied jobs history
+    '''
+    with _lock:
+        if any(row["job_id"] == job_id for row in _pending["applied_jobs"]): return True
+        return get_connection().execute("SELECT 1 FROM applied_jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+#>
+
+
+#< Writes
+def _to_text(value) -> str:
+    if value is None: return ""
+    if isinstance(value, datetime): return str(value)
+    return value if isinstance(value, str) else str(value)
+
+
+def add_applied_job(row: dict) -> None:
+    '''
+    Function to save an applied job, with any failed jobs still pending, in one transaction.
+    * Takes in `row` of type `dict` keyed by CSV header names (see `APPLIED_FIELDS`)
+    * Written right away, a submitted application must survive a crash or the bot could apply again
+    '''
+    _queue("applied_jobs", {column: _to_text(row.get(header)) for header, column in APPLIED_FIELDS.items()})
+
+
+def add_failed_job(row: dict) -> None:
+    '''
+    Function to queue a failed job for a batched insert.
+    * Takes in `row` of type `dict` keyed by CSV header names (see `FAILED_FIELDS`)
+    * Rows are written once `store_batch_size` rows are pending, with the next applied job or on `flush_store()`
+    '''
+    _queue("failed_jobs", {column: _to_text(row.get(header)) for header, column in FAILED_FIELDS.items()})
+
+
+def _queue(table: str, record: dict) -> None:
+    with _lock:
+        _pending[table].append(record)
+        if table == "applied_jobs" or len(_pending[table]) >= store_batch_size:
+            flush_store()
+
+
+def flush_store() -> None:
+    '''
+    Function to write all pending rows in one transaction.
+    * Rows stay pending if the transaction fails (locked database, disk full...), and are retried on the next flush
+    * Also appends them to the CSV export files if `export_csv_history = True`
+    '''
+    with _lock:
+        if not any(_pending.values()): return
+        connection = get_connection()
+        applied, failed = _pending["applied_jobs"], _pending["failed_jobs"]
+        with connection:
+            if applied:
+                columns = list(APPLIED_FIELDS.values())
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO applied_jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(record[column] for column in columns) for record in applied]
+                )
+            if failed:
+                columns = list(FAILED_FIELDS.values())
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO failed_jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(record[column] for column in columns) for record in failed]
+                )
+        _pending["applied_jobs"], _pending["failed_jobs"] = [], []
+        if export_csv_history:
+            if applied: _append_csv(file_name, APPLIED_FIELDS, applied)
+            if failed:  _append_csv(failed_file_name, FAILED_FIELDS, failed)
+#>
+
+
+#< CSV import and export
+def _append_csv(path: str, fields: dict[str, str], records: list[dict]) -> None:
+    with file_lock(path), open(path, 'a', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        if file.tell() == 0: writer.writerow(fields.keys())
+        writer.writerows([record[column] for column in fields.values()] for record in records)
+
+
+def import_csv_history() -> tuple[int, int]:
+    '''
+    Function to import existing applied and failed CSV history into the database.
+    * Runs automatically once, when the database is created
+    * Safe to re-run, rows already in the database are ignored
+    * Returns a tuple of (applied rows imported, failed rows imported)
+    '''
+    counts = []
+    with _lock:
+        connection = get_connection()
+        for path, table, fields in ((file_name, "applied_jobs", APPLIED_FIELDS), (failed_file_name, "failed_jobs", FAILED_FIELDS)):
+            count = 0
+            if os.path.exists(path):
+                columns = list(fields.values())
+                query = f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                with open(path, 'r', encoding='utf-8', newline='') as file, connection:
+                    reader = csv.DictReader(file)
+                    batch = []
+                    for row in reader:
+                        if not row.get('Job ID'): continue
+                        batch.append(tuple(row.get(header) or "" for header in fields))
+                        if len(batch) >= 1000:
+                            count += connection.executemany(query, batch).rowcount
+                            batch = []
+                    if batch:
+                        count += connection.executemany(query, batch).rowcount
+            counts.append(count)
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('csv_imported', ?)", (str(datetime.now()),))
+        connection.commit()
+    return counts[0], counts[1]
+
+
+def _sync_ui_edits() -> None:
+    '''
+    Saves "Date Applied" edits journaled to the CSV (by older versions of the job history UI, `app.py`) into the database
+    '''
+    if not os.path.exists(file_name): return
+    compact_edits(file_name)
+    connection = get_connection()
+    dates = dict(connection.execute("SELECT job_id, date_applied FROM applied_jobs"))
+    with file_lock(file_name), open(file_name, 'r', encoding='utf-8', newline='') as file:
+        changed = [(row['Date Applied'], row['Job ID']) for row in csv.DictReader(file) 
+                   if row.get('Job ID') in dates and row.get('Date Applied') and row['Date Applied'] != dates[row['Job ID']]]
+    with connection:
+        connection.executemany("UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?", changed)
+
+
+def export_csv() -> tuple[int, int]:
+    '''
+    Function to rewrite the applied and failed CSV files from the database.
+    * Edits made from the job history UI are saved in the database first, so they are not lost
+    * Returns a tuple of (applied rows exported, failed rows exported)
+    '''
+    counts = []
+    with _lock:
+        flush_store()
+        _sync_ui_edits()
+        connection = get_connection()
+        for path, table, fields in ((file_name, "applied_jobs", APPLIED_FIELDS), (failed_file_name, "failed_jobs", FAILED_FIELDS)):
+            order = "rowid" if table == "applied_jobs" else "id"
+            count = 0
+            with file_lock(path), open(path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(fields.keys())
+                for row in connection.execute(f"SELECT {', '.join(fields.values())} FROM {table} ORDER BY {order}"):
+                    writer.writerow(row)
+                    count += 1
+            counts.append(count)
+    return counts[0], counts[1]
+#>
+
+
+if __name__ == "__main__":
+    import sys
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "import":
+        print("Imported {} applied and {} failed jobs into {}".format(*import_csv_history(), database_file))
+    elif command == "export":
+        print("Exported {} applied and {} failed jobs to CSV".format(*export_csv()))
+    else:
+        print(__doc__)
+    close_store()
@@ -12,20 +12,20 @@ from config import (
     default_resume_path, years_of_experience, require_visa, website, linkedIn,
     desired_salary, us_citizenship, linkedin_headline, notice_period, current_ctc,
     linkedin_summary, cover_letter, recent_employer, confidence_level,
-    pause_before_submit, pause_at_failed_question, overwrite_previous_answers,
+    pause_before_submit, pause_at_failed_question, overwrite_previous_answers, use_answer_memory,
     # Search
     search_terms, search_location, switch_number, randomize_search_order,
     sort_by, date_posted, salary, easy_apply_only, experience_level, job_type, on_site,
     companies, location, industry, job_function, job_titles, benefits, commitments,
     under_10_applicants, in_your_network, fair_chance_employer, pause_after_filters,
-    about_company_bad_words, about_company_good_words, bad_words, security_clearance,
+    about_company_bad_words, about_company_good_words, bad_words, title_bad_words, match_whole_words, security_clearance,
     did_masters, current_experience,
     # Secrets
     username, password, use_AI, llm_api_url, llm_api_key, llm_model, ai_provider, stream_output,
     # Settings
-    close_tabs, follow_companies, run_non_stop, alternate_sortby, cycle_date_posted,
+    close_tabs, follow_companies, run_non_stop, scheduler_min_wait, scheduler_max_wait, alternate_sortby, cycle_date_posted,
     stop_date_cycle_at_24hr, generated_resume_path, file_name, failed_file_name,
-    logs_folder_path, click_gap, run_in_background, disable_extensions, safe_mode,
+    logs_folder_path, log_max_size_mb, log_backup_count, chromedriver_cache_path, database_file, store_batch_size, export_csv_history, ai_cache_file, ai_answer_cache_size, ai_answer_cache_ttl_days, ai_answer_cache_job_context, ai_skills_cache_size, ai_skills_cache_only, ai_request_timeout, ai_max_retries, ai_circuit_threshold, ai_circuit_reset, ai_model_catalog_ttl_hours, ai_batch_questions, click_gap, adaptive_pacing, pacing_jitter_floor_ms, pacing_timeout, run_in_background, disable_extensions, safe_mode,
     smooth_scroll, keep_screen_awake, stealth_mode, showAiErrorAlerts
 )
 
@@ -106,6 +106,7 @@ def validate_config() -> None:
     check_boolean(pause_before_submit, "pause_before_submit")
     check_boolean(pause_at_failed_question, "pause_at_failed_question")
     check_boolean(overwrite_previous_answers, "overwrite_previous_answers")
+    check_boolean(use_answer_memory, "use_answer_memory")
     
     # Search
     check_list(search_terms, "search_terms", min_length=1)
@@ -139,6 +140,8 @@ def validate_config() -> None:
     check_list(about_company_bad_words, "about_company_bad_words")
     check_list(about_company_good_words, "about_company_good_words")
     check_list(bad_words, "bad_words")
+    check_list(title_bad_words, "title_bad_words")
+    check_boolean(match_whole_words, "match_whole_words")
     check_boolean(security_clearance, "security_clearance")
     check_boolean(did_masters, "did_masters")
     check_int(current_experience, "current_experience", -1)
@@ -157,6 +160,8 @@ def validate_config() -> None:
     check_boolean(close_tabs, "close_tabs")
     check_boolean(follow_companies, "follow_companies")
     check_boolean(run_non_stop, "run_non_stop")
+    check_int(scheduler_min_wait, "scheduler_min_wait", 1)
+    check_int(scheduler_max_wait, "scheduler_max_wait", scheduler_min_wait)
     check_boolean(alternate_sortby, "alternate_sortby")
     check_boolean(cycle_date_posted, "cycle_date_posted")
     check_boolean(stop_date_cycle_at_24hr, "stop_date_cycle_at_24hr")
@@ -164,7 +169,28 @@ def validate_config() -> None:
     check_string(file_name, "file_name")
     check_string(failed_file_name, "failed_file_name")
     check_string(logs_folder_path, "logs_folder_path")
+    check_int(log_max_size_mb, "log_max_size_mb", 1)
+    check_int(log_backup_count, "log_backup_count")
+    check_string(chromedriver_cache_path, "chromedriver_cache_path", min_length=1)
+    check_string(database_file, "database_file", min_length=1)
+    check_int(store_batch_size, "store_batch_size", 1)
+    check_boolean(export_csv_history, "export_csv_history")
+    check_string(ai_cache_file, "ai_cache_file", min_length=1)
+    check_int(ai_answer_cache_size, "ai_answer_cache_size")
+    check_int(ai_answer_cache_ttl_days, "ai_answer_cache_ttl_days")
+    check_boolean(ai_answer_cache_job_context, "ai_answer_cache_job_context")
+    check_int(ai_skills_cache_size, "ai_skills_cache_size")
+    check_boolean(ai_skills_cache_only, "ai_skills_cache_only")
+    check_int(ai_request_timeout, "ai_request_timeout", 1)
+    check_int(ai_max_retries, "ai_max_retries")
+    check_int(ai_circuit_threshold, "ai_circuit_threshold")
+    check_int(ai_circuit_reset, "ai_circuit_reset")
+    check_int(ai_model_catalog_ttl_hours, "ai_model_catalog_ttl_hours")
+    check_boolean(ai_batch_questions, "ai_batch_questions")
     check_int(click_gap, "click_gap")
+    check_boolean(adaptive_pacing, "adaptive_pacing")
+    check_int(pacing_jitter_floor_ms, "pacing_jitter_floor_ms")
+    check_int(pacing_timeout, "pacing_timeout", 1)
     check_boolean(run_in_background, "run_in_background")
     check_boolean(disable_extensions, "disable_extensions")
     check_boolean(safe_mode, "safe_mode")
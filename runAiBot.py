@@ -15,34 +15,39 @@ version:    24.12.29.12.30
 
 # Imports
 import os
-import csv
 import re
+import sys
+import argparse
 import pyautogui
 
-# Set CSV field size limit to prevent field size errors
-csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
-
 from random import choice, shuffle, randint
+from time import perf_counter
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, WebDriverException
 
 from config import *
 
-from modules.open_chrome import *
+from modules.open_chrome import session
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
-
-if use_AI:
-    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
+from modules.pacing import settle, stats as pacing_stats
+from modules.scheduler import TermScheduler
+from modules.ai.cache import answer_cache, answer_cache_key, skills_cache, get_cached_skills, close_cache
+from modules.ai.transport import latency_report, close_http_client
+from modules.filters import filter_job_cards, job_card_skip_reason, SKIP_REASONS, evaluate_description, about_company_bad_words_matcher, about_company_good_words_matcher
+from modules.storage import get_applied_job_ids, add_applied_job, add_failed_job, flush_store, close_store
+from modules.ai.providers import Provider, create_provider
+from modules.ai.model_catalog import wait_for_refresh
+from modules.question_rules import question_rules
+from modules.option_matcher import get_option_matcher
+from modules import answer_memory
 
 from typing import Literal
 
@@ -58,11 +63,6 @@ if run_in_background == True:
     pause_before_submit = False
     run_non_stop = False
 
-first_name = first_name.strip()
-middle_name = middle_name.strip()
-last_name = last_name.strip()
-full_name = first_name + " " + middle_name + " " + last_name if middle_name else first_name + " " + last_name
-
 useNewResume = True
 randomly_answered_questions = set()
 
@@ -73,21 +73,16 @@ failed_count = 0
 skip_count = 0
 dailyEasyApplyLimitReached = False
 
-re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
 
-desired_salary_lakhs = str(round(desired_salary / 100000, 2))
-desired_salary_monthly = str(round(desired_salary/12, 2))
-desired_salary = str(desired_salary)
+scheduler = TermScheduler(search_terms)
 
-current_ctc_lakhs = str(round(current_ctc / 100000, 2))
-current_ctc_monthly = str(round(current_ctc/12, 2))
-current_ctc = str(current_ctc)
+driver = None   # Browser is opened lazily in `main()`, see `modules.open_chrome.session`
+wait = None
+actions = None
 
-notice_period_months = str(notice_period//30)
-notice_period_weeks = str(notice_period//7)
-notice_period = str(notice_period)
-
-aiClient = None
+aiProvider: Provider | None = None     # Created once in `main()` for the configured `ai_provider`
+skills_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="SkillsExtractor")
+skills_timeout = 120    # Max seconds `submitted_jobs()` waits for skills still being extracted
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -152,23 +147,6 @@ def login_LN() -> None:
 
 
 
-def get_applied_job_ids() -> set[str]:
-    '''
-    Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
-    '''
-    job_ids: set[str] = set()
-    try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
-
-
-
 def set_search_location() -> None:
     '''
     Function to set search location
@@ -183,7 +161,7 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            settle(driver, 2)
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -266,9 +244,43 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
 
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+JOB_CARDS_SCRIPT = '''
+const items = arguments[0] ? [arguments[0]] : document.querySelectorAll("li[data-occludable-job-id]");
+return Array.from(items, li => {
+    const anchor = li.querySelector("a");
+    const subtitle = li.querySelector(".artdeco-entity-lockup__subtitle");
+    const state = li.querySelector(".job-card-container__footer-job-state");
+    return {
+        id: li.getAttribute("data-occludable-job-id"),
+        title: anchor ? anchor.innerText.split("\\n")[0].trim() : "",
+        subtitle: subtitle ? subtitle.innerText : "",
+        applied: !!state && state.innerText.trim() === "Applied",
+        element: li,
+        anchor: anchor
+    };
+});
+'''
+
+def extract_job_cards(element: WebElement | None = None) -> list[dict]:
     '''
-    # Function to get job main details.
+    Function to read all job cards of current page in a single browser round-trip.
+    * Returns a list of `{id, title, company, work_location, work_style, applied, element, anchor}`
+    * Pass `element` to re-read just that card (after scrolling an occluded card into view)
+    '''
+    cards = driver.execute_script(JOB_CARDS_SCRIPT, element) or []
+    for card in cards:
+        other_details = card.pop("subtitle")
+        index = other_details.find(' · ')
+        card["company"] = other_details[:index]
+        work_location = other_details[index+3:]
+        card["work_style"] = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
+        card["work_location"] = work_location[:work_location.rfind('(')].strip()
+    return cards
+
+
+def get_job_main_details(card: dict, applied_jobs: set, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+    '''
+    # Function to get job main details from a job card read by `extract_job_cards()`.
     Returns a tuple of (job_id, title, company, work_location, work_style, skip)
     * job_id: Job ID
     * title: Job title
@@ -276,43 +288,31 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     * work_location: Work location of this job
     * work_style: Work style of this job (Remote, On-site, Hybrid)
     * skip: A boolean flag to skip this job
+    Clicks on the job to open its details, unless it's skipped
     '''
-    job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
-    scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute('data-occludable-job-id')
-    title = job_details_button.text
-    title = title[:title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-    index = other_details.find(' · ')
-    company = other_details[:index]
-    work_location = other_details[index+3:]
-    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
-    work_location = work_location[:work_location.rfind('(')].strip()
+    if not card["title"] or card["anchor"] is None:
+        # LinkedIn doesn't render contents of cards that were never scrolled into view
+        scroll_to_view(driver, card["element"], True)
+        card = (extract_job_cards(card["element"]) or [card])[0]
+    job_id, title, company = card["id"], card["title"], card["company"]
+    work_location, work_style = card["work_location"], card["work_style"]
     
-    # Skip if previously rejected due to blacklist or already applied
-    skip = False
-    if company in blacklisted_companies:
-        print_lg(f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!')
-        skip = True
-    elif job_id in rejected_jobs: 
-        print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
-        skip = True
-    try:
-        if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except: pass
+    # Check again, company might've been blacklisted by a previous job of this page or card was just rendered
+    reason = job_card_skip_reason(card, applied_jobs, rejected_jobs, blacklisted_companies)
+    if reason:
+        print_lg(f'Skipping "{title} | {company}" job ({SKIP_REASONS[reason]}). Job ID: {job_id}!')
+        return (job_id,title,company,work_location,work_style,True)
+    job_details_button = card["anchor"]
     try: 
-        if not skip: job_details_button.click()
+        scroll_to_view(driver, job_details_button, True)
+        job_details_button.click()
     except Exception as e:
         print_lg(f'Failed to click "{title} | {company}" job on details button. Job ID: {job_id}!') 
         # print_lg(e)
         discard_job()
         job_details_button.click() # To pass the error outside
-    buffer(click_gap)
-    return (job_id,title,company,work_location,work_style,skip)
+    settle(driver, click_gap)
+    return (job_id,title,company,work_location,work_style,False)
 
 
 # Function to check for Blacklisted words in About Company
@@ -321,36 +321,21 @@ def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_c
     about_company_org = find_by_class(driver, "jobs-company__box")
     scroll_to_view(driver, about_company_org)
     about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+    good_word = about_company_good_words_matcher.search(about_company_org)
+    if good_word:
+        print_lg(f'Found the word "{good_word}". So, skipped checking for blacklist words.')
+    else:
+        bad_word = about_company_bad_words_matcher.search(about_company_org)
+        if bad_word:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            raise ValueError(f'\n"{about_company_org}"\n\nContains "{bad_word}".')
     buffer(click_gap)
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
 
 
 
-# Function to extract years of experience required from About Job
-def extract_years_of_experience(text: str) -> int:
-    # Extract all patterns like '10+ years', '5 years', '3-5 years', etc.
-    matches = re.findall(re_experience, text)
-    if len(matches) == 0: 
-        print_lg(f'\n{text}\n\nCouldn\'t find experience requirement in About the Job!')
-        return 0
-    return max([int(match) for match in matches if int(match) <= 12])
-
-
-
 def get_job_description(
 ) -> tuple[
     str | Literal['Unknown'],
@@ -369,47 +354,121 @@ def get_job_description(
     - `skipReason: str | None`
     - `skipMessage: str | None`
     '''
+    ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
+    jobDescription = "Unknown"
+    ##<
+    experience_required = "Unknown"
+    skip = False
+    skipReason = None
+    skipMessage = None
     try:
-        ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
-        jobDescription = "Unknown"
-        ##<
-        experience_required = "Unknown"
-        found_masters = 0
         jobDescription = find_by_class(driver, "jobs-box__html-content").text
-        jobDescriptionLow = jobDescription.lower()
-        skip = False
-        skipReason = None
-        skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
-        if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
-            skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
-            skipReason = "Asking for Security clearance"
-            skip = True
-        if not skip:
-            if did_masters and 'master' in jobDescriptionLow:
-                print_lg(f'Found the word "master" in \n{jobDescription}')
-                found_masters = 2
-            experience_required = extract_years_of_experience(jobDescription)
-            if current_experience > -1 and experience_required > current_experience + found_masters:
-                skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
-                skipReason = "Required experience is high"
-                skip = True
+        result = evaluate_description(jobDescription)
+        experience_required, skip, skipReason, skipMessage = result["experience_required"], result["skip"], result["reason"], result["message"]
+        if result["found_masters"]: print_lg(f'Found the word "master" in \n{jobDescription}')
+        if not skip and not result["experience_found"]: print_lg(f'\n{jobDescription}\n\nCouldn\'t find experience requirement in About the Job!')
     except Exception as e:
-        if jobDescription == "Unknown":    print_lg("Unable to extract job description!")
-        else:
-            experience_required = "Error in extraction"
-            print_lg("Unable to extract years of experience required!")
-            # print_lg(e)
+        print_lg("Unable to extract job description!")
+        # print_lg(e)
     finally:
         return jobDescription, experience_required, skip, skipReason, skipMessage
         
 
 
+def get_skills(job_description: str) -> dict | list | str | None:
+    '''
+    Function to get skills of `job_description`, from cache or AI. Submitted to `skills_executor` by `apply_to_jobs()`
+    '''
+    try:
+        skills = get_cached_skills(job_description, aiProvider.extract_skills if aiProvider else None)
+        if skills is None: return "Not in skills cache" if ai_skills_cache_only else "Error extracting skills"
+        print_lg(f"Extracted skills using {ai_provider} AI")
+        return skills
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        return "Error extracting skills"
+
+
+def resolve_skills(skills: Future | dict | list | str | None) -> dict | list | str | None:
+    '''
+    Function to wait for skills extracted in background, if `skills` is still a `Future`
+    '''
+    if not isinstance(skills, Future): return skills
+    try:
+        return skills.result(timeout=skills_timeout)
+    except FutureTimeoutError:
+        print_lg(f"Skill extraction didn't finish in {skills_timeout} seconds, saving job without skills!")
+        return "Timed out extracting skills"
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        return "Error extracting skills"
+
+
+def get_ai_answers(questions: list[tuple[str, Literal['text', 'textarea']]], job_description: str | None = None) -> list[str | None]:
+    '''
+    Function to answer form questions, a list of (question, question_type), with the configured AI provider.
+    * Reuses cached answers of questions answered before (see `modules.ai.cache`)
+    * Asks all uncached questions in one AI call if `ai_batch_questions = True`, else one call per question
+    * Returns answers in order of `questions`, `None` where AI couldn't answer
+    '''
+    answers: list[str | None] = [None] * len(questions)
+    keys = [answer_cache_key(question, question_type, job_description) for question, question_type in questions]
+    pending = {}
+    for index, (question, question_type) in enumerate(questions):
+        answers[index] = answer_cache.get(keys[index]) if keys[index] else None
+        if answers[index]: print_lg(f'Using cached AI answer for question "{question}"')
+        else: pending[str(index + 1)] = (question, question_type)
+    if not pending or not aiProvider: return answers
+    if ai_batch_questions and len(pending) > 1:
+        received = aiProvider.answer_questions(pending, job_description)
+    else:
+        received = {id: aiProvider.answer_question(question, question_type, job_description=job_description) for id, (question, question_type) in pending.items()}
+    for id, answer in received.items():
+        if not answer: continue
+        index = int(id) - 1
+        answers[index] = answer
+        if keys[index]: answer_cache.set(keys[index], answer)
+    return answers
+
+
+def answered_randomly(question: str, kind: str, job_id: str | None = None) -> None:
+    '''
+    Function to note a question answered randomly, for this run's summary and in the unresolved questions store
+    '''
+    randomly_answered_questions.add((question, kind))
+    try:
+        answer_memory.add_unresolved_question(question, kind, job_id)
+    except Exception as e:
+        print_lg("Failed to save randomly answered question!", e)
+
+
+def fill_ai_answers(fields: list[dict], questions_list: set, job_description: str | None = None, job_id: str | None = None) -> None:
+    '''
+    Function to answer text and textarea fields of a form page, that no rule could answer, with AI in one go.
+    * Takes in `fields`, dicts of `element`, `label`, `label_org`, `type`, `prev_answer` and `do_actions` collected by `answer_questions()`
+    * Fields AI couldn't answer are answered like before AI existed, see `answered_randomly()`
+    '''
+    try:
+        answers = get_ai_answers([(field["label_org"], field["type"]) for field in fields], job_description)
+    except Exception as e:
+        print_lg("Failed to get AI answer!", e)
+        answers = [None] * len(fields)
+    for field, answer in zip(fields, answers):
+        if answer:
+            print_lg(f'AI Answered received for question "{field["label_org"]}" \nhere is answer: "{answer}"')
+        else:
+            answered_randomly(field["label_org"], field["type"], job_id)
+            answer = years_of_experience if field["type"] == "text" else ""
+        element = field["element"]
+        element.clear()
+        element.send_keys(answer)
+        if field["do_actions"]:
+            settle(driver, 2)
+            actions.send_keys(Keys.ARROW_DOWN)
+            actions.send_keys(Keys.ENTER).perform()
+        questions_list.add((field["label"], element.get_attribute("value"), field["type"], field["prev_answer"]))
+
+
 # Function to upload resume
 def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
     try:
@@ -417,304 +476,185 @@ def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
         return True, os.path.basename(default_resume_path)
     except: return False, "Previous resume"
 
-# Function to answer common questions for Easy Apply
-def answer_common_questions(label: str, answer: str) -> str:
-    if 'sponsorship' in label or 'visa' in label: answer = require_visa
-    return answer
+FORM_FIELDS_SCRIPT = """
+const text = element => element ? (element.innerText || element.textContent || "").trim() : "";
+return Array.from(arguments[0].querySelectorAll("div[data-test-form-element]"), question => {
+    const select = question.querySelector("select");
+    if (select) {
+        const label = question.querySelector("label span");
+        const selected = select.options[select.selectedIndex];
+        return {kind: "select", label: label ? text(label) : "Unknown", value: selected ? text(selected) : "",
+                options: Array.from(select.options, option => text(option)), element: select};
+    }
+    const radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (radio) {
+        const title = radio.querySelector("span[data-test-form-builder-radio-button-form-component__title]");
+        const label = title && (title.querySelector(".visually-hidden") || title);
+        return {kind: "radio", label: label ? text(label) : "Unknown", element: radio,
+                options: Array.from(radio.querySelectorAll("input"), input => {
+                    const optionLabel = radio.querySelector(`label[for="${CSS.escape(input.id)}"]`);
+                    return {label: optionLabel ? text(optionLabel) : "Unknown", value: input.value, selected: input.checked,
+                            element: input, label_element: optionLabel};
+                })};
+    }
+    const input = question.querySelector("input[type='text']");
+    if (input) {
+        const label = question.querySelector("label[for]");
+        return {kind: "text", label: label ? text(label.querySelector(".visually-hidden") || label) : "Unknown", value: input.value, element: input};
+    }
+    const textarea = question.querySelector("textarea");
+    if (textarea) {
+        return {kind: "textarea", label: text(question.querySelector("label[for]")) || "Unknown", value: textarea.value, element: textarea};
+    }
+    const checkbox = question.querySelector("input[type='checkbox']");
+    if (checkbox) {
+        return {kind: "checkbox", label: text(question.querySelector("span[class='visually-hidden']")) || "Unknown",
+                option: text(question.querySelector("label[for]")) || "Unknown", checked: checkbox.checked, element: checkbox};
+    }
+    return null;
+}).filter(field => field);
+"""
+
+def extract_form_fields(modal: WebElement) -> list[dict]:
+    '''
+    Function to read every question of the current Easy Apply step in a single browser round-trip.
+    * Returns a list of dicts, each having `kind` ("select", "radio", "text", "textarea" or "checkbox"), `label` and `element`
+      - select: `value` (selected option text) and `options` (option texts)
+      - radio: `options`, each having `label`, `value`, `selected`, `element` (the input) and `label_element`
+      - text and textarea: `value`
+      - checkbox: `option` (text next to the box) and `checked`
+    '''
+    return driver.execute_script(FORM_FIELDS_SCRIPT, modal) or []
 
 
 # Function to answer the questions for Easy Apply
-def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None ) -> set:
-    # Get all questions from the page
-     
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
-    # all_questions = modal.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-element")
-    # all_list_questions = modal.find_elements(By.XPATH, ".//div[@data-test-text-entity-list-form-component]")
-    # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
-    # all_questions = all_questions + all_list_questions + all_single_line_questions
-
-    for Question in all_questions:
+def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None, job_id: str | None = None) -> set:
+    # Get all questions from the page, answered in pure Python from this snapshot
+    fields = extract_form_fields(modal)
+
+    ai_fields = []  # Text fields left for AI, answered together after all other questions of the page
+    for field in fields:
         # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
+        if field["kind"] == "select":
+            label_org = field["label"]
             answer = 'Yes'
             label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
+            selected_option = field["value"]
             optionsText = []
             options = '"List of phone country codes"'
             if label != "phone country code":
-                optionsText = [option.text for option in select.options]
+                optionsText = field["options"]
                 options = "".join([f' "{option}",' for option in optionsText])
             prev_answer = selected_option
             if overwrite_previous_answers or selected_option == "Select an option":
                 ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
-                    answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                # Add location handling
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        answer = current_city if current_city else work_location
-                    else:
-                        answer = work_location
-                else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
-                    # Define similar phrases for common answers
-                    possible_answer_phrases = []
-                    if answer == 'Decline':
-                        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
-                    elif 'yes' in answer.lower():
-                        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
-                    elif 'no' in answer.lower():
-                        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
-                    else:
-                        # Try partial matching for any answer
-                        possible_answer_phrases = [answer]
-                        # Add lowercase and uppercase variants
-                        possible_answer_phrases.append(answer.lower())
-                        possible_answer_phrases.append(answer.upper())
-                        # Try without special characters
-                        possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
-                    ##<
-                    foundOption = False
-                    for phrase in possible_answer_phrases:
-                        for option in optionsText:
-                            # Check if phrase is in option or option is in phrase (bidirectional matching)
-                            if phrase.lower() in option.lower() or option.lower() in phrase.lower():
-                                select.select_by_visible_text(option)
-                                answer = option
-                                foundOption = True
-                                break
-                    if not foundOption:
-                        #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
-                        print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
-                        select.select_by_index(randint(1, len(select.options)-1))
-                        answer = select.first_selected_option.text
-                        randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+                answer, rule = question_rules.answer("select", label, answer, work_location=work_location, prev_answer=prev_answer)
+                if rule is None: answer = answer_memory.recall("select", label) or answer
+                index = get_option_matcher(field["options"]).match(answer)
+                if index is None:
+                    #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
+                    print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
+                    index = randint(1, len(field["options"])-1)
+                    answered_randomly(f'{label_org} [ {options} ]', "select", job_id)
+                select_by_index(driver, field["element"], index)
+                answer = field["options"][index]
+            else: answer = prev_answer
             questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
             continue
         
         # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
+        if field["kind"] == "radio":
             prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
+            label_org = field["label"]
             answer = 'Yes'
             label = label_org.lower()
 
             label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
             options_labels = []
             
-            for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
+            for option in field["options"]:
+                options_labels.append( f'"{option["label"]}"<{option["value"]}>' ) # Saving option as "label <value>"
+                if option["selected"]: prev_answer = options_labels[-1]
                 label_org += f' {options_labels[-1]},'
 
             if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
-                if foundOption: 
-                    actions.move_to_element(foundOption).click().perform()
-                else:    
-                    possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
-                    ele = options[0]
-                    answer = options_labels[0]
-                    for phrase in possible_answer_phrases:
-                        for i, option_label in enumerate(options_labels):
-                            if phrase in option_label:
-                                foundOption = options[i]
-                                ele = foundOption
-                                answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
-                                break
-                        if foundOption: break
-                    # if answer == 'Decline':
-                    #     answer = options_labels[0]
-                    #     for phrase in ["Prefer not", "not want", "not wish"]:
-                    #         foundOption = try_xp(radio, f".//label[normalize-space()='{phrase}']", False)
-                    #         if foundOption:
-                    #             answer = f'Decline ({phrase})'
-                    #             ele = foundOption
-                    #             break
-                    actions.move_to_element(ele).click().perform()
-                    if not foundOption: randomly_answered_questions.add((f'{label_org} ]',"radio"))
+                answer, rule = question_rules.answer("radio", label, answer)
+                if rule is None: answer = answer_memory.recall("radio", label) or answer
+                index = get_option_matcher([option["label"] for option in field["options"]]).match(answer)
+                if index is None:
+                    index = 0
+                    answered_randomly(f'{label_org} ]', "radio", job_id)
+                option = field["options"][index]
+                actions.move_to_element(option["label_element"] or option["element"]).click().perform()
+                if " ".join(option["label"].split()) != answer:
+                    answer = f'Decline ({options_labels[index]})' if answer == 'Decline' else options_labels[index]
             else: answer = prev_answer
             questions_list.add((label_org+" ]", answer, "radio", prev_answer))
             continue
         
         # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text: 
+        if field["kind"] == "text":
+            text = field["element"]
             do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
+            label_org = field["label"]
             answer = "" # years_of_experience
             label = label_org.lower()
 
-            prev_answer = text.get_attribute("value")
+            prev_answer = field["value"]
             if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                else: answer = answer_common_questions(label,answer)
+                answer, rule = question_rules.answer("text", label, answer, work_location=work_location)
+                if rule is None: answer = answer_memory.recall("text", label) or answer
+                do_actions = bool(rule and rule.do_actions)
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "text"))
-                            answer = years_of_experience
+                    if use_AI and aiProvider:
+                        ai_fields.append({"element": text, "label": label, "label_org": label_org, "type": "text", "prev_answer": prev_answer, "do_actions": do_actions})
+                        continue
                     else:
-                        randomly_answered_questions.add((label_org, "text"))
+                        answered_randomly(label_org, "text", job_id)
                         answer = years_of_experience
                 ##<
                 text.clear()
                 text.send_keys(answer)
                 if do_actions:
-                    sleep(2)
+                    settle(driver, 2)
                     actions.send_keys(Keys.ARROW_DOWN)
                     actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
+                questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
+            else:
+                questions_list.add((label, prev_answer, "text", prev_answer))
             continue
 
         # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
+        if field["kind"] == "textarea":
+            text_area = field["element"]
+            label_org = field["label"]
             label = label_org.lower()
             answer = ""
-            prev_answer = text_area.get_attribute("value")
+            prev_answer = field["value"]
             if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label: answer = cover_letter
+                answer, _ = question_rules.answer("textarea", label, answer)
                 if answer == "":
                 ##> ------ Yang Li : MARKYangL - Feature ------
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "textarea"))
-                            answer = ""
+                    if use_AI and aiProvider:
+                        ai_fields.append({"element": text_area, "label": label, "label_org": label_org, "type": "textarea", "prev_answer": prev_answer, "do_actions": False})
+                        continue
                     else:
-                        randomly_answered_questions.add((label_org, "textarea"))
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
-            ##<
+                        answered_randomly(label_org, "textarea", job_id)
+                text_area.clear()
+                text_area.send_keys(answer)
+                questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
+                ##<
+            else:
+                questions_list.add((label, prev_answer, "textarea", prev_answer))
             continue
 
         # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
+        if field["kind"] == "checkbox":
+            checkbox = field["element"]
+            label = field["label"].lower()
+            answer = field["option"]  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
+            prev_answer = field["checked"]
             checked = prev_answer
             if not prev_answer:
                 try:
@@ -726,6 +666,7 @@ def answer_questions(modal: WebElement, questions_list: set, work_location: str,
             questions_list.add((f'{label} ([X] {answer})', checked, "checkbox", prev_answer))
             continue
 
+    if ai_fields: fill_ai_answers(ai_fields, questions_list, job_description, job_id)
 
     # Select todays date
     try_xp(driver, "//button[contains(@aria-label, 'This is today')]")
@@ -771,10 +712,11 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
 
 
 
-def follow_company(modal: WebDriver = driver) -> None:
+def follow_company(modal: WebDriver | None = None) -> None:
     '''
     Function to follow or un-follow easy applied companies based om `follow_companies`
     '''
+    modal = modal or driver
     try:
         follow_checkbox_input = try_xp(modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False)
         if follow_checkbox_input and follow_checkbox_input.is_selected() != follow_companies:
@@ -787,18 +729,14 @@ def follow_company(modal: WebDriver = driver) -> None:
 #< Failed attempts logging
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     '''
-    Function to update failed jobs list in excel
+    Function to update failed jobs list in the application store
     '''
     try:
-        with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
-            file.close()
+        add_failed_job({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
+        print_lg(pacing_stats.report())
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
-        pyautogui.alert("Failed to update the excel of failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        pyautogui.alert("Failed to update the history of failed jobs!\nProbably because of 1 of the following reasons:\n1. The database or excel file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
 
 
 def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
@@ -817,26 +755,27 @@ def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
 
 
 def submitted_jobs(job_id: str, title: str, company: str, work_location: str, work_style: str, description: str, experience_required: int | Literal['Unknown', 'Error in extraction'], 
-                   skills: list[str] | Literal['In Development'], hr_name: str | Literal['Unknown'], hr_link: str | Literal['Unknown'], resume: str, 
+                   skills: Future | list[str] | Literal['In Development'], hr_name: str | Literal['Unknown'], hr_link: str | Literal['Unknown'], resume: str, 
                    reposted: bool, date_listed: datetime | Literal['Unknown'], date_applied:  datetime | Literal['Pending'], job_link: str, application_link: str, 
                    questions_list: set | None, connect_request: Literal['In Development']) -> None:
     '''
-    Function to create or update the Applied jobs CSV file, once the application is submitted successfully
+    Function to save an applied job in the application store, once the application is submitted successfully
+    * Waits for `skills` if they're still being extracted in background
     '''
+    skills = resolve_skills(skills)
+    try:
+        answer_memory.remember(questions_list, randomly_answered_questions)
+    except Exception as e:
+        print_lg("Failed to remember answers of this application!", e)
     try:
-        with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
-                            'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
-                                'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
-                                'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
-                                'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
-        csv_file.close()
+        add_applied_job({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style),
+                        'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills),
+                            'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted),
+                            'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link),
+                            'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(answer_memory.serialize_questions(questions_list)), 'Connect Request':truncate_for_csv(connect_request)})
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
-        pyautogui.alert("Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
+        pyautogui.alert("Failed to update the history of applied jobs!\nProbably because of 1 of the following reasons:\n1. The database or excel file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file", "Failed Logging")
 
 
 
@@ -851,7 +790,12 @@ def discard_job() -> None:
 
 
 # Function to apply to jobs
-def apply_to_jobs(search_terms: list[str]) -> None:
+def apply_to_jobs(search_terms: list[str]) -> dict[str, int]:
+    '''
+    Function to search and apply to jobs for each of `search_terms`.
+    * Returns yield of each search term, number of new job IDs it listed (see `modules.scheduler`)
+    '''
+    term_yield = {}
     applied_jobs = get_applied_job_ids()
     rejected_jobs = set()
     blacklisted_companies = set()
@@ -867,6 +811,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         apply_filters()
 
         current_count = 0
+        new_jobs = 0
         try:
             while current_count < switch_number:
                 # Wait until job listings are loaded
@@ -875,18 +820,27 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 pagination_element, current_page = get_page_info()
 
                 # Find all job listings in current page
-                buffer(3)
-                job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
+                settle(driver, 3)
+                job_cards = extract_job_cards()
+                for card in job_cards:
+                    if scheduler.observe(card["id"], applied_jobs): new_jobs += 1
+
+                # Skip known jobs before opening any of them
+                job_cards, skipped_cards = filter_job_cards(job_cards, applied_jobs, rejected_jobs, blacklisted_companies)
+                for card, reason in skipped_cards:
+                    print_lg(f'Skipping "{card["title"]} | {card["company"]}" job ({SKIP_REASONS[reason]}). Job ID: {card["id"]}!')
+                print_lg(f"Opening {len(job_cards)} of {len(job_cards) + len(skipped_cards)} jobs on this page.")
 
             
-                for job in job_listings:
+                for card in job_cards:
                     if keep_screen_awake: pyautogui.press('shiftright')
                     if current_count >= switch_number: break
                     print_lg("\n-@-\n")
 
-                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                    job_id,title,company,work_location,work_style,skip = get_job_main_details(card, applied_jobs, blacklisted_companies, rejected_jobs)
                     
                     if skip: continue
+                    pacing_stats.reset()
                     # Redundant fail safe check for applied jobs!
                     try:
                         if job_id in applied_jobs or find_by_class(driver, "jobs-s-apply__application-link", 2):
@@ -972,19 +926,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     
                     if use_AI and description != "Unknown":
                         ##> ------ Yang Li : MARKYangL - Feature ------
-                        try:
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
-                            else:
-                                skills = "In Development"
-                            print_lg(f"Extracted skills using {ai_provider} AI")
-                        except Exception as e:
-                            print_lg("Failed to extract skills:", e)
-                            skills = "Error extracting skills"
+                        # Runs in background while applying, joined in `submitted_jobs()`
+                        skills = skills_executor.submit(get_skills, description)
                         ##<
 
                     uploaded = False
@@ -1013,7 +956,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                         screenshot_name = screenshot(driver, job_id, "Failed at questions")
                                         errored = "stuck"
                                         raise Exception("Seems like stuck in a continuous loop of next, probably because of new questions.")
-                                    questions_list = answer_questions(modal, questions_list, work_location, job_description=description)
+                                    questions_list = answer_questions(modal, questions_list, work_location, job_description=description, job_id=job_id)
                                     if useNewResume and not uploaded: uploaded, resume = upload_resume(modal, default_resume_path)
                                     try: next_button = modal.find_element(By.XPATH, './/span[normalize-space(.)="Review"]') 
                                     except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
@@ -1060,13 +1003,14 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         skip, application_link, tabs_count = external_apply(pagination_element, job_id, job_link, resume, date_listed, application_link, screenshot_name)
                         if dailyEasyApplyLimitReached:
                             print_lg("\n###############  Daily application limit for Easy Apply is reached!  ###############\n")
-                            return
+                            return term_yield
                         if skip: continue
 
                     submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
                     if uploaded:   useNewResume = False
 
                     print_lg(f'Successfully saved "{title} | {company}" job. Job ID: {job_id} info')
+                    print_lg(pacing_stats.report())
                     current_count += 1
                     if application_link == "Easy Applied": easy_applied_count += 1
                     else:   external_jobs_count += 1
@@ -1074,6 +1018,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
 
 
+                flush_store()
+
                 # Switching to next page
                 if pagination_element == None:
                     print_lg("Couldn't find pagination element, probably at the end page of results!")
@@ -1096,6 +1042,12 @@ def apply_to_jobs(search_terms: list[str]) -> None:
             except Exception as page_source_error:
                 print_lg(f"Failed to get page source, browser might have crashed. {page_source_error}")
             # print_lg(e)
+        finally:
+            term_yield[searchTerm] = new_jobs
+            scheduler.record(searchTerm, new_jobs)
+            print_lg(f'"{searchTerm}" listed {new_jobs} new jobs.')
+
+    return term_yield
 
         
 def run(total_runs: int) -> int:
@@ -1105,13 +1057,15 @@ def run(total_runs: int) -> int:
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
     print_lg(f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'")
-    apply_to_jobs(search_terms)
+    due_terms = scheduler.due_terms()
+    if due_terms: apply_to_jobs(due_terms)
     print_lg("########################################################################################################################\n")
-    if not dailyEasyApplyLimitReached:
-        print_lg("Sleeping for 10 min...")
-        sleep(300)
-        print_lg("Few more min... Gonna start with in next 5 min...")
-        sleep(300)
+    if not dailyEasyApplyLimitReached and run_non_stop:
+        print_lg("Search terms schedule:\n" + scheduler.summary())
+        seconds_until_due = scheduler.seconds_until_due()
+        if seconds_until_due > 0:
+            print_lg(f"No search term is due yet, sleeping for {seconds_until_due / 60:.1f} min...")
+            sleep(seconds_until_due)
     buffer(3)
     return total_runs + 1
 
@@ -1120,12 +1074,43 @@ def run(total_runs: int) -> int:
 chatGPT_tab = False
 linkedIn_tab = False
 
+def preflight_check() -> bool:
+    '''
+    Function to validate config and AI client setup without launching the browser.
+    * Returns `True` if everything is ready to run
+    '''
+    started = perf_counter()
+    ok = True
+    try:
+        validate_config()
+        print_lg("Config is valid.")
+    except Exception as e:
+        print_lg("Config is invalid!", e)
+        ok = False
+    if not os.path.exists(default_resume_path):
+        print_lg(f'Default resume "{default_resume_path}" is missing! The bot will use your previous upload from LinkedIn.')
+    if use_AI:
+        provider = create_provider()
+        if provider:
+            print_lg(f"{provider.name} AI client is ready.")
+            wait_for_refresh(ai_request_timeout)    # The refresh uses the client, don't close it under the thread
+            provider.close()
+        else:
+            print_lg(f"Failed to create {ai_provider} AI client!")
+            ok = False
+    print_lg(f"Preflight check {'passed' if ok else 'FAILED'} in {(perf_counter() - started) * 1000:.0f} ms.")
+    return ok
+
+
 def main() -> None:
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume, aiProvider
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
+
+        global driver, wait, actions
+        driver, wait, actions = session.driver, session.wait, session.actions
         
         if not os.path.exists(default_resume_path):
             pyautogui.alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
@@ -1150,15 +1135,7 @@ def main() -> None:
         #     except Exception as e:
         #         print_lg("Opening OpenAI chatGPT tab failed!")
         if use_AI:
-            if ai_provider == "openai":
-                aiClient = ai_create_openai_client()
-            ##> ------ Yang Li : MARKYangL - Feature ------
-            # Create DeepSeek client
-            elif ai_provider == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider == "gemini":
-                aiClient = gemini_create_client()
-            ##<
+            aiProvider = create_provider()
 
             try:
                 about_company_for_ai = " ".join([word for word in (first_name+" "+last_name).split() if len(word) > 3])
@@ -1197,7 +1174,9 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        print_lg(pacing_stats.total_report())
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
+        if randomly_answered_questions: print_lg("Run `python -m modules.answer_memory unresolved` to see questions answered randomly across all runs.")
         quote = choice([
             "You're one step closer than before.", 
             "All the best with your future interviews.", 
@@ -1219,27 +1198,44 @@ def main() -> None:
             msg = "NOTE: IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM!\n\nOr it's highly likely that application will just open browser and not do anything next time!" 
             pyautogui.alert(msg,"Info")
             print_lg("\n"+msg)
+        skills_executor.shutdown(wait=True, cancel_futures=True)
         ##> ------ Yang Li : MARKYangL - Feature ------
-        if use_AI and aiClient:
+        if use_AI and aiProvider:
             try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "gemini":
-                    pass # Gemini client does not need to be closed
-                print_lg(f"Closed {ai_provider} AI client.")
+                wait_for_refresh(ai_request_timeout)
+                aiProvider.close()
+                print_lg(f"Closed {aiProvider.name} AI client.")
             except Exception as e:
                 print_lg("Failed to close AI client:", e)
+            print_lg(aiProvider.telemetry.report())
         ##<
+        print_lg(question_rules.report())
+        print_lg(answer_memory.report())
+        if use_AI:
+            close_http_client()
+            print_lg(latency_report())
+            print_lg(answer_cache.report())
+            print_lg(skills_cache.report())
+        try:
+            close_cache()
+            close_store()
+        except Exception as e:
+            critical_error_log("When saving applications history...", e)
         try:
-            if driver:
-                driver.quit()
+            session.close()
         except WebDriverException as e:
             print_lg("Browser already closed.", e)
         except Exception as e: 
             critical_error_log("When quitting...", e)
+        close_logs()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LinkedIn Auto Job Applier")
+    parser.add_argument("--check", action="store_true", help="Validate config and AI client setup without launching the browser")
+    args = parser.parse_args()
+    if args.check:
+        passed = preflight_check()
+        close_logs()
+        sys.exit(0 if passed else 1)
     main()